@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the GSK Enterprise Tools Suite
+
+Run from the repository root, e.g. ``python -m benchmarks.bench_wal_concurrency``.
+"""
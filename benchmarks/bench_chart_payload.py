@@ -0,0 +1,87 @@
+"""
+Chart payload: raw Plotly figures vs the gsk.charts data layer
+
+For each row count, builds a time-series line chart (one random-walk series)
+and an HR-style scatter (five colour groups, OLS trendline) twice:
+  * raw: px.line / px.scatter on every row, as the tools used to
+  * gsk.charts: LTTB-downsampled line, hexbinned scatter, WebGL above
+    WEBGL_POINTS, payload capped at MAX_PAYLOAD
+
+Reported per figure: the JSON size st.plotly_chart would send, and the
+server-side time to build the figure and serialize it (best of --repeat).
+Browser draw time is not measured here. It follows the point count, and
+Scattergl draws far more points per frame than SVG.
+
+Usage: python -m benchmarks.bench_chart_payload [--sizes 1000 10000 100000 1000000] [--repeat 3]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from gsk import charts
+
+
+def series(rows, rng):
+    return pd.DataFrame({
+        'time': pd.date_range('2020-01-01', periods=rows, freq='min'),
+        'value': np.cumsum(rng.normal(size=rows)),
+    })
+
+
+def employees(rows, rng):
+    departments = ['R&D', 'Manufacturing', 'Sales', 'Regulatory', 'Quality Control']
+    tenure = rng.uniform(0.5, 15, rows)
+    return pd.DataFrame({
+        'department': rng.choice(departments, rows),
+        'tenure_years': tenure,
+        'performance_score': np.clip(3.2 + 0.08 * tenure + rng.normal(0, 0.4, rows), 1, 5),
+    })
+
+
+def timed(build, repeat):
+    """(best seconds, JSON bytes) to build a figure and serialize it"""
+    best, size = float('inf'), 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = charts.payload_bytes(build())
+        best = min(best, time.perf_counter() - started)
+    return best, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"limits: {charts.LINE_POINTS:,} points per line, binning above {charts.SCATTER_POINTS:,} rows, "
+          f"WebGL above {charts.WEBGL_POINTS:,} points, {charts.MAX_PAYLOAD / 1024:.0f} KB per figure")
+    print(f"{'chart':<9}{'rows':>11}{'raw KB':>11}{'raw ms':>10}{'layer KB':>11}{'layer ms':>10}"
+          f"{'smaller':>10}  drawn")
+    for rows in args.sizes:
+        line_data, hr_data = series(rows, rng), employees(rows, rng)
+        cases = [
+            ('line',
+             lambda: px.line(line_data, x='time', y='value', render_mode='svg'),
+             lambda: charts.line(line_data, x='time', y='value')),
+            ('scatter',
+             lambda: px.scatter(hr_data, x='tenure_years', y='performance_score', color='department',
+                                trendline='ols', render_mode='svg'),
+             lambda: charts.scatter(hr_data, x='tenure_years', y='performance_score', color='department',
+                                    trendline='ols')),
+        ]
+        for name, raw, layered in cases:
+            raw_seconds, raw_bytes = timed(raw, args.repeat)
+            seconds, size = timed(layered, args.repeat)
+            drawn = charts.caption(layered()) or "every row"
+            print(f"{name:<9}{rows:>11,}{raw_bytes / 1024:>11,.0f}{raw_seconds * 1e3:>10,.0f}"
+                  f"{size / 1024:>11,.0f}{seconds * 1e3:>10,.0f}{raw_bytes / size:>9.1f}x  {drawn}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+CSV export: legacy to_dict/DataFrame/to_csv path vs streaming from the cursor
+
+Measures wall time and peak traced memory (tracemalloc also sees numpy/pandas
+buffers) for exporting a clinical_trials-shaped result of N rows, then checks
+that the deferred csv_download callables return data st.download_button
+accepts when clicked.
+
+Usage: python -m benchmarks.bench_csv_export [--rows 1000000]
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+from gsk.db import init_schema
+from gsk.export import csv_download, iter_csv_from_cursor, iter_csv_from_frame
+
+
+def build_database(path, rows):
+    conn = sqlite3.connect(path)
+    init_schema(conn)
+    rng = np.random.default_rng(0)
+    areas = np.array(['Respiratory', 'Immunology', 'Oncology', 'HIV', 'Infectious Disease'])
+    for start in range(0, rows, 100_000):
+        n = min(100_000, rows - start)
+        ids = np.arange(start, start + n)
+        conn.executemany(
+            'INSERT INTO clinical_trials VALUES (?,?,?,?,?,?,?,?)',
+            zip([f'CT{i:08d}' for i in ids], [f'Drug-{i % 97}' for i in ids],
+                ['Phase 3'] * n, ['Active'] * n, ['2023-01-15'] * n,
+                rng.integers(100, 3000, n).tolist(), rng.uniform(40, 95, n).round(1).tolist(),
+                areas[ids % len(areas)].tolist()))
+    conn.commit()
+    return conn
+
+
+def legacy(conn):
+    result_df = pd.read_sql_query("SELECT * FROM clinical_trials", conn)
+    df = pd.DataFrame(result_df.to_dict('records'))
+    csv = df.to_csv(index=False)
+    return len(csv.encode())
+
+
+def stream_cursor(conn, compress=False):
+    cursor = conn.execute("SELECT * FROM clinical_trials")
+    return sum(len(chunk) for chunk in iter_csv_from_cursor(cursor, compress=compress))
+
+
+def stream_frame(conn):
+    df = pd.read_sql_query("SELECT * FROM clinical_trials", conn)
+    return sum(len(chunk) for chunk in iter_csv_from_frame(df))
+
+
+def check_download(data):
+    """Run a deferred download callable the way Streamlit does on click; returns the byte count"""
+    result = data()
+    payload, _ = convert_data_to_bytes_and_infer_mime(
+        result, unsupported_error=TypeError(f"unsupported download type: {type(result)}"))
+    return len(payload)
+
+
+def measure(fn, *args, **kwargs):
+    """Time one untraced run, then trace a second run for peak memory"""
+    started = time.perf_counter()
+    size = fn(*args, **kwargs)
+    seconds = time.perf_counter() - started
+    tracemalloc.start()
+    fn(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 2 ** 20, size / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix='gsk_bench_csv_'), 'bench.db')
+    conn = build_database(path, args.rows)
+    print(f"{args.rows:,} rows")
+    print(f"{'path':<24}{'seconds':>9}{'peak MB':>10}{'output MB':>11}")
+    for name, fn, kwargs in [
+        ('legacy (to_dict)', legacy, {}),
+        ('stream from frame', stream_frame, {}),
+        ('stream from cursor', stream_cursor, {}),
+        ('stream cursor + gzip', stream_cursor, {'compress': True}),
+    ]:
+        seconds, peak, size = measure(fn, conn, **kwargs)
+        print(f"{name:<24}{seconds:>9.2f}{peak:>10.1f}{size:>11.1f}")
+
+    sample = pd.read_sql_query("SELECT * FROM clinical_trials LIMIT 1000", conn)
+    for compress in (False, True):
+        size = check_download(csv_download(df=sample, compress=compress))
+        print(f"download check (compress={compress}): {size:,} bytes ok")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Equipment risk: recomputing fleet features in pandas vs incremental gsk.maintenance scores
+
+Loads a synthetic fleet (gsk.synthetic) with a year of daily telemetry into a
+temporary database, then times:
+  * pandas: read every reading and recompute the utilization and error EWMAs
+    per instrument with groupby().ewm(), which a dashboard without stored
+    features would do on every rerun
+  * rebuild: fold the whole history into equipment_risk from scratch
+  * one new day: append a reading per instrument and refresh, as telemetry
+    arrives
+  * dashboard: fleet_risk() when nothing new has arrived, a plain read of
+    the stored scores
+
+It also checks the stored EWMAs against the pandas recomputation.
+
+Usage: python -m benchmarks.bench_equipment_risk [--instruments 5000] [--days 365]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from gsk import db, ingest, maintenance, synthetic
+
+
+def timed(run):
+    """(seconds, result) of one call"""
+    started = time.perf_counter()
+    result = run()
+    return time.perf_counter() - started, result
+
+
+def pandas_features():
+    readings = db.read_sql("SELECT equipment_id, utilization, error_count FROM equipment_telemetry "
+                           "ORDER BY equipment_id, reading_id")
+    groups = readings.groupby('equipment_id', sort=False)
+    features = {}
+    for column, (source, span) in maintenance.EWMA_FEATURES.items():
+        ewm = groups[source].ewm(span=span, adjust=False).mean()
+        features[column] = ewm.groupby(level=0).last()
+    return len(readings), pd.DataFrame(features)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--instruments', type=int, default=5_000)
+    parser.add_argument('--days', type=int, default=365)
+    args = parser.parse_args()
+
+    db.DB_PATH = os.path.join(tempfile.mkdtemp(prefix='gsk_bench_equipment_'), 'bench.db')
+    rows = args.instruments * args.days
+    ingest.load_frames('equipment', synthetic.frames('equipment', args.instruments, seed=0))
+    ingest.load_frames('equipment_telemetry',
+                       synthetic.frames('equipment_telemetry', rows, seed=1, instruments=args.instruments),
+                       defer_indexes=False)
+    print(f"{args.instruments:,} instruments, {rows:,} readings")
+
+    pandas_seconds, (read, reference) = timed(pandas_features)
+    rebuild_seconds, _ = timed(maintenance.rebuild_equipment_risk)
+
+    # The next day's readings, one per instrument
+    day = next(synthetic.frames('equipment_telemetry', rows + args.instruments, seed=1,
+                                instruments=args.instruments, chunk_rows=rows + args.instruments))
+    day = day.iloc[rows:]
+    with db.get_pool().connection() as conn:
+        conn.execute("BEGIN")
+        ingest.insert_frame(conn, 'equipment_telemetry', day)
+        conn.commit()
+    refresh_seconds, report = timed(maintenance.refresh_equipment_risk)
+    read_seconds, fleet = timed(maintenance.fleet_risk)
+
+    for label, seconds, note in [
+        ("pandas groupby().ewm()", pandas_seconds, f"{read:,} readings read"),
+        ("rebuild_equipment_risk", rebuild_seconds, "whole history folded"),
+        ("refresh, one new day", refresh_seconds, f"{report['rows']:,} readings folded"),
+        ("fleet_risk, nothing new", read_seconds, f"{len(fleet):,} stored scores read"),
+    ]:
+        print(f"{label:<26}{seconds * 1e3:>10.1f} ms  {note}")
+
+    # The reference stops before the appended day, so compare against a fresh rebuild of that history
+    with db.get_pool().connection() as conn:
+        conn.execute("DELETE FROM equipment_telemetry WHERE reading_id > ?", (rows,))
+        conn.commit()
+    maintenance.rebuild_equipment_risk()
+    stored = db.read_sql("SELECT * FROM equipment_risk").set_index('equipment_id')
+    error = np.abs(stored.loc[reference.index, reference.columns] - reference).to_numpy().max()
+    print(f"max |EWMA difference| vs pandas: {error:.2e}")
+    db.close_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Financial rollups: pandas over the whole ledger vs gsk.finance window queries
+
+Loads synthetic ledger lines (gsk.synthetic) into a temporary database and
+builds the finance page's monthly and per-category report twice:
+  * pandas: read every ledger line, then groupby month and category and
+    cumsum per year, which is how the page computed its rollups
+  * gsk.finance: GROUP BY and window functions over the covering index, with
+    the query cache bypassed (a cold rerun) and served from it (a warm rerun)
+
+Reported per run: time and the number of rows that reach Python. It also
+checks that the two reports agree.
+
+Usage: python -m benchmarks.bench_financial_rollup [--rows 2000000] [--repeat 3]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from gsk import cache, db, finance, ingest, synthetic
+
+
+def best(run, repeat):
+    """(fastest seconds, result) of ``repeat`` calls"""
+    seconds, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        seconds = min(seconds, time.perf_counter() - started)
+    return seconds, result
+
+
+def pandas_report():
+    ledger = db.read_sql("SELECT month, category, revenue, expenses, budget FROM financial_ledger")
+    monthly = ledger.groupby('month')[['revenue', 'expenses', 'budget']].sum()
+    monthly['budget_variance'] = monthly['expenses'] - monthly['budget']
+    monthly['ytd_revenue'] = monthly.groupby(monthly.index.str[:4])['revenue'].cumsum()
+    by_category = ledger.groupby('category')[['revenue', 'expenses', 'budget']].sum()
+    return len(ledger), monthly, by_category
+
+
+def sql_report(bypass):
+    if bypass:
+        cache.get_query_cache().invalidate()
+    report = finance.financial_report()
+    return len(report['monthly']) + len(report['by_category']), report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    db.DB_PATH = os.path.join(tempfile.mkdtemp(prefix='gsk_bench_finance_'), 'bench.db')
+    ingest.load_frames('financial_ledger', synthetic.frames('financial_ledger', args.rows, seed=0))
+    print(f"{args.rows:,} ledger lines")
+
+    pandas_seconds, (pandas_rows, monthly, by_category) = best(pandas_report, args.repeat)
+    cold_seconds, (sql_rows, report) = best(lambda: sql_report(True), args.repeat)
+    warm_seconds, _ = best(lambda: sql_report(False), args.repeat)
+    for label, seconds, rows in [("pandas, full ledger", pandas_seconds, pandas_rows),
+                                 ("gsk.finance, cold", cold_seconds, sql_rows),
+                                 ("gsk.finance, cached", warm_seconds, sql_rows)]:
+        print(f"{label:<24}{seconds * 1e3:>10.1f} ms{rows:>12,} rows to Python")
+
+    sql_monthly = report['monthly'].set_index('month')
+    sql_category = report['by_category'].set_index('category')
+    for name, ours, theirs in [('monthly', sql_monthly, monthly), ('by category', sql_category, by_category)]:
+        columns = [c for c in theirs.columns if c in ours.columns]
+        error = np.abs(ours.loc[theirs.index, columns].to_numpy() - theirs[columns].to_numpy()).max()
+        print(f"max |{name} difference| vs pandas: {error:.2e}")
+    db.close_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Cold-start import profile of the Streamlit app (``-X importtime``)
+
+Each sample is a fresh interpreter running ``python -X importtime`` that
+imports gsk_tools. That executes the script's module level (imports, page
+config, session defaults) but not main(), which is what every new worker or
+cold rerun pays before the first tool renders. The report lists the
+top-level packages by import time and the total. Then each deferred library
+is imported on top of the app, to show what the first chart, PDF export or
+trendline costs.
+
+The benchmark is checked: it exits with status 1 when a deferred library is
+imported at startup, or when the fastest sample exceeds --budget-ms.
+
+Usage: python -m benchmarks.bench_import_time [--budget-ms 1000] [--repeat 3] [--top 12]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Library -> (module that pulls it in, first use). Never imported at startup.
+DEFERRED = {
+    'plotly.express': ('plotly.express', "first chart"),
+    'reportlab': ('gsk.reports', "first PDF export"),
+}
+
+
+def importtime(code):
+    """[(self_us, cumulative_us, module)] for ``code`` run in a fresh interpreter"""
+    env = dict(os.environ, PYTHONPATH=ROOT, GSK_DB_PATH=os.path.join(tempfile.mkdtemp(), 'bench.db'))
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if proc.returncode:
+        sys.exit(proc.stderr)
+    records = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        records.append((int(own), int(cumulative), name.strip()))
+    return records
+
+
+def by_package(records):
+    packages = defaultdict(int)
+    for own, _, name in records:
+        packages[name.split('.')[0]] += own
+    return sorted(packages.items(), key=lambda item: -item[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=12)
+    args = parser.parse_args()
+
+    importtime('import gsk_tools')  # warm the bytecode cache
+    samples = [importtime('import gsk_tools') for _ in range(args.repeat)]
+    records = min(samples, key=lambda r: sum(own for own, _, _ in r))
+    total_ms = sum(own for own, _, _ in records) / 1000
+
+    print(f"startup: import gsk_tools, {len(records)} modules, {total_ms:.0f} ms "
+          f"(fastest of {args.repeat}, budget {args.budget_ms:.0f} ms)")
+    print(f"{'package':<28}{'ms':>8}")
+    for package, own in by_package(records)[:args.top]:
+        print(f"{package:<28}{own / 1000:>8.1f}")
+
+    print(f"\n{'deferred library':<28}{'ms':>8}  loaded by")
+    loaded = {name for _, _, name in records}
+    for lib, (module, used_by) in DEFERRED.items():
+        extra = [r for r in importtime(f'import gsk_tools; import {module}') if r[2] not in loaded]
+        print(f"{lib:<28}{sum(own for own, _, _ in extra) / 1000:>8.1f}  {used_by}")
+
+    failures = [f"{lib} is imported at startup" for lib in DEFERRED
+                if any(name == lib or name.startswith(lib + '.') for name in loaded)]
+    if total_ms > args.budget_ms:
+        failures.append(f"startup imports take {total_ms:.0f} ms, over the {args.budget_ms:.0f} ms budget")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Parallel per-trial Monte Carlo: scaling across worker processes
+
+Also checks that every worker count reproduces the same histogram for a seed.
+
+Usage: python -m benchmarks.bench_parallel_simulator [--simulations 20000000] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from gsk.simulation import simulate_trials_parallel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--simulations', type=int, default=20_000_000)
+    parser.add_argument('--chunk-size', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument('--seed', type=int, default=20240101)
+    args = parser.parse_args()
+
+    print(f"{args.simulations:,} simulated trials, chunks of {args.chunk_size:,}, "
+          f"{os.cpu_count()} CPUs available")
+    print(f"{'workers':>8}{'seconds':>10}{'trials/s':>14}{'speedup':>9}  identical")
+    reference = None
+    baseline = None
+    for workers in args.workers:
+        started = time.perf_counter()
+        sim = simulate_trials_parallel(1000, 75, 15, args.simulations, seed=args.seed,
+                                       workers=workers, chunk_size=args.chunk_size)
+        seconds = time.perf_counter() - started
+        if reference is None:
+            reference, baseline = sim.counts, seconds
+        same = np.array_equal(reference, sim.counts)
+        print(f"{workers:>8}{seconds:>10.2f}{args.simulations / seconds:>14,.0f}"
+              f"{baseline / seconds:>9.2f}  {same}")
+
+
+if __name__ == '__main__':
+    main()
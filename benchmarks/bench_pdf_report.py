@@ -0,0 +1,64 @@
+"""
+Paginated PDF report engine: render time and peak memory
+
+Usage: python -m benchmarks.bench_pdf_report [--rows 100000]
+
+Also checks that the deferred pdf_download callable returns data
+st.download_button accepts when clicked.
+
+reportlab runs noticeably faster with its optional C accelerators installed
+(pip install rl_accel).
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+from gsk.export import pdf_download
+from gsk.reports import build_table_report
+
+COLUMNS = ['sale_id', 'product_name', 'region', 'revenue', 'units_sold', 'sale_date']
+
+
+def rows(n):
+    rng = np.random.default_rng(0)
+    products = ['Respiratory-X', 'Immuno-Plus', 'Onco-Target', 'HIV-Block', 'Vaccine-Pro']
+    regions = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Middle East']
+    for i in range(n):
+        yield (i + 1, products[i % 5], regions[(i // 5) % 5], float(rng.uniform(5e4, 5e5)),
+               int(rng.integers(100, 1000)), '2024-06-01')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    for traced in (False, True):
+        if traced:
+            tracemalloc.start()
+        started = time.perf_counter()
+        out = build_table_report("Sales Report", COLUMNS, rows(args.rows))
+        seconds = time.perf_counter() - started
+        size = len(out.read())
+        if traced:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"peak traced memory: {peak / 2 ** 20:.1f} MB")
+        else:
+            print(f"{args.rows:,} rows -> {size / 2 ** 20:.1f} MB PDF in {seconds:.2f}s "
+                  f"({args.rows / seconds:,.0f} rows/s)")
+
+    # Run the deferred download callable the way Streamlit does on click
+    data = pdf_download("Sales Report", df=pd.DataFrame(list(rows(1000)), columns=COLUMNS))()
+    payload, _ = convert_data_to_bytes_and_infer_mime(
+        data, unsupported_error=TypeError(f"unsupported download type: {type(data)}"))
+    print(f"download check: {len(payload):,} bytes ok")
+
+
+if __name__ == '__main__':
+    main()
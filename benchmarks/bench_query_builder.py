@@ -0,0 +1,104 @@
+"""
+Prepared-statement reuse: f-string SQL vs gsk.query parameterized statements
+
+Replays a Query Builder style workload on one read-only WAL connection, the
+way a pooled reader serves reruns. The workload mixes trial lookups by id,
+success-rate thresholds and area/status filters with a row limit. Each
+filter value is drawn at random, as a slider or selectbox would produce it.
+
+Three variants are timed:
+  * f-string SQL: every distinct value is a new statement text, so sqlite3's
+    statement cache (128 entries per connection) mostly misses and each query
+    is prepared again
+  * builder, no stmt cache: the same parameterized text, but prepared
+    on every call (cached_statements=0), which isolates the cost of preparing
+  * builder: parameterized text, prepared once per shape and reused
+
+Usage: python -m benchmarks.bench_query_builder [--rows 20000] [--queries 20000]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from gsk import db, ingest, query, synthetic
+
+SHAPES = ('lookup by id', 'threshold, 50 rows', 'area + status, 50 rows')
+
+
+def workload(trial_ids, areas, count, seed=0):
+    """[(shape, literal SQL, (statement, params))] for ``count`` Query Builder requests"""
+    rng = random.Random(seed)
+    statuses = ['Recruiting', 'Active', 'Completed', 'Terminated']
+    trials = query.select('clinical_trials')
+    requests = []
+    for _ in range(count):
+        shape = rng.randrange(3)
+        if shape == 0:
+            trial_id = rng.choice(trial_ids)
+            literal = f"SELECT * FROM clinical_trials WHERE trial_id = '{trial_id}'"
+            built = trials.where('trial_id', '=', trial_id)
+        elif shape == 1:
+            threshold = round(rng.uniform(50, 99), 1)
+            literal = (f"SELECT * FROM clinical_trials WHERE success_rate >= {threshold} "
+                       f"ORDER BY trial_id LIMIT 50")
+            built = trials.where('success_rate', '>=', threshold).order_by('trial_id').limit(50)
+        else:
+            area, status = rng.choice(areas), rng.choice(statuses)
+            literal = (f"SELECT * FROM clinical_trials WHERE therapeutic_area = '{area}' "
+                       f"AND status = '{status}' LIMIT 50")
+            built = trials.where('therapeutic_area', '=', area).where('status', '=', status).limit(50)
+        requests.append((SHAPES[shape], literal, built.sql()))
+    return requests
+
+
+def connect(cached_statements=128):
+    conn = sqlite3.connect(db.readonly_uri(db.DB_PATH), uri=True, cached_statements=cached_statements)
+    db.apply_wal_pragmas(conn)
+    return conn
+
+
+def timed(run, requests):
+    started = time.perf_counter()
+    rows = sum(len(run(request)) for request in requests)
+    return (time.perf_counter() - started) / len(requests) * 1e6, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20_000)
+    parser.add_argument('--queries', type=int, default=20_000)
+    args = parser.parse_args()
+
+    db.DB_PATH = os.path.join(tempfile.mkdtemp(prefix='gsk_bench_query_'), 'bench.db')
+    ingest.load_frames('clinical_trials', synthetic.frames('clinical_trials', args.rows, seed=0))
+    trials = db.read_sql("SELECT trial_id, therapeutic_area FROM clinical_trials")
+    requests = workload(list(trials['trial_id']), sorted(trials['therapeutic_area'].unique()),
+                        args.queries)
+    texts = len({literal for _, literal, _ in requests})
+    print(f"{args.rows:,} trials, {args.queries:,} queries: {texts:,} distinct f-string texts, "
+          f"{len(SHAPES)} parameterized statements")
+
+    variants = [
+        ("f-string SQL", 128, lambda conn, r: conn.execute(r[1]).fetchall()),
+        ("builder, no stmt cache", 0, lambda conn, r: conn.execute(*r[2]).fetchall()),
+        ("builder", 128, lambda conn, r: conn.execute(*r[2]).fetchall()),
+    ]
+    print(f"{'us/query':<26}" + ''.join(f"{label:>24}" for label, _, _ in variants) + f"{'reuse gain':>12}")
+    for shape in SHAPES + ('all',):
+        subset = [r for r in requests if shape in ('all', r[0])]
+        micros = []
+        for _, cached_statements, run in variants:
+            conn = connect(cached_statements)
+            timed(lambda r: run(conn, r), subset[:200])  # warm the page cache
+            micros.append(timed(lambda r: run(conn, r), subset)[0])
+            conn.close()
+        print(f"{shape:<26}" + ''.join(f"{us:>24.1f}" for us in micros) + f"{micros[0] / micros[2]:>11.2f}x")
+    db.close_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Research repository search latency on the FTS5 index
+
+Loads synthetic research studies through gsk.ingest, then times a mix of
+search-box queries with gsk.research.search_studies: rare and common terms,
+multi-word queries, prefixes as typed, and type filters. Each query is also
+run as a plain FTS5 ``ORDER BY rank`` over every match for comparison.
+
+Usage: python -m benchmarks.bench_research_search [--sizes 100000,1000000] [--repeat 5]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import tempfile
+import time
+
+from gsk import db, ingest, research, synthetic
+
+TARGET_MS = 50
+
+
+def queries(code):
+    """(label, text, study_type) search mix; ``code`` is a compound code present in the corpus"""
+    return [
+        ('rare code', code, None),
+        ('code prefix, 5 chars', code[:5], None),
+        ('code prefix, 6 chars', code[:6], None),
+        ('mid-frequency term', 'asthma', None),
+        ('two terms', 'kinase inhibitor', None),
+        ('two terms + type', 'kinase inhibitor', 'Pre-clinical'),
+        ('common term', 'study', None),
+        ('common + mid term', 'efficacy asthma', None),
+        ('common + type', 'patients', 'Clinical'),
+        ('typing: 2 chars', 'co', None),
+        ('typing: 3 chars', 'cop', None),
+        ('typing: second word', 'asthma eo', None),
+        ('product and area', 'onco target oncology', 'Clinical'),
+        ('empty search + type', '', 'Publications'),
+    ]
+
+
+def naive_search(text, study_type, limit=20):
+    """Plain BM25 over every match, with the same MATCH expression"""
+    terms = research.query_terms(text)
+    if not terms:
+        return []
+    with db.get_reader_pool().connection() as conn:
+        return conn.execute('''
+            SELECT rowid, snippet(research_studies_fts, 1, '**', '**', '…', 24)
+            FROM research_studies_fts WHERE research_studies_fts MATCH ?
+            ORDER BY rank LIMIT ?
+        ''', (research.match_expression((research.phrase(*term) for term in terms), study_type), limit)).fetchall()
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def run_size(rows, repeat):
+    db.close_pool()
+    db.DB_PATH = os.path.join(tempfile.mkdtemp(prefix='gsk_bench_search_'), 'bench.db')
+    report = ingest.load_frames('research_studies', synthetic.frames('research_studies', rows, seed=0))
+    terms = db.read_sql("SELECT COUNT(*) AS n FROM research_terms")['n'][0]
+    abstract = db.read_sql("SELECT abstract FROM research_studies WHERE abstract LIKE '%gsk%' LIMIT 1")
+    code = re.search(r'gsk\d+', abstract['abstract'][0]).group()
+    print(f"\n{rows:,} studies (load {report['seconds']:.1f}s, {report['rows_per_sec']:,.0f} rows/s); "
+          f"{terms:,} indexed terms")
+    print(f"{'query':<24}{'matches':>9}{'ranked by':>10}{'ms':>8}{'plain ms':>10}")
+
+    latencies = []
+    for label, text, study_type in queries(code):
+        found = research.search_studies(text, study_type)
+        ms = timed(lambda: research.search_studies(text, study_type), repeat)
+        plain = timed(lambda: naive_search(text, study_type), max(1, min(repeat, 3)))
+        latencies.append(ms)
+        matches = f"{found['matches'] - 1:,}+" if found['capped'] else f"{found['matches']:,}"
+        flag = '  SLOW' if ms > TARGET_MS else ''
+        print(f"{label:<24}{matches:>9}{found['ranked_by']:>10}{ms:>8.1f}{plain:>10.1f}{flag}")
+    latencies.sort()
+    print(f"median {statistics.median(latencies):.1f} ms, max {latencies[-1]:.1f} ms "
+          f"(target {TARGET_MS} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='100000,1000000', help="Comma-separated corpus sizes")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    for rows in (int(size) for size in args.sizes.split(',')):
+        run_size(rows, args.repeat)
+    db.close_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Sales dashboard filter latency: raw sales_data pushdown vs the sales cube
+
+For each fact-table size, loads synthetic sales through gsk.ingest (which also
+folds them into sales_cube), then times the dashboard queries for a few filter
+combinations both ways, plus an incremental cube refresh after a small batch of
+new sales. Ends with the cube consistency check.
+
+Usage: python -m benchmarks.bench_sales_cube [--sizes 100000,1000000] [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from gsk import db, ingest, sales, synthetic
+
+PRODUCTS = list(synthetic.catalog(synthetic.PRODUCTS, 'Product', 50))
+REGIONS = list(synthetic.catalog(synthetic.REGIONS, 'Region', 10))
+
+FILTERS = [
+    ('all, 3 years', None, None, '2022-01-01', '2024-12-31'),
+    ('all, mid-month span', None, None, '2022-03-17', '2024-08-09'),
+    ('5 products x 3 regions', PRODUCTS[:5], REGIONS[:3], '2022-01-01', '2024-12-31'),
+    ('1 product, 6 weeks', PRODUCTS[:1], None, '2023-05-10', '2023-06-20'),
+]
+
+
+def sales_frames(rows, seed=0):
+    return synthetic.sales_frames(rows, seed=seed, products=len(PRODUCTS), regions=len(REGIONS))
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def run_size(rows, repeat):
+    db.close_pool()
+    db.DB_PATH = os.path.join(tempfile.mkdtemp(prefix='gsk_bench_cube_'), 'bench.db')
+    report = ingest.load_frames('sales_data', sales_frames(rows))
+    cells = db.read_sql("SELECT COUNT(*) AS n FROM sales_cube")['n'][0]
+    print(f"\n{rows:,} sales -> {cells:,} cube cells "
+          f"(load {report['seconds']:.1f}s, initial cube build {report['rollup_seconds']:.2f}s)")
+    print(f"{'filter':<26}{'raw ms':>10}{'cube ms':>10}{'speedup':>10}")
+    for name, products, regions, start, end in FILTERS:
+        raw = timed(lambda: sales.summarize(sales.daily_sales(products, regions, start, end)
+                                            .assign(month=lambda d: d['sale_date'].str[:7])), repeat)
+        cube = timed(lambda: sales.summarize(sales.sales_rollup(products, regions, start, end)), repeat)
+        print(f"{name:<26}{raw:>10.1f}{cube:>10.1f}{raw / cube:>9.0f}x")
+
+    # New sales written directly (not through ingest), then folded incrementally
+    with db.get_pool().connection() as conn:
+        for frame in sales_frames(10_000, seed=1):
+            ingest.insert_frame(conn, 'sales_data', frame)
+        conn.commit()
+    refresh = sales.refresh_sales_cube()
+    print(f"incremental refresh of {refresh['rows']:,} new sales: {refresh['seconds'] * 1000:.1f} ms")
+    mismatches = sales.check_sales_cube()
+    print(f"consistency check: {'ok' if mismatches.empty else f'{len(mismatches)} bad cells'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='100000,1000000',
+                        help="Comma-separated fact-table sizes")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    for rows in (int(size) for size in args.sizes.split(',')):
+        run_size(rows, args.repeat)
+    db.close_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Grouped OLS trendlines: statsmodels per group vs gsk.trends sufficient statistics
+
+Fits performance_score ~ tenure_years per department, as the HR tenure chart
+does, on synthetic employees (gsk.synthetic):
+  * statsmodels: one OLS fit per department, which is what px.scatter's
+    trendline='ols' does on every rerun (skipped if statsmodels is not
+    installed)
+  * ols_by_group: every department in one bincount pass, with the department
+    labels as strings (a fresh read) and as pre-factorized categories
+  * table_trendlines: a rerun served from the per-version cache
+
+It also checks that the closed-form slopes and R² match statsmodels.
+
+Usage: python -m benchmarks.bench_trendlines [--rows 1000000] [--departments 100]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from gsk import db, ingest, synthetic, trends
+
+X, Y, BY = 'tenure_years', 'performance_score', 'department'
+
+
+def best(run, repeat=5):
+    """(fastest seconds, result) of ``repeat`` calls"""
+    seconds, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        seconds = min(seconds, time.perf_counter() - started)
+    return seconds, result
+
+
+def statsmodels_fits(df):
+    import statsmodels.api as sm
+    rows = {}
+    for group, frame in df.groupby(BY):
+        model = sm.OLS(frame[Y], sm.add_constant(frame[X])).fit()
+        rows[group] = {'slope': model.params[X], 'intercept': model.params['const'], 'r2': model.rsquared}
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--departments', type=int, default=100)
+    args = parser.parse_args()
+
+    db.DB_PATH = os.path.join(tempfile.mkdtemp(prefix='gsk_bench_trends_'), 'bench.db')
+    ingest.load_frames('employees', synthetic.frames('employees', args.rows, seed=0,
+                                                     departments=args.departments))
+    df = db.read_sql(f"SELECT {BY}, {X}, {Y} FROM employees")
+    categorical = df.astype({BY: 'category'})
+    print(f"{len(df):,} employees in {df[BY].nunique()} departments")
+
+    results = [
+        ("ols_by_group, string labels", best(lambda: trends.ols_by_group(df, X, Y, BY))),
+        ("ols_by_group, categorical", best(lambda: trends.ols_by_group(categorical, X, Y, BY))),
+    ]
+    trends.table_trendlines('employees', X, Y, BY)  # first call fits and caches
+    results.append(("table_trendlines, cached", best(lambda: trends.table_trendlines('employees', X, Y, BY))))
+    try:
+        reference = best(lambda: statsmodels_fits(df), repeat=1)
+        results.insert(0, ("statsmodels, per group", reference))
+    except ImportError:
+        reference = None
+        print("statsmodels not installed; skipping the baseline")
+
+    for label, (seconds, _) in results:
+        print(f"{label:<32}{seconds * 1e3:>10.2f} ms")
+    if reference is not None:
+        fits = results[1][1][1].loc[reference[1].index]
+        for column in ('slope', 'intercept', 'r2'):
+            error = np.abs(fits[column] - reference[1][column]).max()
+            print(f"max |{column} difference| vs statsmodels: {error:.2e}")
+    db.close_pool()
+
+
+if __name__ == '__main__':
+    main()
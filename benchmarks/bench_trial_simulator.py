@@ -0,0 +1,58 @@
+"""
+Clinical Trial Simulator: legacy per-simulation loop vs the vectorized engine
+
+Usage: python -m benchmarks.bench_trial_simulator [--max-power 7]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from gsk.simulation import simulate_trials
+
+NUM_PATIENTS, SUCCESS_RATE, DROPOUT_RATE, CONFIDENCE = 1000, 75, 15, 95
+
+
+def legacy(num_simulations):
+    """The original page logic: one binomial and one dict per simulation"""
+    simulations = []
+    for _ in range(num_simulations):
+        enrolled = NUM_PATIENTS
+        completed = int(enrolled * (1 - DROPOUT_RATE / 100))
+        successes = np.random.binomial(completed, SUCCESS_RATE / 100)
+        success_pct = (successes / completed) * 100 if completed > 0 else 0
+        simulations.append({'enrolled': enrolled, 'completed': completed,
+                            'successes': successes, 'success_rate': success_pct})
+    sim_df = pd.DataFrame(simulations)
+    np.percentile(sim_df['success_rate'], (100 - CONFIDENCE) / 2)
+    np.percentile(sim_df['success_rate'], 100 - (100 - CONFIDENCE) / 2)
+    (sim_df['success_rate'] < 70).sum()
+    (sim_df['success_rate'] > 80).sum()
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--max-power', type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'simulations':>12}{'legacy s':>12}{'histogram s':>14}{'samples s':>12}")
+    for power in range(3, args.max_power + 1):
+        n = 10 ** power
+        legacy_s = f"{timed(legacy, n):12.4f}" if n <= 10 ** 5 else f"{'-':>12}"
+        hist_s = timed(lambda: simulate_trials(NUM_PATIENTS, SUCCESS_RATE, DROPOUT_RATE, n,
+                                               seed=42).summary(CONFIDENCE))
+        samp_s = timed(lambda: simulate_trials(NUM_PATIENTS, SUCCESS_RATE, DROPOUT_RATE, n,
+                                               seed=42, keep_samples=True).summary(CONFIDENCE))
+        print(f"{n:>12,}{legacy_s}{hist_s:14.4f}{samp_s:12.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Read throughput while the analytics writer is busy: rollback journal vs WAL
+
+Usage: python -m benchmarks.bench_wal_concurrency [--seconds 5] [--readers 4] [--rows 5000]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from gsk.db import create_pools, init_schema
+
+
+def seed(conn, rows):
+    rng = np.random.default_rng(0)
+    areas = ['Respiratory', 'Immunology', 'Oncology', 'HIV', 'Infectious Disease']
+    data = [
+        (f'CT{i:07d}', f'Drug-{i % 50}', f'Phase {1 + i % 3}', 'Active', '2023-01-01',
+         int(rng.integers(100, 3000)), float(rng.uniform(40, 95)), areas[i % len(areas)])
+        for i in range(rows)
+    ]
+    conn.executemany('INSERT INTO clinical_trials VALUES (?,?,?,?,?,?,?,?)', data)
+    conn.commit()
+
+
+def run_mode(mode, seconds, readers, rows):
+    workdir = tempfile.mkdtemp(prefix=f'gsk_bench_{mode}_')
+    database = os.path.join(workdir, 'bench.db')
+    writer_pool, reader_pool = create_pools(database, mode, max_readers=readers + 1)
+    with writer_pool.connection() as conn:
+        init_schema(conn)
+        seed(conn, rows)
+
+    stop = threading.Event()
+    latencies = []
+    writes = [0]
+    lock = threading.Lock()
+
+    def reader():
+        local = []
+        while not stop.is_set():
+            started = time.perf_counter()
+            with reader_pool.connection() as conn:
+                pd.read_sql_query("SELECT * FROM clinical_trials", conn)
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+
+    def writer():
+        while not stop.is_set():
+            with writer_pool.connection() as conn:
+                conn.execute("INSERT INTO analytics (tool_name, session_id) VALUES (?, ?)",
+                             ('Clinical Data Analytics', 'bench'))
+                conn.commit()
+            writes[0] += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    lat = np.array(latencies) * 1000
+    return {
+        'mode': mode,
+        'reads_per_sec': len(lat) / seconds,
+        'read_p50_ms': float(np.percentile(lat, 50)) if len(lat) else float('nan'),
+        'read_p95_ms': float(np.percentile(lat, 95)) if len(lat) else float('nan'),
+        'writes_per_sec': writes[0] / seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--rows', type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{args.readers} reader threads, 1 writer thread, {args.rows} trials, {args.seconds:.0f}s per mode")
+    print(f"{'mode':<10}{'reads/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'writes/s':>10}")
+    for mode in ('rollback', 'wal'):
+        r = run_mode(mode, args.seconds, args.readers, args.rows)
+        print(f"{r['mode']:<10}{r['reads_per_sec']:>10.1f}{r['read_p50_ms']:>10.2f}"
+              f"{r['read_p95_ms']:>10.2f}{r['writes_per_sec']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
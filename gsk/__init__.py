@@ -0,0 +1,4 @@
+"""
+GSK Enterprise Tools Suite - shared backend package
+Database access, caching and analytics engines used by the Streamlit tools in gsk.tools
+"""
@@ -0,0 +1,303 @@
+"""
+Process-wide DataFrame caches shared by all Streamlit sessions
+
+TableCache keeps one DataFrame per table and reloads it only when the table has
+actually changed. A dedicated read-only probe connection checks
+``PRAGMA data_version``, which changes whenever another connection commits.
+If it has not moved, the cached frame is returned without further SQL. If it
+has moved, the per-table change counters in ``table_versions`` show whether
+this table was affected or whether the commit touched something else, such
+as an analytics flush.
+
+QueryCache keeps the results of arbitrary SELECTs (the SQL Query Builder)
+under a memory budget, with LRU eviction and a TTL. Entries are keyed by
+normalized SQL and bound parameters, and stamped with the data version they
+were read at. An authorizer records which tables each query read. A result
+built only from versioned tables stays valid across commits to other tables.
+Anything else is dropped as soon as ``data_version`` moves.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from gsk import db
+
+QUERY_CACHE_BYTES = int(float(os.environ.get('GSK_QUERY_CACHE_MB', 256)) * 2 ** 20)
+QUERY_CACHE_TTL = float(os.environ.get('GSK_QUERY_CACHE_TTL', 600))
+
+# Quoted literals/identifiers are kept verbatim; whitespace elsewhere is collapsed
+_SQL_TOKENS = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\])|(\s+)""")
+
+
+class TableCache:
+    """One shared, versioned DataFrame per table"""
+
+    def __init__(self, database=None):
+        self.database = database or db.DB_PATH
+        self._lock = threading.Lock()
+        self._probe = None
+        self._data_version = None
+        self._table_versions = {}
+        self._entries = {}  # table -> (version, DataFrame)
+        self._stats = {'hits': 0, 'misses': 0, 'version_checks': 0}
+
+    def _probe_conn(self):
+        if self._probe is None:
+            self._probe = sqlite3.connect(db.readonly_uri(self.database), uri=True,
+                                          check_same_thread=False)
+        return self._probe
+
+    def _current_version(self, table):
+        """Change counter for ``table``; only re-read when data_version moved (lock held)"""
+        probe = self._probe_conn()
+        data_version = probe.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version or table not in self._table_versions:
+            self._stats['version_checks'] += 1
+            self._table_versions = dict(
+                probe.execute("SELECT table_name, version FROM table_versions").fetchall())
+            self._data_version = data_version
+        return self._table_versions.get(table, 0)
+
+    def version(self, table):
+        """The change counter of ``table``, for keying results derived from it"""
+        with self._lock:
+            return self._current_version(table)
+
+    def get(self, table):
+        """Return the cached DataFrame for ``table``, loading it if stale
+
+        The returned frame is a shallow copy: callers may add or replace columns,
+        but must not modify values in place.
+        """
+        if table not in db.VERSIONED_TABLES:
+            raise ValueError(f"Table {table!r} is not cacheable")
+        with self._lock:
+            version = self._current_version(table)
+            entry = self._entries.get(table)
+            if entry is not None and entry[0] == version:
+                self._stats['hits'] += 1
+                return entry[1].copy(deep=False)
+            self._stats['misses'] += 1
+
+        # Load outside the lock so a slow table does not stall the others
+        df = db.read_sql(f"SELECT * FROM {table}")
+        with self._lock:
+            current = self._entries.get(table)
+            if current is None or current[0] <= version:
+                self._entries[table] = (version, df)
+        return df.copy(deep=False)
+
+    def invalidate(self, table=None):
+        """Drop one cached table, or all of them"""
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(table, None)
+
+    def stats(self):
+        """Hit/miss counters and cached tables"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['tables'] = sorted(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+
+def normalize_sql(query):
+    """Cache key form of ``query``: whitespace outside quotes collapsed, trailing ``;`` dropped"""
+    text = _SQL_TOKENS.sub(lambda m: m.group(1) or ' ', query.strip())
+    return text.rstrip('; ')
+
+
+def _params_key(params):
+    if params is None:
+        return ()
+    if isinstance(params, dict):
+        return tuple(sorted(params.items()))
+    return tuple(params)
+
+
+class QueryCache:
+    """Shared LRU cache of SELECT results with a byte budget and a TTL"""
+
+    def __init__(self, max_bytes=QUERY_CACHE_BYTES, ttl=QUERY_CACHE_TTL, database=None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.database = database or db.DB_PATH
+        self._lock = threading.Lock()
+        self._probe = None
+        self._data_version = None
+        self._table_versions = {}
+        # key -> [data_version, table deps or None, loaded_at, nbytes, DataFrame]
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'stale': 0, 'expired': 0, 'evictions': 0,
+                       'oversize': 0, 'bypassed': 0}
+
+    def _probe_conn(self):
+        if self._probe is None:
+            self._probe = sqlite3.connect(db.readonly_uri(self.database), uri=True,
+                                          check_same_thread=False)
+        return self._probe
+
+    def _versions(self):
+        """Current (data_version, table change counters); counters re-read only when it moved"""
+        probe = self._probe_conn()
+        data_version = probe.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._table_versions = dict(
+                probe.execute("SELECT table_name, version FROM table_versions").fetchall())
+            self._data_version = data_version
+        return data_version, self._table_versions
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry[3]
+
+    def _fresh(self, entry, data_version, table_versions, now):
+        """Whether a cached entry may be served (lock held)"""
+        if now - entry[2] > self.ttl:
+            self._stats['expired'] += 1
+            return False
+        if entry[0] == data_version:
+            return True
+        deps = entry[1]
+        if deps is not None and all(table_versions.get(t, 0) == v for t, v in deps):
+            entry[0] = data_version  # other tables changed; skip this check next time
+            return True
+        self._stats['stale'] += 1
+        return False
+
+    def _run(self, query, params, loader=None):
+        """(DataFrame, cacheable, tables SQLite reported reading) for ``query``"""
+        tables = set()
+
+        def authorize(action, arg1, arg2, dbname, source):
+            if action == sqlite3.SQLITE_READ:
+                tables.add(arg1)
+            return sqlite3.SQLITE_OK
+
+        with db.get_reader_pool().connection() as conn:
+            conn.set_authorizer(authorize)
+            try:
+                if loader is None:
+                    df, cacheable = pd.read_sql_query(query, conn, params=params), True
+                else:
+                    df, cacheable = loader(conn, query, params)
+            finally:
+                conn.set_authorizer(None)
+        return df, cacheable, tables
+
+    def get(self, query, params=None, bypass=False, loader=None):
+        """DataFrame for a SELECT, from the cache when still valid
+
+        ``bypass=True`` runs the query directly and leaves the cache untouched.
+        ``loader(conn, query, params)`` replaces pd.read_sql_query on a miss and
+        returns ``(df, cacheable)``. gsk.governor uses it so that truncated
+        results are never stored. As with TableCache, callers get a shallow
+        copy and must not modify values in place.
+        """
+        if bypass or self.max_bytes <= 0:
+            with self._lock:
+                self._stats['bypassed'] += 1
+            return self._run(query, params, loader)[0]
+
+        key = (normalize_sql(query), _params_key(params))
+        with self._lock:
+            data_version, table_versions = self._versions()
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._fresh(entry, data_version, table_versions, time.monotonic()):
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return entry[4].copy(deep=False)
+                self._drop(key)
+            self._stats['misses'] += 1
+            table_versions = dict(table_versions)
+
+        # Versions were taken before the query runs: a concurrent commit only makes the entry stale early
+        df, cacheable, tables = self._run(query, params, loader)
+        if all(t in db.VERSIONED_TABLES for t in tables):
+            deps = tuple(sorted((t, table_versions.get(t, 0)) for t in tables))
+        else:
+            deps = None
+        nbytes = int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            if cacheable and nbytes > self.max_bytes:
+                self._stats['oversize'] += 1
+            elif cacheable:
+                if key in self._entries:
+                    self._drop(key)
+                self._entries[key] = [data_version, deps, time.monotonic(), nbytes, df]
+                self._bytes += nbytes
+                while self._bytes > self.max_bytes:
+                    self._drop(next(iter(self._entries)))
+                    self._stats['evictions'] += 1
+        return df.copy(deep=False)
+
+    def invalidate(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Hit/miss/eviction counters, entries and bytes held against the budget"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update(entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes,
+                         ttl=self.ttl)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+
+# ==================== PROCESS-WIDE CACHES ====================
+_table_cache = None
+_query_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_table_cache():
+    """Return the process-wide table cache"""
+    global _table_cache
+    if _table_cache is None:
+        with _cache_lock:
+            if _table_cache is None:
+                db.get_pool()  # make sure schema and WAL are set up before probing
+                _table_cache = TableCache()
+    return _table_cache
+
+
+def load_table(table):
+    """Full-table read through the shared cache"""
+    return get_table_cache().get(table)
+
+
+def table_version(table):
+    """Current change counter of a versioned table"""
+    return get_table_cache().version(table)
+
+
+def get_query_cache():
+    """Return the process-wide query result cache"""
+    global _query_cache
+    if _query_cache is None:
+        with _cache_lock:
+            if _query_cache is None:
+                db.get_pool()
+                _query_cache = QueryCache()
+    return _query_cache
+
+
+def cached_query(query, params=None, bypass=False, loader=None):
+    """SELECT through the shared result cache (``bypass=True`` to skip it)"""
+    return get_query_cache().get(query, params, bypass, loader)
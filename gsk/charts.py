@@ -0,0 +1,275 @@
+"""
+Chart data layer: keeps Plotly figures small whatever the row count
+
+st.plotly_chart serializes every point of every trace into the page, and
+the browser then draws each one as an SVG node. This module reduces the data
+before it reaches Plotly.
+
+* Lines and time series are downsampled per series with LTTB
+  (Largest-Triangle-Three-Buckets, Steinarsson 2013) to ``LINE_POINTS``
+  points. LTTB keeps the peaks and troughs that plain striding would miss,
+  and points passed as ``keep`` (e.g. control-rule violations) always
+  survive.
+* Scatters larger than ``SCATTER_POINTS`` become a hexagonal binning per
+  colour group. Each marker is one occupied hexagon, its size is the number
+  of rows in it, and the hover shows the count and the mean of the ``size``
+  column.
+* OLS trendlines come from gsk.trends (grouped closed-form fits over every
+  row, no statsmodels) and are drawn as one overlay line per group.
+* A figure with more than ``WEBGL_POINTS`` points is drawn with Scattergl
+  (WebGL) traces instead of SVG.
+* ``cap_payload`` measures the figure's JSON and, above ``MAX_PAYLOAD``
+  bytes, thins its traces proportionally until it fits.
+
+The builders record how many rows were drawn in ``fig.layout.meta``, and
+``caption(fig)`` turns that into a note for the page.
+benchmarks/bench_chart_payload.py measures figure size and build time.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from gsk import trends
+
+LINE_POINTS = int(os.environ.get('GSK_CHART_LINE_POINTS', 2_000))        # per series
+SCATTER_POINTS = int(os.environ.get('GSK_CHART_SCATTER_POINTS', 5_000))  # rows before binning
+WEBGL_POINTS = 1_000
+HEX_BINS = 30  # hexagons across the x range
+MAX_PAYLOAD = int(float(os.environ.get('GSK_CHART_MAX_KB', 512)) * 1024)  # JSON bytes per figure
+MIN_TRACE_POINTS = 100  # cap_payload never thins a trace below this
+
+# Per-point trace attributes that must be sliced together with x and y
+_POINT_ATTRIBUTES = ('x', 'y', 'text', 'hovertext', 'customdata', 'marker.size', 'marker.color')
+
+
+# ==================== DOWNSAMPLING ====================
+def _numeric(values):
+    """Values as float64 for geometry: datetimes as ns, non-numeric as their position"""
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.astype('int64').to_numpy(dtype=float)
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.to_numpy(dtype=float)
+    return np.arange(len(values), dtype=float)
+
+
+def lttb(x, y, threshold):
+    """Indices of the ``threshold`` points LTTB keeps from the series (x, y), in order"""
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x, y = _numeric(x), np.asarray(y, dtype=float)
+    # threshold - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    keep = np.empty(threshold, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    selected = 0
+    for bucket in range(threshold - 2):
+        low, high = edges[bucket], edges[bucket + 1]
+        following = slice(high, edges[bucket + 2]) if bucket + 2 < len(edges) else slice(n - 1, n)
+        mean_x, mean_y = x[following].mean(), y[following].mean()
+        # Twice the area of the triangle (selected point, candidate, next bucket's mean)
+        area = np.abs((x[selected] - mean_x) * (y[low:high] - y[selected])
+                      - (x[selected] - x[low:high]) * (mean_y - y[selected]))
+        selected = low + int(area.argmax())
+        keep[bucket + 1] = selected
+    return keep
+
+
+def downsample(df, x, y, max_points=LINE_POINTS, by=None, keep=None):
+    """Rows of ``df`` that LTTB keeps per ``by`` group, in their original order
+
+    ``keep`` is an optional boolean mask of rows that must survive.
+    """
+    if keep is not None and not isinstance(keep, pd.Series):
+        keep = pd.Series(np.asarray(keep, dtype=bool), index=df.index)
+    df = df[df[y].notna()]
+    groups = df.groupby(by, sort=False) if by else [(None, df)]
+    rows = []
+    for _, group in groups:
+        rows.append(group.index[lttb(group[x], group[y], max_points)])
+        if keep is not None:
+            rows.append(group.index[keep.reindex(group.index, fill_value=False).to_numpy(dtype=bool)])
+    if not rows:
+        return df
+    index = pd.Index(np.concatenate(rows)).unique()
+    return df.loc[df.index.isin(index)]
+
+
+def hexbin(df, x, y, by=None, size=None, gridsize=HEX_BINS):
+    """Occupied hexagons of (x, y): centre, ``count`` and mean ``size`` per ``by`` group
+
+    The grid has ``gridsize`` hexagons across the x range and is shared by
+    all groups.
+    """
+    df = df[df[x].notna() & df[y].notna()]
+    xs, ys = _numeric(df[x]), _numeric(df[y])
+    x_min, y_min = xs.min(), ys.min()
+    width = (xs.max() - x_min) / gridsize or 1.0
+    height = (ys.max() - y_min) / (gridsize / np.sqrt(3)) or 1.0
+    # Two offset rectangular lattices; each point goes to the nearer centre
+    u, v = (xs - x_min) / width, (ys - y_min) / height
+    u1, v1 = np.round(u), np.round(v)
+    u2, v2 = np.floor(u) + 0.5, np.floor(v) + 0.5
+    first = (u - u1) ** 2 + 3 * (v - v1) ** 2 < (u - u2) ** 2 + 3 * (v - v2) ** 2
+    cells = pd.DataFrame({
+        x: np.where(first, u1, u2) * width + x_min,
+        y: np.where(first, v1, v2) * height + y_min,
+    }, index=df.index)
+    keys = ([by] if by else []) + [x, y]
+    if by:
+        cells[by] = df[by]
+    aggregations = {'count': (x, 'size')}
+    if size:
+        cells[size] = df[size]
+        aggregations[size] = (size, 'mean')
+    return cells.groupby(keys, sort=False, observed=True).agg(**aggregations).reset_index()
+
+
+# ==================== PAYLOAD ====================
+def payload_bytes(fig):
+    """Size of the figure's JSON, as st.plotly_chart sends it"""
+    return len(pio.to_json(fig, validate=False))
+
+
+def _points(trace):
+    y = getattr(trace, 'y', None)
+    return 0 if y is None else len(y)
+
+
+def _thin(trace, rows):
+    """Keep ``rows`` points of ``trace``: LTTB for lines, evenly spaced for markers"""
+    n = _points(trace)
+    if 'lines' in (trace.mode or 'lines') and trace.x is not None:
+        index = lttb(trace.x, trace.y, rows)
+    else:
+        index = np.linspace(0, n - 1, rows).astype(int)
+    for attribute in _POINT_ATTRIBUTES:
+        parent, _, name = attribute.rpartition('.')
+        owner = trace[parent] if parent else trace
+        values = owner[name] if owner is not None else None
+        if values is not None and not isinstance(values, str) and np.ndim(values) and len(values) == n:
+            owner[name] = np.asarray(values)[index]
+
+
+def cap_payload(fig, max_bytes=MAX_PAYLOAD):
+    """Thin every trace above ``MIN_TRACE_POINTS`` until ``fig`` serializes to at most ``max_bytes``"""
+    size = payload_bytes(fig)
+    for _ in range(4):
+        if size <= max_bytes:
+            break
+        scale = max_bytes / size * 0.9
+        thinned = False
+        for trace in fig.data:
+            n = _points(trace)
+            if n > MIN_TRACE_POINTS:
+                _thin(trace, max(MIN_TRACE_POINTS, int(n * scale)))
+                thinned = True
+        if not thinned:
+            break
+        size = payload_bytes(fig)
+    return fig
+
+
+def _webgl(trace):
+    """The trace as Scattergl if it is an SVG scatter"""
+    if not isinstance(trace, go.Scatter):
+        return trace
+    spec = trace.to_plotly_json()
+    spec.pop('type', None)
+    return go.Scattergl(spec, skip_invalid=True)
+
+
+def _finish(fig, rows, max_bytes):
+    cap_payload(fig, max_bytes)
+    # Decided on the points left after thinning, across all traces
+    if sum(_points(trace) for trace in fig.data) > WEBGL_POINTS:
+        fig = go.Figure([_webgl(trace) for trace in fig.data], fig.layout)
+    fig.layout.meta = {'rows': int(rows), 'shown': int(sum(_points(t) for t in fig.data))}
+    return fig
+
+
+def caption(fig):
+    """A note on how the figure reduced its rows, or None when every row is drawn"""
+    meta = fig.layout.meta or {}
+    if meta.get('binned'):
+        return f"{meta['rows']:,} rows binned into {meta['shown']:,} hexagons"
+    if meta.get('shown', 0) >= meta.get('rows', 0):
+        return None
+    return f"Showing {meta['shown']:,} of {meta['rows']:,} points (LTTB downsampled)"
+
+
+# ==================== FIGURES ====================
+def line(df, x, y, color=None, max_points=LINE_POINTS, keep=None, max_bytes=MAX_PAYLOAD, **px_kwargs):
+    """px.line with LTTB per series; ``y`` may be a list of columns (wide form)"""
+    if isinstance(y, (list, tuple)):
+        df = df.melt(id_vars=[x], value_vars=list(y), var_name='variable', value_name='value')
+        y, color = 'value', 'variable'
+    data = downsample(df, x, y, max_points, by=color, keep=keep)
+    fig = px.line(data, x=x, y=y, color=color, render_mode='svg', **px_kwargs)
+    return _finish(fig, len(df), max_bytes)
+
+
+def trace(x, y, max_points=LINE_POINTS, keep=None, **scatter_kwargs):
+    """A go.Scatter (go.Scattergl above ``WEBGL_POINTS``) of the LTTB-downsampled series"""
+    frame = pd.DataFrame({'x': np.asarray(x), 'y': np.asarray(y, dtype=float)})
+    if 'text' in scatter_kwargs and np.ndim(scatter_kwargs['text']):
+        frame['text'] = np.asarray(scatter_kwargs.pop('text'))
+    frame = downsample(frame, 'x', 'y', max_points, keep=None if keep is None else np.asarray(keep))
+    if 'text' in frame:
+        scatter_kwargs['text'] = frame['text']
+    kind = go.Scattergl if len(frame) > WEBGL_POINTS else go.Scatter  # judged per trace here
+    return kind(x=frame['x'], y=frame['y'], **scatter_kwargs)
+
+
+def add_trendlines(fig, fits):
+    """Overlay one line per fitted group (gsk.trends fits), coloured like its scatter trace"""
+    series = {trace.name: trace for trace in fig.data}
+    for group, fit in fits.iterrows():
+        if not np.isfinite(fit['slope']):
+            continue
+        name = None if group is None else str(group)
+        source = series.get(name) if name is not None else (fig.data[0] if fig.data else None)
+        ends = np.array([fit['x_min'], fit['x_max']])
+        fig.add_trace(go.Scatter(
+            x=ends, y=fit['intercept'] + fit['slope'] * ends, mode='lines', name=name,
+            line=dict(color=source.marker.color if source is not None else None),
+            legendgroup=source.legendgroup if source is not None else None, showlegend=False,
+            hovertemplate=(f"<b>OLS trendline</b>{f' ({name})' if name else ''}<br>"
+                           f"y = {fit['slope']:.4g} x + {fit['intercept']:.4g}<br>"
+                           f"R² = {fit['r2']:.3f}, n = {int(fit['n']):,}<extra></extra>"),
+        ))
+    return fig
+
+
+def scatter(df, x, y, color=None, size=None, trendline=None, max_points=SCATTER_POINTS,
+            gridsize=HEX_BINS, max_bytes=MAX_PAYLOAD, **px_kwargs):
+    """px.scatter, or a per-colour hexbin of it once ``df`` has more than ``max_points`` rows
+
+    ``trendline`` is 'ols' to fit per colour group here, or fits already
+    computed by gsk.trends (e.g. cached ``table_trendlines``).
+    """
+    if isinstance(trendline, str):
+        if trendline != 'ols':
+            raise ValueError(f"Unsupported trendline {trendline!r}; only 'ols'")
+        trendline = trends.ols_by_group(df, x, y, color)
+
+    binned = len(df) > max_points
+    if binned:
+        cells = hexbin(df, x, y, by=color, size=size, gridsize=gridsize)
+        hover = {'count': True, size: ':.1f'} if size else {'count': True}
+        fig = px.scatter(cells, x=x, y=y, color=color, size='count', hover_data=hover,
+                         render_mode='svg', **px_kwargs)
+    else:
+        fig = px.scatter(df, x=x, y=y, color=color, size=size, render_mode='svg', **px_kwargs)
+    if trendline is not None:  # always fitted on the rows, never the hexagon centres
+        add_trendlines(fig, trendline)
+    fig = _finish(fig, len(df), max_bytes)
+    if binned:
+        fig.layout.meta = dict(fig.layout.meta, shown=len(cells), binned=True)
+    return fig
@@ -0,0 +1,1080 @@
+"""
+Shared SQLite connection pool for the GSK Enterprise Tools Suite
+
+Every Streamlit session used to open (and never close) its own connection to
+gsk_enterprise.db. Instead, one bounded pool per process hands connections out
+to whichever session needs one and takes them back afterwards, so the number of
+open handles stays flat no matter how many dashboards are connected.
+
+Two storage modes are supported (GSK_DB_STORAGE_MODE):
+
+- ``wal`` (default): write-ahead logging with tuned pragmas. Dashboard reads go
+  through a pool of read-only (``mode=ro``) connections and never block on the
+  single writer connection that handles inserts.
+- ``rollback``: the classic rollback journal; one read-write pool serves everything.
+"""
+
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from urllib.parse import quote
+
+import pandas as pd
+
+DB_PATH = os.environ.get('GSK_DB_PATH', 'gsk_enterprise.db')
+STORAGE_MODE = os.environ.get('GSK_DB_STORAGE_MODE', 'wal')
+
+# Per-connection pragmas applied in WAL mode
+WAL_PRAGMAS = {
+    'synchronous': 'NORMAL',     # fsync on checkpoint only; durable against app crashes
+    'cache_size': -64000,        # ~64 MB page cache per connection
+    'mmap_size': 268435456,      # 256 MB memory-mapped reads
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000,
+}
+
+# Tables whose contents are cached in memory (see gsk.cache); each write bumps
+# the table's row in table_versions so caches know exactly what changed. Bulk
+# loads (gsk.ingest) drop the per-row triggers and bump once per transaction.
+VERSIONED_TABLES = ('clinical_trials', 'drug_pipeline', 'sales_data', 'quality_control', 'employees',
+                    'financial_ledger')
+
+# Incrementally maintained rollups: name -> (source table, arrival key, dirty table).
+# rollup_state holds each one's high-water mark; the dirty table, if any, lists
+# keys whose already-folded rows changed (see refresh_rollup)
+ROLLUPS = {
+    'sales_cube': ('sales_data', 'sale_id', None),
+    'spc': ('quality_control', 'rowid', 'spc_dirty'),
+    'equipment_risk': ('equipment_telemetry', 'reading_id', 'equipment_risk_dirty'),
+}
+
+# ==================== SCHEMA ====================
+_SALES_HIGH_WATER = "(SELECT high_water FROM rollup_state WHERE name = 'sales_cube')"
+_SPC_HIGH_WATER = "(SELECT high_water FROM rollup_state WHERE name = 'spc')"
+_RISK_HIGH_WATER = "(SELECT high_water FROM rollup_state WHERE name = 'equipment_risk')"
+
+# Study type as a single search token ('Pre-clinical' -> 'preclinical'); must
+# match gsk.research.kind_token
+_STUDY_KIND = "lower(replace(replace({row}.study_type, '-', ''), ' ', ''))"
+
+
+def _sales_cube_add(row):
+    """Trigger body adding one sales_data row (NEW/OLD) to its cube cell"""
+    return f'''
+        INSERT INTO sales_cube (product_name, region, month, revenue, units, sales,
+                                first_date, last_date)
+        SELECT {row}.product_name, {row}.region, substr({row}.sale_date, 1, 7),
+               COALESCE({row}.revenue, 0), COALESCE({row}.units_sold, 0), 1,
+               {row}.sale_date, {row}.sale_date
+        WHERE {row}.product_name IS NOT NULL AND {row}.region IS NOT NULL
+          AND {row}.sale_date IS NOT NULL
+        ON CONFLICT (product_name, region, month) DO UPDATE SET
+            revenue = revenue + excluded.revenue,
+            units = units + excluded.units,
+            sales = sales + 1,
+            first_date = MIN(first_date, excluded.first_date),
+            last_date = MAX(last_date, excluded.last_date);
+    '''
+
+
+def _research_fts(row, command=None):
+    """Trigger body adding (or, with command='delete', removing) a study in the FTS index"""
+    columns = 'rowid, title, abstract, therapeutic_area, study_kind'
+    values = (f"{row}.id, {row}.title, {row}.abstract, {row}.therapeutic_area, "
+              f"{_STUDY_KIND.format(row=row)}")
+    if command:
+        columns = f'research_studies_fts, {columns}'
+        values = f"'{command}', {values}"
+    return f"INSERT INTO research_studies_fts ({columns}) VALUES ({values});"
+
+
+def _research_counts(row, sign):
+    """Trigger body adding (sign=1) or removing (sign=-1) a study from research_study_counts"""
+    return f'''
+        INSERT INTO research_study_counts (study_type, therapeutic_area, status, studies, citations)
+        VALUES (COALESCE({row}.study_type, 'Unknown'), COALESCE({row}.therapeutic_area, 'Unknown'),
+                COALESCE({row}.status, 'Unknown'), {sign}, {sign} * COALESCE({row}.citations, 0))
+        ON CONFLICT (study_type, therapeutic_area, status) DO UPDATE SET
+            studies = studies + excluded.studies,
+            citations = citations + excluded.citations;
+    '''
+
+
+def _sales_cube_remove(row):
+    """Trigger body removing one sales_data row (NEW/OLD) from its cube cell
+
+    When the row was on the cell's first or last date, that bound is read again
+    from the folded rows of the cell (an index seek on
+    idx_sales_data_product_region_date).
+    """
+    cell = (f"product_name = {row}.product_name AND region = {row}.region "
+            f"AND month = substr({row}.sale_date, 1, 7)")
+    folded = (f"FROM sales_data WHERE product_name = {row}.product_name AND region = {row}.region "
+              f"AND sale_date BETWEEN substr({row}.sale_date, 1, 7) AND substr({row}.sale_date, 1, 7) || '-99' "
+              f"AND sale_id <= {_SALES_HIGH_WATER}")
+    return f'''
+        UPDATE sales_cube SET
+            revenue = revenue - COALESCE({row}.revenue, 0),
+            units = units - COALESCE({row}.units_sold, 0),
+            sales = sales - 1,
+            first_date = CASE WHEN first_date < {row}.sale_date THEN first_date
+                              ELSE (SELECT MIN(sale_date) {folded}) END,
+            last_date = CASE WHEN last_date > {row}.sale_date THEN last_date
+                             ELSE (SELECT MAX(sale_date) {folded}) END
+        WHERE {cell};
+        DELETE FROM sales_cube WHERE {cell} AND sales <= 0;
+    '''
+
+
+SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS clinical_trials (
+        trial_id TEXT PRIMARY KEY,
+        drug_name TEXT,
+        phase TEXT,
+        status TEXT,
+        start_date DATE,
+        patients_enrolled INTEGER,
+        success_rate REAL,
+        therapeutic_area TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS drug_pipeline (
+        drug_id TEXT PRIMARY KEY,
+        drug_name TEXT,
+        stage TEXT,
+        indication TEXT,
+        market_potential REAL,
+        timeline_months INTEGER,
+        investment REAL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS sales_data (
+        sale_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        product_name TEXT,
+        region TEXT,
+        revenue REAL,
+        units_sold INTEGER,
+        sale_date DATE
+    )
+    ''',
+    # Covering index for the sales dashboard (gsk.sales): filter seeks on
+    # product/region/date, and the aggregates never touch the table itself
+    '''
+    CREATE INDEX IF NOT EXISTS idx_sales_data_product_region_date
+        ON sales_data (product_name, region, sale_date, revenue, units_sold)
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS quality_control (
+        batch_id TEXT PRIMARY KEY,
+        product TEXT,
+        test_date DATE,
+        test_result TEXT,
+        compliance_score REAL,
+        site TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS employees (
+        employee_id TEXT PRIMARY KEY,
+        department TEXT,
+        tenure_years REAL,
+        performance_score REAL,
+        satisfaction_score REAL,
+        training_hours INTEGER
+    )
+    ''',
+    # General ledger lines for the financial reports (gsk.finance). The
+    # covering index serves every rollup: month-range seeks, grouping in
+    # (month, category) order, and the amounts without touching the table
+    '''
+    CREATE TABLE IF NOT EXISTS financial_ledger (
+        entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        month TEXT NOT NULL,
+        category TEXT NOT NULL,
+        cost_center TEXT,
+        revenue REAL NOT NULL DEFAULT 0,
+        expenses REAL NOT NULL DEFAULT 0,
+        budget REAL NOT NULL DEFAULT 0
+    )
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_financial_ledger_month_category
+        ON financial_ledger (month, category, cost_center, revenue, expenses, budget)
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS analytics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        tool_name TEXT,
+        access_time DATETIME DEFAULT CURRENT_TIMESTAMP,
+        session_id TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS feedback (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        tool_name TEXT,
+        rating INTEGER,
+        comments TEXT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    # Usage counters maintained by triggers on analytics, so "most used tools"
+    # is a lookup over one row per tool instead of a scan of every event
+    '''
+    CREATE TABLE IF NOT EXISTS tool_usage_counts (
+        tool_name TEXT PRIMARY KEY,
+        count INTEGER NOT NULL DEFAULT 0,
+        last_access DATETIME
+    )
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_tool_usage_counts_count
+        ON tool_usage_counts (count DESC)
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS tool_usage_daily (
+        tool_name TEXT,
+        day DATE,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, tool_name)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_analytics_usage_insert
+    AFTER INSERT ON analytics
+    BEGIN
+        INSERT INTO tool_usage_counts (tool_name, count, last_access)
+        VALUES (NEW.tool_name, 1, NEW.access_time)
+        ON CONFLICT (tool_name) DO UPDATE SET
+            count = count + 1,
+            last_access = MAX(COALESCE(last_access, ''), excluded.last_access);
+        INSERT INTO tool_usage_daily (tool_name, day, count)
+        VALUES (NEW.tool_name, date(NEW.access_time), 1)
+        ON CONFLICT (day, tool_name) DO UPDATE SET count = count + 1;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_analytics_usage_delete
+    AFTER DELETE ON analytics
+    BEGIN
+        UPDATE tool_usage_counts SET count = count - 1 WHERE tool_name = OLD.tool_name;
+        UPDATE tool_usage_daily SET count = count - 1
+        WHERE day = date(OLD.access_time) AND tool_name = OLD.tool_name;
+    END
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS table_versions (
+        table_name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS rollup_state (
+        name TEXT PRIMARY KEY,
+        high_water INTEGER NOT NULL DEFAULT 0,
+        refreshed_at DATETIME
+    )
+    ''',
+    # Product x region x month sales cube (gsk.sales). New sales are folded in
+    # in bulk above the sale_id high-water mark. The triggers below patch the
+    # cube for rows at or below it that are inserted, updated or deleted.
+    '''
+    CREATE TABLE IF NOT EXISTS sales_cube (
+        product_name TEXT NOT NULL,
+        region TEXT NOT NULL,
+        month TEXT NOT NULL,
+        revenue REAL NOT NULL DEFAULT 0,
+        units INTEGER NOT NULL DEFAULT 0,
+        sales INTEGER NOT NULL DEFAULT 0,
+        first_date DATE,
+        last_date DATE,
+        PRIMARY KEY (product_name, region, month)
+    ) WITHOUT ROWID
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_sales_cube_insert
+    AFTER INSERT ON sales_data
+    WHEN NEW.sale_id <= {_SALES_HIGH_WATER}
+    BEGIN
+        {_sales_cube_add('NEW')}
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_sales_cube_update_add
+    AFTER UPDATE OF sale_id, product_name, region, revenue, units_sold, sale_date ON sales_data
+    WHEN NEW.sale_id <= {_SALES_HIGH_WATER}
+    BEGIN
+        {_sales_cube_add('NEW')}
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_sales_cube_update_remove
+    AFTER UPDATE OF sale_id, product_name, region, revenue, units_sold, sale_date ON sales_data
+    WHEN OLD.sale_id <= {_SALES_HIGH_WATER}
+    BEGIN
+        {_sales_cube_remove('OLD')}
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_sales_cube_delete
+    AFTER DELETE ON sales_data
+    WHEN OLD.sale_id <= {_SALES_HIGH_WATER}
+    BEGIN
+        {_sales_cube_remove('OLD')}
+    END
+    ''',
+    # Statistical process control (gsk.spc). QC results are folded into
+    # per-product/site running statistics in rowid (arrival) order. The index
+    # serves both the rule-window tails and the per-stream control charts.
+    '''
+    CREATE INDEX IF NOT EXISTS idx_quality_control_product_site
+        ON quality_control (product, site)
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS spc_state (
+        product TEXT NOT NULL,
+        site TEXT NOT NULL,
+        n INTEGER NOT NULL DEFAULT 0,
+        mean REAL NOT NULL DEFAULT 0,
+        m2 REAL NOT NULL DEFAULT 0,
+        min_score REAL,
+        max_score REAL,
+        passed INTEGER NOT NULL DEFAULT 0,
+        failed INTEGER NOT NULL DEFAULT 0,
+        last_batch_id TEXT,
+        last_test_date DATE,
+        PRIMARY KEY (product, site)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS spc_alerts (
+        batch_id TEXT NOT NULL,
+        rule INTEGER NOT NULL,
+        product TEXT,
+        site TEXT,
+        test_date DATE,
+        compliance_score REAL,
+        zscore REAL,
+        PRIMARY KEY (batch_id, rule)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_spc_alerts_stream
+        ON spc_alerts (product, site, test_date)
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_spc_alerts_test_date
+        ON spc_alerts (test_date DESC)
+    ''',
+    # Streams whose already-folded rows were changed; recomputed on next refresh.
+    # quality_control has a TEXT key, so SQLite may reuse the rowid of a deleted
+    # row at the top of the table: an insert at or below the high-water mark
+    # marks its stream too, or the row would never be folded.
+    '''
+    CREATE TABLE IF NOT EXISTS spc_dirty (
+        product TEXT NOT NULL,
+        site TEXT NOT NULL,
+        PRIMARY KEY (product, site)
+    ) WITHOUT ROWID
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_spc_insert
+    AFTER INSERT ON quality_control
+    WHEN NEW.rowid <= {_SPC_HIGH_WATER}
+    BEGIN
+        INSERT OR IGNORE INTO spc_dirty (product, site)
+        SELECT NEW.product, NEW.site WHERE NEW.product IS NOT NULL AND NEW.site IS NOT NULL;
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_spc_update
+    AFTER UPDATE OF product, site, test_result, compliance_score ON quality_control
+    WHEN OLD.rowid <= {_SPC_HIGH_WATER}
+    BEGIN
+        INSERT OR IGNORE INTO spc_dirty (product, site)
+        SELECT OLD.product, OLD.site WHERE OLD.product IS NOT NULL AND OLD.site IS NOT NULL;
+        INSERT OR IGNORE INTO spc_dirty (product, site)
+        SELECT NEW.product, NEW.site WHERE NEW.product IS NOT NULL AND NEW.site IS NOT NULL;
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_spc_delete
+    AFTER DELETE ON quality_control
+    WHEN OLD.rowid <= {_SPC_HIGH_WATER}
+    BEGIN
+        INSERT OR IGNORE INTO spc_dirty (product, site)
+        SELECT OLD.product, OLD.site WHERE OLD.product IS NOT NULL AND OLD.site IS NOT NULL;
+    END
+    ''',
+    # Lab equipment registry and daily telemetry (gsk.maintenance). Readings are
+    # folded into equipment_risk in reading_id (arrival) order; the telemetry
+    # index serves both the recomputation of one instrument and its history chart
+    '''
+    CREATE TABLE IF NOT EXISTS equipment (
+        equipment_id TEXT PRIMARY KEY,
+        equipment_name TEXT,
+        equipment_type TEXT,
+        location TEXT,
+        maintenance_interval_days INTEGER NOT NULL DEFAULT 90
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS equipment_telemetry (
+        reading_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        equipment_id TEXT NOT NULL,
+        reading_date DATE NOT NULL,
+        utilization REAL NOT NULL DEFAULT 0,
+        error_count INTEGER NOT NULL DEFAULT 0,
+        maintenance INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_equipment_telemetry_equipment_date
+        ON equipment_telemetry (equipment_id, reading_date)
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS equipment_risk (
+        equipment_id TEXT PRIMARY KEY,
+        readings INTEGER NOT NULL DEFAULT 0,
+        utilization_fast REAL,
+        utilization_slow REAL,
+        utilization_trend REAL,
+        error_rate REAL,
+        first_reading_date DATE,
+        last_reading_date DATE,
+        last_maintenance DATE,
+        days_since_maintenance INTEGER,
+        maintenance_interval_days INTEGER,
+        risk_score REAL,
+        risk_level TEXT
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_equipment_risk_score
+        ON equipment_risk (risk_score DESC)
+    ''',
+    # Instruments whose folded readings or maintenance interval changed;
+    # recomputed on next refresh
+    '''
+    CREATE TABLE IF NOT EXISTS equipment_risk_dirty (
+        equipment_id TEXT PRIMARY KEY
+    ) WITHOUT ROWID
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_equipment_risk_update
+    AFTER UPDATE OF equipment_id, reading_date, utilization, error_count, maintenance
+        ON equipment_telemetry
+    WHEN OLD.reading_id <= {_RISK_HIGH_WATER}
+    BEGIN
+        INSERT OR IGNORE INTO equipment_risk_dirty (equipment_id) VALUES (OLD.equipment_id);
+        INSERT OR IGNORE INTO equipment_risk_dirty (equipment_id) VALUES (NEW.equipment_id);
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_equipment_risk_delete
+    AFTER DELETE ON equipment_telemetry
+    WHEN OLD.reading_id <= {_RISK_HIGH_WATER}
+    BEGIN
+        INSERT OR IGNORE INTO equipment_risk_dirty (equipment_id) VALUES (OLD.equipment_id);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_equipment_risk_interval
+    AFTER UPDATE OF maintenance_interval_days ON equipment
+    WHEN EXISTS (SELECT 1 FROM equipment_risk WHERE equipment_id = NEW.equipment_id)
+    BEGIN
+        INSERT OR IGNORE INTO equipment_risk_dirty (equipment_id) VALUES (NEW.equipment_id);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_equipment_risk_registered
+    AFTER INSERT ON equipment
+    WHEN EXISTS (SELECT 1 FROM equipment_risk WHERE equipment_id = NEW.equipment_id)
+    BEGIN
+        INSERT OR IGNORE INTO equipment_risk_dirty (equipment_id) VALUES (NEW.equipment_id);
+    END
+    ''',
+    # Research repository (gsk.research). research_studies_fts is an external
+    # content FTS5 index over title, abstract, area and the study type token;
+    # the triggers keep it, and the per-type/area/status counters, in step.
+    '''
+    CREATE TABLE IF NOT EXISTS research_studies (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        study_id TEXT NOT NULL UNIQUE,
+        title TEXT,
+        abstract TEXT,
+        study_type TEXT,
+        therapeutic_area TEXT,
+        status TEXT,
+        published DATE,
+        citations INTEGER
+    )
+    ''',
+    # Keyset pagination for the paged grids (gsk.paging): each index ends in
+    # the primary key, so a page is one index seek in (column, key) order
+    '''
+    CREATE INDEX IF NOT EXISTS idx_clinical_trials_success_rate
+        ON clinical_trials (success_rate, trial_id)
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_clinical_trials_start_date
+        ON clinical_trials (start_date, trial_id)
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_clinical_trials_patients_enrolled
+        ON clinical_trials (patients_enrolled, trial_id)
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_drug_pipeline_market_potential
+        ON drug_pipeline (market_potential, drug_id)
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_drug_pipeline_timeline_months
+        ON drug_pipeline (timeline_months, drug_id)
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_quality_control_stream_date
+        ON quality_control (product, site, test_date, batch_id)
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_research_studies_type_published
+        ON research_studies (study_type, published)
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_research_studies_published
+        ON research_studies (published)
+    ''',
+    f'''
+    CREATE VIEW IF NOT EXISTS research_studies_content AS
+    SELECT id, title, abstract, therapeutic_area, {_STUDY_KIND.format(row='research_studies')} AS study_kind
+    FROM research_studies
+    ''',
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS research_studies_fts USING fts5(
+        title, abstract, therapeutic_area, study_kind,
+        content='research_studies_content', content_rowid='id',
+        prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+    )
+    ''',
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS research_studies_vocab
+        USING fts5vocab(research_studies_fts, 'row')
+    ''',
+    # Studies per indexed term, refreshed after bulk loads (gsk.research.refresh_search_terms)
+    '''
+    CREATE TABLE IF NOT EXISTS research_terms (
+        term TEXT PRIMARY KEY,
+        studies INTEGER NOT NULL
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS research_study_counts (
+        study_type TEXT NOT NULL,
+        therapeutic_area TEXT NOT NULL,
+        status TEXT NOT NULL,
+        studies INTEGER NOT NULL DEFAULT 0,
+        citations INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (study_type, therapeutic_area, status)
+    ) WITHOUT ROWID
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_research_studies_insert
+    AFTER INSERT ON research_studies
+    BEGIN
+        {_research_fts('NEW')}
+        {_research_counts('NEW', 1)}
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_research_studies_update_fts
+    AFTER UPDATE OF id, title, abstract, therapeutic_area, study_type ON research_studies
+    BEGIN
+        {_research_fts('OLD', 'delete')}
+        {_research_fts('NEW')}
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_research_studies_update_counts
+    AFTER UPDATE OF study_type, therapeutic_area, status, citations ON research_studies
+    BEGIN
+        {_research_counts('OLD', -1)}
+        {_research_counts('NEW', 1)}
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_research_studies_delete
+    AFTER DELETE ON research_studies
+    BEGIN
+        {_research_fts('OLD', 'delete')}
+        {_research_counts('OLD', -1)}
+    END
+    ''',
+]
+
+
+def _version_triggers(table):
+    """DDL for the triggers that bump ``table``'s change counter"""
+    return [
+        f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{event.lower()}
+        AFTER {event} ON {table}
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = '{table}';
+        END
+        '''
+        for event in ('INSERT', 'UPDATE', 'DELETE')
+    ]
+
+
+def bump_table_version(conn, table):
+    """Advance ``table``'s change counter once, inside the caller's transaction"""
+    conn.execute("UPDATE table_versions SET version = version + 1 WHERE table_name = ?", (table,))
+
+
+def init_schema(conn):
+    """Create all application tables (idempotent)"""
+    cursor = conn.cursor()
+    for ddl in SCHEMA:
+        cursor.execute(ddl)
+    for table in VERSIONED_TABLES:
+        cursor.execute("INSERT OR IGNORE INTO table_versions (table_name, version) VALUES (?, 0)", (table,))
+        for ddl in _version_triggers(table):
+            cursor.execute(ddl)
+    for name in ROLLUPS:
+        cursor.execute("INSERT OR IGNORE INTO rollup_state (name) VALUES (?)", (name,))
+    # BM25 weights: title 4, abstract 1, therapeutic area 2; the type token only filters
+    cursor.execute("INSERT INTO research_studies_fts (research_studies_fts, rank) "
+                   "VALUES ('rank', 'bm25(4.0, 1.0, 2.0, 0.0)')")
+    # Counter tables added after analytics already had history
+    needs_backfill = cursor.execute(
+        "SELECT NOT EXISTS (SELECT 1 FROM tool_usage_counts) AND EXISTS (SELECT 1 FROM analytics)"
+    ).fetchone()[0]
+    if needs_backfill:
+        rebuild_usage_counters(conn)
+    conn.commit()
+
+
+def rebuild_usage_counters(conn):
+    """Recompute tool_usage_counts/tool_usage_daily from the raw analytics table"""
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM tool_usage_counts")
+    cursor.execute("DELETE FROM tool_usage_daily")
+    cursor.execute('''
+        INSERT INTO tool_usage_counts (tool_name, count, last_access)
+        SELECT tool_name, COUNT(*), MAX(access_time) FROM analytics GROUP BY tool_name
+    ''')
+    cursor.execute('''
+        INSERT INTO tool_usage_daily (tool_name, day, count)
+        SELECT tool_name, date(access_time), COUNT(*) FROM analytics
+        GROUP BY date(access_time), tool_name
+    ''')
+    conn.commit()
+
+
+# ==================== CONNECTION POOL ====================
+class PoolTimeoutError(RuntimeError):
+    """Raised when no pooled connection became available in time"""
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of SQLite connections
+
+    Connections are checked out with ``pool.connection()`` and returned when the
+    ``with`` block exits. Idle connections beyond ``min_size`` are closed after
+    ``max_idle_time`` seconds, and a connection that sat idle for longer than
+    ``health_check_after`` seconds is probed with ``SELECT 1`` before reuse.
+    Opening and probing happen outside the pool lock, so a slow connect never
+    holds up other checkouts and returns.
+    """
+
+    def __init__(self, database=DB_PATH, max_size=8, min_size=1, timeout=30.0,
+                 max_idle_time=300.0, health_check_after=60.0, connect_kwargs=None,
+                 on_connect=None):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.database = database
+        self.max_size = max_size
+        self.min_size = min(min_size, max_size)
+        self.timeout = timeout
+        self.max_idle_time = max_idle_time
+        self.health_check_after = health_check_after
+        self.connect_kwargs = dict(connect_kwargs or {})
+        self.on_connect = on_connect
+
+        self._idle = []  # stack of (conn, returned_at), most recently used last
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+        self._stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+            'timeouts': 0,
+            'created': 0,
+            'evicted': 0,
+            'health_check_failures': 0,
+            'peak_in_use': 0,
+        }
+
+    def _connect(self):
+        kwargs = {'check_same_thread': False}
+        kwargs.update(self.connect_kwargs)
+        conn = sqlite3.connect(self.database, **kwargs)
+        if self.on_connect is not None:
+            self.on_connect(conn)
+        return conn
+
+    def _evict_idle(self, now):
+        """Close connections idle for longer than max_idle_time (lock held)"""
+        keep = []
+        for conn, returned_at in self._idle:
+            if self._size > self.min_size and now - returned_at > self.max_idle_time:
+                conn.close()
+                self._size -= 1
+                self._stats['evicted'] += 1
+            else:
+                keep.append((conn, returned_at))
+        self._idle = keep
+
+    def _is_healthy(self, conn):
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn):
+        """Close a checked-out connection and free its slot"""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _reserve(self, started, timeout):
+        """Take an idle connection or a slot for a new one, waiting if neither is free
+
+        Returns ``(conn, returned_at, waited)``; ``conn`` is None for a reserved
+        slot the caller must fill. Only bookkeeping happens under the lock;
+        opening and probing connections is left to ``acquire``.
+        """
+        waited = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                now = time.monotonic()
+                self._evict_idle(now)
+                if self._idle:
+                    return self._idle.pop() + (waited,)
+                if self._size < self.max_size:
+                    self._size += 1
+                    return None, None, waited
+
+                remaining = timeout - (now - started)
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise PoolTimeoutError(
+                        f"No database connection available after {timeout:.1f}s "
+                        f"(pool size {self.max_size})")
+                waited = True
+                self._cond.wait(remaining)
+
+    def acquire(self, timeout=None):
+        """Check a connection out of the pool, waiting up to ``timeout`` seconds"""
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        waited = False
+
+        while True:
+            conn, returned_at, slept = self._reserve(started, timeout)
+            waited = waited or slept
+            if conn is None:
+                try:
+                    conn = self._connect()
+                except BaseException:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._stats['created'] += 1
+                break
+            if time.monotonic() - returned_at <= self.health_check_after or self._is_healthy(conn):
+                break
+            with self._cond:
+                self._stats['health_check_failures'] += 1
+            self._discard(conn)
+
+        with self._cond:
+            wait_time = time.monotonic() - started
+            self._stats['checkouts'] += 1
+            if waited:
+                self._stats['waits'] += 1
+            self._stats['wait_time_total'] += wait_time
+            self._stats['wait_time_max'] = max(self._stats['wait_time_max'], wait_time)
+            in_use = self._size - len(self._idle)
+            self._stats['peak_in_use'] = max(self._stats['peak_in_use'], in_use)
+        return conn
+
+    def release(self, conn):
+        """Return a connection to the pool, discarding any uncommitted work"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            healthy = True
+        except sqlite3.Error:
+            healthy = False
+
+        with self._cond:
+            if self._closed or not healthy:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+                self._size -= 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """Borrow a connection for the duration of a ``with`` block"""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def stats(self):
+        """Snapshot of pool size and wait-time metrics"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats['size'] = self._size
+            stats['idle'] = len(self._idle)
+            stats['in_use'] = self._size - len(self._idle)
+            stats['max_size'] = self.max_size
+        checkouts = stats['checkouts']
+        stats['wait_time_avg'] = stats['wait_time_total'] / checkouts if checkouts else 0.0
+        return stats
+
+    def close(self):
+        """Close idle connections; checked-out ones are closed when returned"""
+        with self._cond:
+            self._closed = True
+            for conn, _ in self._idle:
+                conn.close()
+                self._size -= 1
+            self._idle = []
+            self._cond.notify_all()
+
+
+# ==================== STORAGE MODES ====================
+def apply_wal_pragmas(conn):
+    """Tune a connection for WAL operation"""
+    for name, value in WAL_PRAGMAS.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+
+
+def enable_wal(database):
+    """Switch the database file to WAL journaling (persistent across connections)"""
+    conn = sqlite3.connect(database)
+    try:
+        mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+    finally:
+        conn.close()
+    if mode.lower() != 'wal':
+        raise sqlite3.OperationalError(f"Could not enable WAL on {database} (journal_mode={mode})")
+
+
+def readonly_uri(database):
+    """SQLite URI that opens ``database`` read-only"""
+    return f"file:{quote(os.path.abspath(database))}?mode=ro"
+
+
+def create_pools(database, mode=STORAGE_MODE, max_readers=8):
+    """Build the (writer, reader) pools for a storage mode
+
+    In WAL mode there is a single writer connection, and readers are opened with
+    ``mode=ro`` so a dashboard query can never take the write lock. In rollback
+    mode the same read-write pool is returned for both roles.
+    """
+    if mode == 'rollback':
+        pool = ConnectionPool(database, max_size=max_readers)
+        return pool, pool
+    if mode != 'wal':
+        raise ValueError(f"Unknown storage mode: {mode!r}")
+
+    enable_wal(database)
+    writer = ConnectionPool(database, max_size=1, on_connect=apply_wal_pragmas)
+    reader = ConnectionPool(
+        readonly_uri(database),
+        max_size=max_readers,
+        connect_kwargs={'uri': True},
+        on_connect=apply_wal_pragmas,
+    )
+    return writer, reader
+
+
+# ==================== PROCESS-WIDE POOLS ====================
+_pool = None
+_reader_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(initializer=None):
+    """Return the process-wide read-write pool, creating it on first use
+
+    The schema is created once per process, followed by ``initializer(conn)``
+    (e.g. sample data) if given. Later calls return the existing pool. In WAL
+    mode this is the single writer; use ``read_sql``/``get_reader_pool`` for reads.
+    """
+    global _pool, _reader_pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                writer, reader = create_pools(
+                    DB_PATH,
+                    STORAGE_MODE,
+                    max_readers=int(os.environ.get('GSK_DB_POOL_SIZE', 8)),
+                )
+                with writer.connection() as conn:
+                    init_schema(conn)
+                    if initializer is not None:
+                        initializer(conn)
+                _reader_pool = reader
+                _pool = writer
+    return _pool
+
+
+def get_reader_pool():
+    """Return the process-wide pool used for dashboard reads"""
+    get_pool()
+    return _reader_pool
+
+
+def read_sql(query, params=None):
+    """Run a SELECT on a pooled reader connection and return a DataFrame"""
+    with get_reader_pool().connection() as conn:
+        return pd.read_sql_query(query, conn, params=params)
+
+
+def close_pool():
+    """Close the process-wide pools (used on shutdown and in scripts)"""
+    global _pool, _reader_pool
+    with _pool_lock:
+        if _reader_pool is not None and _reader_pool is not _pool:
+            _reader_pool.close()
+        if _pool is not None:
+            _pool.close()
+        _pool = None
+        _reader_pool = None
+
+
+# ==================== INCREMENTAL ROLLUPS ====================
+def high_water(conn, name):
+    """Arrival key of the last source row folded into rollup ``name``"""
+    return conn.execute("SELECT high_water FROM rollup_state WHERE name = ?", (name,)).fetchone()[0]
+
+
+def _latest(conn, name):
+    source, key, _ = ROLLUPS[name]
+    return conn.execute(f"SELECT MAX({key}) FROM {source}").fetchone()[0] or 0
+
+
+def refresh_rollup(name, fold, recompute=None, batch_rows=1_000_000, pool=None):
+    """Bring rollup ``name`` up to date with its source table
+
+    Dirty keys are handed to ``recompute(conn, keys, high_water)`` first, with
+    ``keys`` as a list of dirty-table rows. Source rows above the high-water
+    mark are then folded by ``fold(conn, low, high)``, which covers the arrival
+    keys in (low, high]. Each range spans at most ``batch_rows`` keys and runs in
+    its own transaction, so the writer is released between batches. Both
+    callbacks return a dict of counts, such as ``{'rows': n}``. The report
+    sums those counts and adds the new high-water mark, the number of dirty
+    keys and the elapsed seconds.
+    """
+    pool = pool or get_pool()
+    started = time.perf_counter()
+    totals = Counter(rows=0)
+    dirty_table = ROLLUPS[name][2]
+    dirty = []
+    if dirty_table is not None:
+        with pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            dirty = conn.execute(f"SELECT * FROM {dirty_table}").fetchall()
+            if dirty:
+                totals.update(recompute(conn, dirty, high_water(conn, name)))
+                conn.execute(f"DELETE FROM {dirty_table}")
+            conn.commit()
+
+    while True:
+        with pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            low = high_water(conn, name)
+            latest = _latest(conn, name)
+            if latest <= low:
+                conn.rollback()
+                break
+            high = min(latest, low + batch_rows)
+            totals.update(fold(conn, low, high))
+            conn.execute("UPDATE rollup_state SET high_water = ?, refreshed_at = CURRENT_TIMESTAMP "
+                         "WHERE name = ?", (high, name))
+            conn.commit()
+    return dict(totals, high_water=low, dirty=len(dirty), seconds=time.perf_counter() - started)
+
+
+def rebuild_rollup(name, tables, refresh, pool=None):
+    """Empty the rollup's ``tables`` and dirty list, reset its high-water mark and ``refresh(pool)``"""
+    pool = pool or get_pool()
+    dirty_table = ROLLUPS[name][2]
+    with pool.connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for table in tuple(tables) + ((dirty_table,) if dirty_table else ()):
+            conn.execute(f"DELETE FROM {table}")
+        conn.execute("UPDATE rollup_state SET high_water = 0 WHERE name = ?", (name,))
+        conn.commit()
+    return refresh(pool)
+
+
+def ensure_fresh(name, refresh):
+    """Call ``refresh()`` if rollup ``name`` has unfolded or dirty rows; a cheap read otherwise"""
+    dirty_table = ROLLUPS[name][2]
+    with get_reader_pool().connection() as conn:
+        stale = (_latest(conn, name) > high_water(conn, name)
+                 or (dirty_table is not None
+                     and conn.execute(f"SELECT EXISTS (SELECT 1 FROM {dirty_table})").fetchone()[0]))
+    if stale:
+        refresh()
+
+
+def rollup_main(description, actions, argv=None):
+    """Command line shared by the rollup modules
+
+    ``actions`` maps each action name to a function that runs it and returns
+    the message to print, or ``(message, exit_status)``.
+    """
+    global DB_PATH
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('action', choices=list(actions))
+    parser.add_argument('--database', default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    DB_PATH = args.database
+    try:
+        result = actions[args.action]()
+    finally:
+        close_pool()
+    message, status = result if isinstance(result, tuple) else (result, 0)
+    print(message)
+    return status
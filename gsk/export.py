@@ -0,0 +1,118 @@
+"""
+Streaming exports for query results
+
+The original CSV path turned a DataFrame into a list of dicts, rebuilt a
+DataFrame from it, rendered the whole CSV as one string and then encoded it,
+all on every rerun. The exporters below are generators. They pull a bounded
+number of rows at a time, either straight from a SQLite cursor or by slicing
+a DataFrame, and yield encoded (optionally gzip-compressed) byte chunks. Peak
+memory depends on ``chunk_rows``, not on the size of the result.
+
+``csv_download`` and ``pdf_download`` return deferred callables for
+st.download_button. The PDF one imports gsk.reports (and so reportlab) on
+the first click, not when the page renders. A deferred callable must return
+``bytes``, ``str`` or an ``io`` stream: Streamlit reads the whole download
+into memory either way, and rejects other file objects when it is clicked.
+"""
+
+import csv
+import io
+import zlib
+
+from gsk import db
+
+CHUNK_ROWS = 10_000
+
+
+def _gzip_stream(chunks, level=6):
+    """Gzip-compress an iterable of byte chunks incrementally"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+def iter_csv_rows(header, row_batches, encoding='utf-8'):
+    """Encode a header and an iterable of row lists as CSV byte chunks"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(header)
+    for rows in row_batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode(encoding)
+        buffer.seek(0)
+        buffer.truncate()
+    tail = buffer.getvalue()
+    if tail:
+        yield tail.encode(encoding)
+
+
+def iter_csv_from_cursor(cursor, chunk_rows=CHUNK_ROWS, compress=False):
+    """Stream an executed cursor's result set as CSV bytes via fetchmany()"""
+    header = [col[0] for col in cursor.description]
+
+    def batches():
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                return
+            yield rows
+
+    chunks = iter_csv_rows(header, batches())
+    return _gzip_stream(chunks) if compress else chunks
+
+
+def iter_csv_from_frame(df, chunk_rows=CHUNK_ROWS, compress=False):
+    """Stream a DataFrame as CSV bytes, one row slice at a time"""
+    def chunks():
+        for start in range(0, max(len(df), 1), chunk_rows):
+            part = df.iloc[start:start + chunk_rows]
+            yield part.to_csv(index=False, header=start == 0, lineterminator='\n').encode()
+
+    return _gzip_stream(chunks()) if compress else chunks()
+
+
+def iter_query_csv(query, params=None, chunk_rows=CHUNK_ROWS, compress=False):
+    """Run ``query`` on a pooled reader connection and stream the result as CSV bytes"""
+    with db.get_reader_pool().connection() as conn:
+        cursor = conn.execute(query, params or ())
+        try:
+            yield from iter_csv_from_cursor(cursor, chunk_rows, compress)
+        finally:
+            cursor.close()
+
+
+def csv_download(query=None, params=None, df=None, compress=False):
+    """Deferred ``data`` callable for st.download_button
+
+    Nothing is generated until the user actually clicks the button. The export
+    then streams from the database (``query``) or from an in-memory ``df``.
+    """
+    if (query is None) == (df is None):
+        raise ValueError("Pass exactly one of query= or df=")
+
+    def generate():
+        if query is not None:
+            return b''.join(iter_query_csv(query, params, compress=compress))
+        return b''.join(iter_csv_from_frame(df, compress=compress))
+
+    return generate
+
+
+def pdf_download(title, query=None, params=None, df=None, **kwargs):
+    """Deferred ``data`` callable for a paginated PDF table report (see gsk.reports)"""
+    if (query is None) == (df is None):
+        raise ValueError("Pass exactly one of query= or df=")
+
+    def generate():
+        from gsk.reports import report_from_query, report_from_records
+        if query is not None:
+            out = report_from_query(title, query, params, **kwargs)
+        else:
+            out = report_from_records(title, df, **kwargs)
+        with out:  # spooled temp file: only a buffer while the report is drawn
+            return out.read()
+
+    return generate
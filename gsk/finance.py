@@ -0,0 +1,130 @@
+"""
+Financial reporting rollups over the general ledger
+
+The finance page used to invent a month x category grid on every rerun, one
+``np.random.uniform`` call per cell, and then make three groupby passes over
+it. It now reads ``financial_ledger`` (schema in gsk.db), one row per
+journal line with month, category, cost center, revenue, expenses and budget.
+
+SQLite does all of the aggregation. Each report is a GROUP BY over the
+covering index idx_financial_ledger_month_category. The month filter is a
+range seek on the index, groups come out in index order without a sort, and
+the amounts are read from the index rather than the table. Window functions
+then add the running year-to-date totals, each category's share of expenses
+and its profit rank. Only chart-sized results reach Python: one row per
+month and one row per category, however many ledger lines there are. Both
+go through the shared result cache (gsk.cache), so reruns skip SQLite until
+the ledger changes. benchmarks/bench_financial_rollup.py compares this with
+loading the ledger into pandas.
+"""
+
+import pandas as pd
+
+from gsk import query
+from gsk.cache import cached_query
+
+MONTHLY_COLUMNS = ['month', 'revenue', 'expenses', 'profit', 'budget', 'budget_variance',
+                   'ytd_revenue', 'ytd_expenses', 'ytd_profit', 'ytd_budget', 'ytd_variance']
+CATEGORY_COLUMNS = ['category', 'revenue', 'expenses', 'profit', 'budget', 'budget_variance',
+                    'expense_share', 'profit_rank']
+
+
+def ledger_dimensions():
+    """First and last ledger month, categories and cost centers, or None for an empty ledger
+
+    The DISTINCT lists scan the index, so they are cached until the ledger changes.
+    """
+    span = cached_query("SELECT MIN(month) AS first, MAX(month) AS last FROM financial_ledger")
+    if span['first'].isna().all():
+        return None
+    categories = cached_query("SELECT DISTINCT category FROM financial_ledger ORDER BY category")
+    centers = cached_query('''
+        SELECT DISTINCT cost_center FROM financial_ledger
+        WHERE cost_center IS NOT NULL ORDER BY cost_center
+    ''')
+    return {
+        'first_month': span['first'].iloc[0],
+        'last_month': span['last'].iloc[0],
+        'categories': categories['category'].tolist(),
+        'cost_centers': centers['cost_center'].tolist(),
+    }
+
+
+def _filters(start=None, end=None, categories=None, cost_centers=None):
+    """Month range ('YYYY-MM', inclusive) and category/cost-center lists; None means unfiltered"""
+    return (query.select('financial_ledger')
+            .between('month', start, end)
+            .where('category', 'in', categories)
+            .where('cost_center', 'in', cost_centers))
+
+
+def monthly_summary(start=None, end=None, categories=None, cost_centers=None):
+    """One row per month: totals, profit, budget variance and running year-to-date sums"""
+    where, params = _filters(start, end, categories, cost_centers).where_sql()
+    return cached_query(f'''
+        SELECT month, revenue, expenses, revenue - expenses AS profit,
+               budget, expenses - budget AS budget_variance,
+               SUM(revenue) OVER ytd AS ytd_revenue,
+               SUM(expenses) OVER ytd AS ytd_expenses,
+               SUM(revenue - expenses) OVER ytd AS ytd_profit,
+               SUM(budget) OVER ytd AS ytd_budget,
+               SUM(expenses - budget) OVER ytd AS ytd_variance
+        FROM (
+            SELECT month, TOTAL(revenue) AS revenue, TOTAL(expenses) AS expenses,
+                   TOTAL(budget) AS budget
+            FROM financial_ledger
+            {where}
+            GROUP BY month
+        )
+        WINDOW ytd AS (PARTITION BY substr(month, 1, 4) ORDER BY month ROWS UNBOUNDED PRECEDING)
+        ORDER BY month
+    ''', params)
+
+
+def category_summary(start=None, end=None, categories=None, cost_centers=None):
+    """One row per category: totals, budget variance, share of expenses and profit rank
+
+    The inner GROUP BY follows the index order (month, category), so the
+    ledger lines are never sorted. Only the month x category cells are
+    regrouped by category.
+    """
+    where, params = _filters(start, end, categories, cost_centers).where_sql()
+    return cached_query(f'''
+        SELECT category, revenue, expenses, revenue - expenses AS profit,
+               budget, expenses - budget AS budget_variance,
+               expenses / NULLIF(SUM(expenses) OVER (), 0) AS expense_share,
+               RANK() OVER (ORDER BY revenue - expenses DESC) AS profit_rank
+        FROM (
+            SELECT category, TOTAL(revenue) AS revenue, TOTAL(expenses) AS expenses,
+                   TOTAL(budget) AS budget
+            FROM (
+                SELECT month, category, TOTAL(revenue) AS revenue, TOTAL(expenses) AS expenses,
+                       TOTAL(budget) AS budget
+                FROM financial_ledger
+                {where}
+                GROUP BY month, category
+            )
+            GROUP BY category
+        )
+        ORDER BY category
+    ''', params)
+
+
+def financial_report(start=None, end=None, categories=None, cost_centers=None):
+    """KPIs plus the monthly and per-category rollups for the filters"""
+    if (categories is not None and not categories) or (cost_centers is not None and not cost_centers):
+        monthly = pd.DataFrame(columns=MONTHLY_COLUMNS)
+        by_category = pd.DataFrame(columns=CATEGORY_COLUMNS)
+    else:
+        monthly = monthly_summary(start, end, categories, cost_centers)
+        by_category = category_summary(start, end, categories, cost_centers)
+    revenue = float(monthly['revenue'].sum())
+    expenses = float(monthly['expenses'].sum())
+    kpis = {
+        'total_revenue': revenue,
+        'total_expenses': expenses,
+        'net_profit': revenue - expenses,
+        'margin': (revenue - expenses) / revenue * 100 if revenue else 0.0,
+        'budget_variance': float(monthly['budget_variance'].sum()),
+    }
+    return {'kpis': kpis, 'monthly': monthly, 'by_category': by_category}
@@ -0,0 +1,198 @@
+"""
+Resource governor for ad-hoc SQL (the Query Builder's "Custom Query")
+
+A typed query runs on a shared pooled reader connection. Without limits, a
+single cross join could hold that connection and a CPU core indefinitely. The
+governor gives each statement three budgets:
+
+* VM steps: sqlite3's progress handler is called every ``PROGRESS_STEPS``
+  virtual-machine instructions, and returning non-zero aborts the statement.
+* Wall clock: the same handler checks a deadline. A watchdog timer also calls
+  ``conn.interrupt()`` shortly after the deadline, which covers stretches
+  where no VM instructions run (a large sort, waiting on a lock).
+* Rows: the result is fetched in ``FETCH_ROWS`` batches, and no more than
+  ``max_rows`` rows are materialized.
+
+Rows read before a budget ran out are returned, with ``truncated=True`` and
+the reason. Kills and truncations are counted in ``stats()``, and the most
+recent ones are kept for display. ``governed_query`` runs through the shared
+result cache (gsk.cache), which stores only complete results.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import pandas as pd
+
+from gsk import cache, db
+
+QUERY_TIMEOUT = float(os.environ.get('GSK_QUERY_TIMEOUT', 5.0))           # seconds
+QUERY_MAX_STEPS = int(os.environ.get('GSK_QUERY_MAX_STEPS', 200_000_000))  # VM instructions
+QUERY_MAX_ROWS = int(os.environ.get('GSK_QUERY_MAX_ROWS', 100_000))
+PROGRESS_STEPS = 10_000
+FETCH_ROWS = 5_000
+INTERRUPT_GRACE = 0.5  # seconds past the deadline before the watchdog interrupts
+
+REASONS = {
+    'timeout': "the time limit",
+    'steps': "the VM step budget",
+    'rows': "the row limit",
+}
+COUNTERS = {'timeout': 'killed_timeout', 'steps': 'killed_steps', 'rows': 'truncated_rows'}
+
+
+@dataclass(frozen=True)
+class GovernedResult:
+    """Rows read for one governed statement and how the run ended"""
+    frame: pd.DataFrame
+    truncated: bool = False
+    reason: str = None  # 'timeout' | 'steps' | 'rows' when truncated
+    seconds: float = 0.0
+    steps: int = 0
+
+    def message(self):
+        """Human-readable truncation notice, or None for a complete result"""
+        if not self.truncated:
+            return None
+        if self.frame.empty:
+            return f"Stopped: the query hit {REASONS[self.reason]} after {self.seconds:.1f}s before returning rows"
+        return (f"Truncated: the query hit {REASONS[self.reason]} after {self.seconds:.1f}s; "
+                f"showing the first {len(self.frame):,} rows")
+
+
+class QueryGovernor:
+    """Runs statements under step, time and row budgets; thread-safe"""
+
+    def __init__(self, timeout=QUERY_TIMEOUT, max_steps=QUERY_MAX_STEPS, max_rows=QUERY_MAX_ROWS):
+        self.timeout = timeout
+        self.max_steps = max_steps
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._stats = {'queries': 0, 'completed': 0, 'killed_timeout': 0, 'killed_steps': 0,
+                       'truncated_rows': 0, 'errors': 0, 'rows': 0, 'seconds_total': 0.0}
+        self._kills = deque(maxlen=20)
+
+    def execute(self, conn, query, params=None):
+        """Run ``query`` on ``conn`` under the budgets and return a GovernedResult"""
+        started = time.monotonic()
+        deadline = started + self.timeout
+        state = {'steps': 0, 'reason': None, 'done': False}
+        done_lock = threading.Lock()
+
+        def progress():
+            state['steps'] += PROGRESS_STEPS
+            if state['steps'] > self.max_steps:
+                state['reason'] = 'steps'
+                return 1
+            if time.monotonic() > deadline:
+                state['reason'] = 'timeout'
+                return 1
+            return 0
+
+        def watchdog():
+            with done_lock:  # never interrupt the connection once it may be back in the pool
+                if state['done']:
+                    return
+                if state['reason'] is None:
+                    state['reason'] = 'timeout'
+                conn.interrupt()
+
+        timer = threading.Timer(self.timeout + INTERRUPT_GRACE, watchdog)
+        timer.daemon = True
+        conn.set_progress_handler(progress, PROGRESS_STEPS)
+        timer.start()
+        columns, rows = [], []
+        cursor = None
+        try:
+            cursor = conn.execute(query, params or ())
+            columns = [col[0] for col in cursor.description or ()]
+            while len(rows) < self.max_rows:
+                batch = cursor.fetchmany(min(FETCH_ROWS, self.max_rows - len(rows)))
+                if not batch:
+                    break
+                rows.extend(batch)
+            else:
+                if cursor.fetchone() is not None:
+                    state['reason'] = 'rows'
+        except sqlite3.Error:
+            if state['reason'] is None:  # a genuine SQL error, not one of our kills
+                self._record(None, time.monotonic() - started, 0, query, error=True)
+                raise
+        finally:
+            with done_lock:
+                state['done'] = True
+            timer.cancel()
+            conn.set_progress_handler(None, 0)
+            if cursor is not None:
+                cursor.close()
+
+        seconds = time.monotonic() - started
+        result = GovernedResult(pd.DataFrame.from_records(rows, columns=columns),
+                                truncated=state['reason'] is not None, reason=state['reason'],
+                                seconds=seconds, steps=state['steps'])
+        self._record(result.reason, seconds, len(rows), query)
+        return result
+
+    def run(self, query, params=None):
+        """Governed statement on a pooled reader connection"""
+        with db.get_reader_pool().connection() as conn:
+            return self.execute(conn, query, params)
+
+    def _record(self, reason, seconds, rows, query, error=False):
+        with self._lock:
+            self._stats['queries'] += 1
+            self._stats['rows'] += rows
+            self._stats['seconds_total'] += seconds
+            if error:
+                self._stats['errors'] += 1
+            elif reason is None:
+                self._stats['completed'] += 1
+            else:
+                self._stats[COUNTERS[reason]] += 1
+                self._kills.append({'at': time.time(), 'reason': reason, 'seconds': round(seconds, 3),
+                                    'rows': rows, 'query': ' '.join(query.split())[:200]})
+
+    def stats(self):
+        """Query, kill and truncation counters plus the limits in force"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(timeout=self.timeout, max_steps=self.max_steps, max_rows=self.max_rows)
+        return stats
+
+    def recent_kills(self):
+        """The last few killed or truncated statements, newest first"""
+        with self._lock:
+            return list(reversed(self._kills))
+
+
+# ==================== PROCESS-WIDE GOVERNOR ====================
+_governor = None
+_governor_lock = threading.Lock()
+
+
+def get_governor():
+    """Return the process-wide query governor"""
+    global _governor
+    if _governor is None:
+        with _governor_lock:
+            if _governor is None:
+                _governor = QueryGovernor()
+    return _governor
+
+
+def governed_query(query, params=None, bypass=False):
+    """GovernedResult for ``query``, served from the result cache when possible"""
+    governor = get_governor()
+    runs = []
+
+    def loader(conn, query, params):
+        result = governor.execute(conn, query, params)
+        runs.append(result)
+        return result.frame, not result.truncated
+
+    frame = cache.cached_query(query, params, bypass, loader)
+    return runs[0] if runs else GovernedResult(frame)
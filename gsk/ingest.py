@@ -0,0 +1,296 @@
+"""
+Bulk loader for gsk_enterprise.db
+
+Streams CSV or Parquet exports into clinical_trials, drug_pipeline, sales_data,
+quality_control, employees, financial_ledger, analytics, research_studies,
+equipment and equipment_telemetry in bounded-size chunks. Rows
+are written with executemany inside large transactions. Non-unique secondary indexes on the target table
+are dropped before the load and rebuilt once at the end. The per-row
+triggers that bump a cached table's version (gsk.db) are dropped too, and the
+version is bumped once per transaction instead. Loads into sales_data
+and quality_control finish by folding the new rows into the sales cube
+(gsk.sales) and the SPC state (gsk.spc). Loads into research_studies refresh
+the search index's term counts (gsk.research). Loads into equipment and
+equipment_telemetry rescore the instruments they touch (gsk.maintenance).
+
+Usage:
+    python -m gsk.ingest sales_data exports/sales_2024.parquet
+    python -m gsk.ingest clinical_trials trials.csv --mode update --chunksize 200000
+"""
+
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from gsk import db
+from gsk.maintenance import refresh_equipment_risk
+from gsk.research import refresh_search_terms
+from gsk.sales import refresh_sales_cube
+from gsk.spc import refresh_spc
+
+# Loadable tables: column order, conflict key and DATE columns
+TABLES = {
+    'clinical_trials': {
+        'columns': ['trial_id', 'drug_name', 'phase', 'status', 'start_date',
+                    'patients_enrolled', 'success_rate', 'therapeutic_area'],
+        'key': 'trial_id',
+        'dates': ['start_date'],
+    },
+    'drug_pipeline': {
+        'columns': ['drug_id', 'drug_name', 'stage', 'indication', 'market_potential',
+                    'timeline_months', 'investment'],
+        'key': 'drug_id',
+        'dates': [],
+    },
+    'sales_data': {
+        'columns': ['sale_id', 'product_name', 'region', 'revenue', 'units_sold', 'sale_date'],
+        'key': 'sale_id',
+        'autoincrement': True,
+        'dates': ['sale_date'],
+    },
+    'quality_control': {
+        'columns': ['batch_id', 'product', 'test_date', 'test_result', 'compliance_score', 'site'],
+        'key': 'batch_id',
+        'dates': ['test_date'],
+    },
+    'employees': {
+        'columns': ['employee_id', 'department', 'tenure_years', 'performance_score',
+                    'satisfaction_score', 'training_hours'],
+        'key': 'employee_id',
+        'dates': [],
+    },
+    'financial_ledger': {
+        'columns': ['entry_id', 'month', 'category', 'cost_center', 'revenue', 'expenses', 'budget'],
+        'key': 'entry_id',
+        'autoincrement': True,
+        'dates': [],
+    },
+    'analytics': {
+        'columns': ['id', 'tool_name', 'access_time', 'session_id'],
+        'key': 'id',
+        'autoincrement': True,
+        'dates': [],
+        'timestamps': ['access_time'],
+    },
+    'equipment': {
+        'columns': ['equipment_id', 'equipment_name', 'equipment_type', 'location',
+                    'maintenance_interval_days'],
+        'key': 'equipment_id',
+        'dates': [],
+    },
+    'equipment_telemetry': {
+        'columns': ['reading_id', 'equipment_id', 'reading_date', 'utilization', 'error_count',
+                    'maintenance'],
+        'key': 'reading_id',
+        'autoincrement': True,
+        'dates': ['reading_date'],
+    },
+    'research_studies': {
+        'columns': ['study_id', 'title', 'abstract', 'study_type', 'therapeutic_area', 'status',
+                    'published', 'citations'],
+        'key': 'study_id',
+        'dates': ['published'],
+    },
+}
+
+# Derived state folded forward after a load, instead of on the first page view
+REFRESHERS = {
+    'sales_data': refresh_sales_cube,
+    'quality_control': refresh_spc,
+    'research_studies': refresh_search_terms,
+    'equipment': refresh_equipment_risk,
+    'equipment_telemetry': refresh_equipment_risk,
+}
+
+# Conflict handling; 'ignore' matches the INSERT OR IGNORE used by the sample data
+MODES = ('ignore', 'update')
+
+
+def insert_sql(table, columns, mode='ignore'):
+    """INSERT statement for ``columns`` with the requested conflict handling"""
+    spec = TABLES[table]
+    placeholders = ','.join('?' * len(columns))
+    col_list = ', '.join(columns)
+    if mode == 'ignore':
+        return f"INSERT OR IGNORE INTO {table} ({col_list}) VALUES ({placeholders})"
+    if mode == 'update':
+        updates = ', '.join(f"{c} = excluded.{c}" for c in columns if c != spec['key'])
+        return (f"INSERT INTO {table} ({col_list}) VALUES ({placeholders}) "
+                f"ON CONFLICT ({spec['key']}) DO UPDATE SET {updates}")
+    raise ValueError(f"Unknown mode {mode!r}; expected one of {MODES}")
+
+
+def _prepare(table, frame):
+    """Validate columns and convert a chunk into executemany-ready tuples"""
+    spec = TABLES[table]
+    unknown = [c for c in frame.columns if c not in spec['columns']]
+    if unknown:
+        raise ValueError(f"Unknown columns for {table}: {unknown}")
+    if spec['key'] not in frame.columns and not spec.get('autoincrement'):
+        raise ValueError(f"{table} rows need a {spec['key']} column")
+
+    columns = [c for c in spec['columns'] if c in frame.columns]
+    values = []
+    for col in columns:
+        series = frame[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            if col in spec['dates']:
+                series = series.dt.strftime('%Y-%m-%d')
+            elif col in spec.get('timestamps', ()):
+                series = series.dt.strftime('%Y-%m-%d %H:%M:%S')
+        # tolist() yields Python scalars; NaN/None bind as NULL
+        values.append(series.tolist())
+    return columns, zip(*values)
+
+
+def _drop_secondary_indexes(conn, table):
+    """Drop non-unique indexes on ``table`` and return their DDL for rebuilding"""
+    indexes = []
+    for _, name, unique, origin, _ in conn.execute(f"PRAGMA index_list({table})").fetchall():
+        if unique or origin != 'c':
+            continue
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'index' AND name = ?",
+                           (name,)).fetchone()[0]
+        indexes.append((name, sql))
+    for name, _ in indexes:
+        conn.execute(f"DROP INDEX {name}")
+    conn.commit()
+    return indexes
+
+
+def _drop_version_triggers(conn, table):
+    """Drop ``table``'s change-counter triggers and return their DDL for recreating"""
+    triggers = conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' "
+                            "AND tbl_name = ? AND name LIKE ?", (table, f"trg_{table}_version_%")).fetchall()
+    for name, _ in triggers:
+        conn.execute(f"DROP TRIGGER {name}")
+    conn.commit()
+    return triggers
+
+
+def insert_frame(conn, table, frame, mode='ignore'):
+    """Insert one DataFrame chunk on ``conn`` inside the caller's transaction"""
+    columns, params = _prepare(table, frame)
+    conn.executemany(insert_sql(table, columns, mode), params)
+
+
+def load_frames(table, frames, mode='ignore', commit_every=500_000, defer_indexes=True,
+                pool=None, progress=None):
+    """Write an iterable of DataFrame chunks into ``table``
+
+    Chunks are grouped into transactions of roughly ``commit_every`` rows. The
+    writer connection is returned to the pool between transactions, so other
+    writers (e.g. the analytics flusher) get a turn. Returns a report dict with
+    rows, seconds and rows_per_sec.
+    """
+    if table not in TABLES:
+        raise ValueError(f"Cannot bulk load {table!r}; expected one of {sorted(TABLES)}")
+    pool = pool or db.get_pool()
+    started = time.perf_counter()
+    rows = 0
+    chunks = 0
+
+    with pool.connection() as conn:
+        dropped = _drop_secondary_indexes(conn, table) if defer_indexes else []
+        triggers = _drop_version_triggers(conn, table)
+
+    try:
+        frames = iter(frames)
+        done = False
+        while not done:
+            with pool.connection() as conn:
+                conn.execute("BEGIN")
+                in_txn = 0
+                while in_txn < commit_every:
+                    frame = next(frames, None)
+                    if frame is None:
+                        done = True
+                        break
+                    if frame.empty:
+                        continue
+                    insert_frame(conn, table, frame, mode)
+                    in_txn += len(frame)
+                    rows += len(frame)
+                    chunks += 1
+                    if progress is not None:
+                        progress(rows, time.perf_counter() - started)
+                if triggers and in_txn:
+                    db.bump_table_version(conn, table)
+                conn.commit()
+    finally:
+        if triggers:
+            # Covers writes from other connections while the triggers were gone
+            with pool.connection() as conn:
+                for _, sql in triggers:
+                    conn.execute(sql)
+                db.bump_table_version(conn, table)
+                conn.commit()
+        if dropped:
+            with pool.connection() as conn:
+                for _, sql in dropped:
+                    conn.execute(sql)
+                conn.execute(f"ANALYZE {table}")
+                conn.commit()
+
+    seconds = time.perf_counter() - started
+    rollup_seconds = REFRESHERS[table](pool)['seconds'] if table in REFRESHERS else 0.0
+    return {
+        'table': table,
+        'rows': rows,
+        'chunks': chunks,
+        'seconds': seconds,
+        'rows_per_sec': rows / seconds if seconds > 0 else 0.0,
+        'indexes_rebuilt': [name for name, _ in dropped],
+        'rollup_seconds': rollup_seconds,
+    }
+
+
+def read_chunks(path, fmt=None, chunksize=100_000):
+    """Stream a CSV or Parquet file as DataFrame chunks"""
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.').lower()
+    if fmt in ('csv', 'gz', 'txt'):
+        yield from pd.read_csv(path, chunksize=chunksize)
+    elif fmt in ('parquet', 'pq'):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported file format {fmt!r}; use csv or parquet")
+
+
+def load_file(table, path, fmt=None, chunksize=100_000, mode='ignore', **kwargs):
+    """Bulk load one CSV/Parquet export into ``table``"""
+    return load_frames(table, read_chunks(path, fmt, chunksize), mode=mode, **kwargs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk load CSV/Parquet exports into gsk_enterprise.db")
+    parser.add_argument('table', choices=sorted(TABLES))
+    parser.add_argument('files', nargs='+', help="CSV or Parquet files")
+    parser.add_argument('--format', choices=['csv', 'parquet'], help="Override format detection")
+    parser.add_argument('--mode', choices=MODES, default='ignore',
+                        help="Conflict handling on the primary key (default: ignore)")
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--commit-every', type=int, default=500_000)
+    parser.add_argument('--database', default=db.DB_PATH)
+    args = parser.parse_args(argv)
+
+    db.DB_PATH = args.database
+
+    def progress(rows, elapsed):
+        print(f"\r  {rows:,} rows  {rows / elapsed if elapsed else 0:,.0f} rows/s", end='', flush=True)
+
+    for path in args.files:
+        print(f"Loading {path} -> {args.table}")
+        report = load_file(args.table, path, fmt=args.format, chunksize=args.chunksize,
+                           mode=args.mode, commit_every=args.commit_every, progress=progress)
+        print(f"\r  {report['rows']:,} rows in {report['seconds']:.1f}s "
+              f"({report['rows_per_sec']:,.0f} rows/s)")
+    db.close_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+"""
+Fleet-wide predictive maintenance scores for lab equipment
+
+The equipment page used to invent 20 instruments on every rerun and call
+``100 - maintenance_score`` their failure risk. Instruments now report one
+``equipment_telemetry`` reading per day: utilization (%), error count and
+whether they were serviced that day. The ``equipment`` registry holds each
+instrument's name, location and maintenance interval (schema in gsk.db).
+
+Each instrument's features live in ``equipment_risk``:
+
+- utilization EWMAs over about a week (``FAST_SPAN`` readings) and a month
+  (``SLOW_SPAN``); their difference is the utilization trend
+- an EWMA of the daily error count (``ERROR_SPAN``)
+- the last service date and the days since it, as of the latest reading
+
+``risk_score`` combines them, with the days since service measured against
+the instrument's interval, into a 0-100 failure risk.
+
+Readings are folded in in arrival (reading_id) order, above the high-water
+mark in rollup_state (db.refresh_rollup), like the SPC state (gsk.spc). An exponentially
+weighted average needs only its last value: folding m new readings onto it
+is ``(1 - α)^m`` times the old value plus a weighted sum of the readings.
+``ewma_fold`` computes those sums for every instrument with one
+``np.bincount``, so a refresh costs time in proportion to the new readings,
+however large the fleet's history. The dashboard reads the stored scores and
+never recomputes them.
+
+Edits or deletions of readings that have already been folded, and changes to
+an instrument's maintenance interval, mark the instrument in
+``equipment_risk_dirty`` (triggers in gsk.db). Its features are recomputed on
+the next refresh.
+
+Usage:
+    python -m gsk.maintenance refresh
+    python -m gsk.maintenance rebuild
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from gsk import db
+
+STATE = 'equipment_risk'
+FAST_SPAN = 7     # readings (days) in the short utilization EWMA
+SLOW_SPAN = 30    # ... in the long one
+ERROR_SPAN = 14   # ... in the error-count EWMA
+DEFAULT_INTERVAL = 90  # days between services for instruments missing from the registry
+
+# Feature column -> (telemetry column, span)
+EWMA_FEATURES = {
+    'utilization_fast': ('utilization', FAST_SPAN),
+    'utilization_slow': ('utilization', SLOW_SPAN),
+    'error_rate': ('error_count', ERROR_SPAN),
+}
+
+# Logistic risk model: weights on service overdue-ness (days since service /
+# interval), errors per day, rising utilization (points per trend) and load
+RISK_WEIGHTS = {
+    'intercept': -6.0,
+    'overdue': 2.5,
+    'error_rate': 1.2,
+    'utilization_trend': 0.15,
+    'utilization': 2.0,
+}
+RISK_BOUNDS = [20, 40]  # upper score of Low, then Medium
+RISK_LEVELS = np.array(['Low', 'Medium', 'High'])
+
+STATE_COLUMNS = ['equipment_id', 'readings', 'utilization_fast', 'utilization_slow', 'utilization_trend',
+                 'error_rate', 'first_reading_date', 'last_reading_date', 'last_maintenance',
+                 'days_since_maintenance', 'maintenance_interval_days', 'risk_score', 'risk_level']
+_READING_COLUMNS = "reading_id, equipment_id, reading_date, utilization, error_count, maintenance"
+
+
+# ==================== FEATURES AND SCORING ====================
+def ewma_fold(codes, values, prior, span):
+    """Last EWMA of each group after folding ``values`` onto ``prior``
+
+    ``codes`` are contiguous group numbers 0..k-1 with each group's values in
+    arrival order. ``prior`` holds each group's previous EWMA, or NaN for a
+    new group, which starts from its first value as pandas'
+    ``ewm(span, adjust=False)`` does.
+    """
+    alpha = 2 / (span + 1)
+    counts = np.bincount(codes)
+    starts = np.cumsum(counts) - counts
+    remaining = (counts - 1)[codes] - (np.arange(len(codes)) - starts[codes])
+    weights = alpha * (1 - alpha) ** remaining
+    prior = np.where(np.isnan(prior), values[starts], prior)
+    return (1 - alpha) ** counts * prior + np.bincount(codes, weights * values, minlength=len(counts))
+
+
+def risk_score(days_since_maintenance, interval, error_rate, utilization_trend, utilization):
+    """Failure risk (0-100) from the maintenance features; works on scalars or arrays"""
+    w = RISK_WEIGHTS
+    z = (w['intercept']
+         + w['overdue'] * np.asarray(days_since_maintenance, dtype=float) / np.maximum(interval, 1)
+         + w['error_rate'] * np.asarray(error_rate, dtype=float)
+         + w['utilization_trend'] * np.maximum(utilization_trend, 0)
+         + w['utilization'] * np.asarray(utilization, dtype=float) / 100)
+    return 100 / (1 + np.exp(-z))
+
+
+def risk_level(scores):
+    """'Low', 'Medium' or 'High' for each score"""
+    return RISK_LEVELS[np.searchsorted(RISK_BOUNDS, np.asarray(scores, dtype=float))]
+
+
+# ==================== STATE MAINTENANCE ====================
+def _for_ids(conn, sql, ids, params=()):
+    """``sql`` with its ``:ids`` placeholder bound to the equipment ids as one JSON array"""
+    return pd.read_sql_query(sql.replace(':ids', '(SELECT value FROM json_each(?))'), conn,
+                             params=(json.dumps(list(ids)),) + tuple(params))
+
+
+def _fold(conn, rows):
+    """Merge telemetry rows into equipment_risk and rescore their instruments; returns the count"""
+    if rows.empty:
+        return 0
+    rows = rows.sort_values(['equipment_id', 'reading_id'], kind='stable')
+    codes, ids = pd.factorize(rows['equipment_id'])
+    state = _for_ids(conn, "SELECT * FROM equipment_risk WHERE equipment_id IN :ids", ids)
+    state = state.set_index('equipment_id').reindex(ids)
+    registry = _for_ids(conn, "SELECT equipment_id, maintenance_interval_days FROM equipment "
+                              "WHERE equipment_id IN :ids", ids)
+    interval = (registry.set_index('equipment_id')['maintenance_interval_days'].reindex(ids)
+                .fillna(DEFAULT_INTERVAL).to_numpy(dtype=float))
+
+    updated = pd.DataFrame({'equipment_id': ids})
+    prior = np.nan_to_num(state['readings'].to_numpy(dtype=float))
+    updated['readings'] = prior.astype(np.int64) + np.bincount(codes)
+    for column, (source, span) in EWMA_FEATURES.items():
+        updated[column] = ewma_fold(codes, rows[source].to_numpy(dtype=float),
+                                    state[column].to_numpy(dtype=float), span)
+    updated['utilization_trend'] = updated['utilization_fast'] - updated['utilization_slow']
+
+    dates = pd.to_datetime(rows['reading_date']).to_numpy()
+    serviced = rows['maintenance'].to_numpy() != 0
+    by_id = pd.Series(dates).groupby(codes)
+    first = np.fmin(pd.to_datetime(state['first_reading_date']).to_numpy(), by_id.min().to_numpy())
+    last = np.fmax(pd.to_datetime(state['last_reading_date']).to_numpy(), by_id.max().to_numpy())
+    service = pd.Series(dates[serviced]).groupby(codes[serviced]).max().reindex(range(len(ids)))
+    service = np.fmax(pd.to_datetime(state['last_maintenance']).to_numpy(), service.to_numpy())
+    since = np.where(np.isnat(service), first, service)
+    updated['first_reading_date'] = pd.DatetimeIndex(first).strftime('%Y-%m-%d')
+    updated['last_reading_date'] = pd.DatetimeIndex(last).strftime('%Y-%m-%d')
+    updated['last_maintenance'] = pd.DatetimeIndex(service).strftime('%Y-%m-%d')
+    updated['days_since_maintenance'] = ((last - since) // np.timedelta64(1, 'D')).astype(np.int64)
+    updated['maintenance_interval_days'] = interval.astype(np.int64)
+
+    updated['risk_score'] = risk_score(updated['days_since_maintenance'], interval, updated['error_rate'],
+                                       updated['utilization_trend'], updated['utilization_slow'])
+    updated['risk_level'] = risk_level(updated['risk_score'])
+    conn.executemany(f"INSERT OR REPLACE INTO equipment_risk ({', '.join(STATE_COLUMNS)}) "
+                     f"VALUES ({','.join('?' * len(STATE_COLUMNS))})",
+                     updated[STATE_COLUMNS].astype(object).where(updated.notna(), None)
+                     .itertuples(index=False, name=None))
+    return len(ids)
+
+
+def _recompute(conn, dirty, high_water):
+    """Rebuild the features of instruments whose folded readings or interval changed"""
+    ids = [equipment_id for equipment_id, in dirty]
+    conn.execute("DELETE FROM equipment_risk WHERE equipment_id IN (SELECT value FROM json_each(?))",
+                 (json.dumps(ids),))
+    rows = _for_ids(conn, f"SELECT {_READING_COLUMNS} FROM equipment_telemetry "
+                          f"WHERE equipment_id IN :ids AND reading_id <= ?", ids, (high_water,))
+    return {'scored': _fold(conn, rows)}
+
+
+def _fold_range(conn, low, high):
+    """Fold the readings with reading_id in (low, high]"""
+    rows = pd.read_sql_query(f'''
+        SELECT {_READING_COLUMNS} FROM equipment_telemetry
+        WHERE reading_id > ? AND reading_id <= ?
+    ''', conn, params=(low, high))
+    return {'rows': len(rows), 'scored': _fold(conn, rows)}
+
+
+def refresh_equipment_risk(pool=None, batch_rows=1_000_000):
+    """Fold new telemetry into equipment_risk and rescore the instruments it touches
+
+    Dirty instruments are recomputed first. New readings are then folded in
+    reading_id ranges of ``batch_rows``, one transaction each
+    (db.refresh_rollup). Returns a report dict.
+    """
+    report = db.refresh_rollup(STATE, _fold_range, _recompute, batch_rows, pool)
+    report.setdefault('scored', 0)
+    return report
+
+
+def rebuild_equipment_risk(pool=None):
+    """Drop every stored feature and score and fold all telemetry again"""
+    return db.rebuild_rollup(STATE, ['equipment_risk'], refresh_equipment_risk, pool)
+
+
+def ensure_fresh():
+    """Refresh if new or edited telemetry arrived; a cheap read when nothing changed"""
+    db.ensure_fresh(STATE, refresh_equipment_risk)
+
+
+# ==================== DASHBOARD QUERIES ====================
+def fleet_risk():
+    """Stored features and score of every instrument with its registry details, riskiest first"""
+    ensure_fresh()
+    return db.read_sql('''
+        SELECT r.equipment_id, COALESCE(e.equipment_name, r.equipment_id) AS equipment_name,
+               e.equipment_type, e.location, r.readings, r.utilization_slow AS utilization,
+               r.utilization_trend, r.error_rate, r.last_reading_date, r.last_maintenance,
+               r.days_since_maintenance, r.maintenance_interval_days, r.risk_score, r.risk_level
+        FROM equipment_risk r LEFT JOIN equipment e USING (equipment_id)
+        ORDER BY r.risk_score DESC
+    ''')
+
+
+def equipment_history(equipment_id, limit=180):
+    """The latest ``limit`` readings of one instrument, oldest first"""
+    return db.read_sql(f'''
+        SELECT * FROM (
+            SELECT {_READING_COLUMNS} FROM equipment_telemetry
+            WHERE equipment_id = ? ORDER BY reading_date DESC LIMIT ?
+        ) ORDER BY reading_date
+    ''', (equipment_id, limit))
+
+
+def _describe(report):
+    return (f"Folded {report['rows']:,} readings in {report['seconds']:.1f}s; "
+            f"{report['scored']:,} instruments scored, {report['dirty']} recomputed")
+
+
+def main(argv=None):
+    return db.rollup_main("Maintain the lab equipment risk scores", {
+        'refresh': lambda: _describe(refresh_equipment_risk()),
+        'rebuild': lambda: _describe(rebuild_equipment_risk()),
+    }, argv)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
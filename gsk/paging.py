@@ -0,0 +1,140 @@
+"""
+Keyset pagination over gsk.query selects, for the paged grids (gsk.tools.grid)
+
+A page is a single index range scan that starts just after the last row of
+the previous page. The position is the cursor ``(sort value, primary key)``
+of that row, never an OFFSET, so page 1,000 costs the same as page 1. Rows
+are ordered by ``(sort column, primary key)``. The primary key breaks ties,
+so every row has exactly one position and no row is shown twice or skipped.
+
+A column can be sorted on only when an index delivers rows in that order
+(see ``sortable_columns``), so ORDER BY never needs a temporary B-tree. The
+schema (gsk.db) has ``(column, key)`` indexes for the grid columns.
+
+SQLite sorts NULLs first, and a row-value comparison with NULL is never
+true. A page is therefore read from two segments: NULL sort values ordered by
+key, and non-NULL values ordered by ``(value, key)``. For a descending sort
+the segments are read in reverse. Each segment is its own index seek. When
+the first segment runs out mid-page, the page is topped up from the second.
+
+Pages and the total row count go through the shared result cache
+(gsk.cache), so reruns and other sessions on the same page skip SQLite
+until the table changes.
+"""
+
+import pandas as pd
+
+from gsk import db
+from gsk.cache import cached_query
+
+# Primary key that orders and positions rows in each pageable table
+KEYS = {
+    'clinical_trials': 'trial_id',
+    'drug_pipeline': 'drug_id',
+    'quality_control': 'batch_id',
+    'sales_data': 'sale_id',
+}
+PAGE_ROWS = 50
+
+
+_index_lists = {}  # table -> (schema_version, column lists)
+
+
+def _indexes(table):
+    """Column lists of the indexes on ``table``
+
+    Cached per table until ``PRAGMA schema_version`` changes, so indexes that
+    ingest dropped and recreated are picked up again.
+    """
+    with db.get_reader_pool().connection() as conn:
+        version = conn.execute("PRAGMA schema_version").fetchone()[0]
+        cached = _index_lists.get(table)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        names = [row[1] for row in conn.execute(f"PRAGMA index_list({table})")]
+        indexes = tuple(tuple(row[2] for row in conn.execute(f"PRAGMA index_info({name})"))
+                        for name in names)
+    _index_lists[table] = (version, indexes)
+    return indexes
+
+
+def sortable_columns(select):
+    """Columns ``select`` can be paged by without a sort step, the primary key first
+
+    A column qualifies when an index lists it directly before the primary
+    key and every column before it is pinned by an equality filter.
+    """
+    key = KEYS[select.table]
+    pinned = {column for column, operator, _ in select.filters if operator == '='}
+    columns = [key]
+    for index in _indexes(select.table):
+        for position, column in enumerate(index[:-1]):
+            if index[position + 1] == key and set(index[:position]) <= pinned and column not in columns:
+                columns.append(column)
+    return columns
+
+
+def _plain(value):
+    """Cursor value as a bindable Python scalar (NaN/NaT -> None, numpy -> builtin)"""
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+
+def page(select, sort=None, descending=False, after=None, rows=PAGE_ROWS):
+    """(frame, cursor) for the page of ``select`` after cursor ``after``
+
+    ``after`` is None for the first page; ``cursor`` is None on the last.
+    """
+    key = KEYS[select.table]
+    sort = sort or key
+    if sort not in sortable_columns(select):
+        raise ValueError(f"No index orders {select.table} by {sort!r}")
+    direction, beyond = (' DESC', '<') if descending else ('', '>')
+    columns = list(dict.fromkeys(select.columns + (sort, key))) if select.columns else []
+    head = f"SELECT {', '.join(columns) or '*'} FROM {select.table}"
+    base, params = select.conditions()
+
+    if sort == key:
+        segments = [(None, f"ORDER BY {key}{direction}")]
+    else:
+        nulls = (f"{sort} IS NULL", f"ORDER BY {key}{direction}")
+        values = (f"{sort} IS NOT NULL", f"ORDER BY {sort}{direction}, {key}{direction}")
+        segments = [values, nulls] if descending else [nulls, values]
+        if after is not None:  # resume in the segment the cursor row came from
+            segments = segments[segments.index(nulls if after[0] is None else values):]
+
+    frames, wanted = [], rows + 1  # one extra row tells whether there is a next page
+    for number, (segment, order) in enumerate(segments):
+        clauses, bound = list(base) + ([segment] if segment else []), list(params)
+        if after is not None and number == 0:
+            if sort == key or after[0] is None:
+                clauses.append(f"{key} {beyond} ?")
+                bound.append(after[1])
+            else:
+                clauses.append(f"({sort}, {key}) {beyond} (?, ?)")
+                bound.extend(after)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+        frame = cached_query(f"{head}{where} {order} LIMIT ?", bound + [wanted])
+        frames.append(frame)
+        wanted -= len(frame)
+        if wanted <= 0:
+            break
+
+    if len(frames) == 1:
+        result = frames[0]
+    else:  # rebuilt from rows so a segment's all-NULL sort column does not decide the dtype
+        result = pd.DataFrame([row for frame in frames for row in frame.itertuples(index=False)],
+                              columns=frames[0].columns)
+    if len(result) <= rows:
+        return result, None
+    result = result.iloc[:rows]
+    last = result.iloc[-1]
+    return result, (_plain(last[sort]), _plain(last[key]))
+
+
+def count(select):
+    """Rows matching ``select``'s filters, from the result cache when it is current"""
+    where, params = select.where_sql()
+    frame = cached_query(f"SELECT COUNT(*) AS n FROM {select.table} {where}".rstrip(), params)
+    return int(frame['n'].iloc[0])
@@ -0,0 +1,165 @@
+"""
+Parameterized SELECTs for the clinical, pipeline, sales, QC and ledger tables
+
+``select(table)`` starts a query. ``where()``, ``order_by()`` and ``limit()``
+each return a new query, so callers can build a base query and add filters
+to it. Column names are checked against ``COLUMNS`` and values are coerced to
+the column's type. Values are always bound as parameters and never formatted
+into the SQL.
+
+The SQL text depends only on the shape of the query: which filters, which
+operators, ordering and whether there is a limit. It never depends on the
+values. IN lists bind a single JSON array read through ``json_each``, so
+picking a third product does not change the statement. LIMIT is bound too.
+A slider or multiselect therefore re-runs the same text on every rerun.
+sqlite3's per-connection statement cache then reuses the prepared statement
+on the pooled connections, and gsk.cache keys results by shape plus
+parameters. benchmarks/bench_query_builder.py measures the statement reuse.
+"""
+
+import json
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+
+from gsk import db
+
+# Column types per table; a filter value is coerced to its column's type
+COLUMNS = {
+    'clinical_trials': {
+        'trial_id': 'text', 'drug_name': 'text', 'phase': 'text', 'status': 'text',
+        'start_date': 'date', 'patients_enrolled': 'integer', 'success_rate': 'real',
+        'therapeutic_area': 'text',
+    },
+    'drug_pipeline': {
+        'drug_id': 'text', 'drug_name': 'text', 'stage': 'text', 'indication': 'text',
+        'market_potential': 'real', 'timeline_months': 'integer', 'investment': 'real',
+    },
+    'sales_data': {
+        'sale_id': 'integer', 'product_name': 'text', 'region': 'text', 'revenue': 'real',
+        'units_sold': 'integer', 'sale_date': 'date',
+    },
+    'quality_control': {
+        'batch_id': 'text', 'product': 'text', 'test_date': 'date', 'test_result': 'text',
+        'compliance_score': 'real', 'site': 'text',
+    },
+    'financial_ledger': {
+        'entry_id': 'integer', 'month': 'text', 'category': 'text', 'cost_center': 'text',
+        'revenue': 'real', 'expenses': 'real', 'budget': 'real',
+    },
+    'sales_cube': {
+        'product_name': 'text', 'region': 'text', 'month': 'text', 'revenue': 'real',
+        'units': 'integer', 'sales': 'integer', 'first_date': 'date', 'last_date': 'date',
+    },
+}
+
+COMPARISONS = ('=', '!=', '<', '<=', '>', '>=', 'like')
+LIST_OPERATORS = {'in': 'IN', 'not in': 'NOT IN'}
+
+
+def _date(value):
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if hasattr(value, 'strftime'):  # pandas / numpy timestamps
+        return value.strftime('%Y-%m-%d')
+    return date.fromisoformat(str(value)[:10]).isoformat()
+
+
+COERCE = {
+    'text': str,
+    'integer': int,
+    'real': float,
+    'date': _date,
+}
+
+
+def _coerce(table, column, value):
+    kind = COLUMNS[table][column]
+    try:
+        return COERCE[kind](value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"{table}.{column} expects {kind}, got {value!r}") from exc
+
+
+@dataclass(frozen=True)
+class Select:
+    """An immutable SELECT on one table; build with ``select()``"""
+    table: str
+    columns: tuple = ()
+    filters: tuple = ()  # (column, operator, bound value)
+    order: tuple = ()    # (column, descending)
+    max_rows: int = None
+
+    def __post_init__(self):
+        if self.table not in COLUMNS:
+            raise ValueError(f"No query builder schema for table {self.table!r}")
+        for column in self.columns:
+            self._check(column)
+
+    def _check(self, column):
+        if column not in COLUMNS[self.table]:
+            raise ValueError(f"Unknown column {column!r} for {self.table}")
+
+    def where(self, column, operator, value):
+        """Add ``column <operator> value`` (ANDed); a ``None`` value leaves the query unfiltered"""
+        if value is None:
+            return self
+        self._check(column)
+        operator = operator.lower()
+        if operator in LIST_OPERATORS:
+            value = json.dumps([_coerce(self.table, column, v) for v in value])
+        elif operator in COMPARISONS:
+            value = _coerce(self.table, column, value)
+        else:
+            raise ValueError(f"Unsupported operator {operator!r}")
+        return replace(self, filters=self.filters + ((column, operator, value),))
+
+    def between(self, column, low=None, high=None):
+        """Inclusive range; either bound may be ``None`` (open)"""
+        return self.where(column, '>=', low).where(column, '<=', high)
+
+    def order_by(self, column, descending=False):
+        self._check(column)
+        return replace(self, order=self.order + ((column, descending),))
+
+    def limit(self, rows):
+        return replace(self, max_rows=int(rows))
+
+    def conditions(self):
+        """([predicate, ...], params) for the filters, to be ANDed"""
+        clauses = []
+        for column, operator, _ in self.filters:
+            if operator in LIST_OPERATORS:
+                clauses.append(f"{column} {LIST_OPERATORS[operator]} (SELECT value FROM json_each(?))")
+            else:
+                clauses.append(f"{column} {operator.upper()} ?")
+        return clauses, [value for _, _, value in self.filters]
+
+    def where_sql(self):
+        """(``WHERE ...`` or '', params) for embedding the filters in a hand-written statement"""
+        clauses, params = self.conditions()
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ''), params
+
+    def sql(self):
+        """(statement, params); the statement text is the same for every query of this shape"""
+        where, params = self.where_sql()
+        parts = [f"SELECT {', '.join(self.columns) or '*'} FROM {self.table}"]
+        if where:
+            parts.append(where)
+        if self.order:
+            parts.append("ORDER BY " + ', '.join(f"{c} DESC" if d else c for c, d in self.order))
+        if self.max_rows is not None:
+            parts.append("LIMIT ?")
+            params.append(self.max_rows)
+        return ' '.join(parts), params
+
+    def read(self):
+        """Run on a pooled reader connection and return a DataFrame"""
+        statement, params = self.sql()
+        return db.read_sql(statement, params)
+
+
+def select(table, *columns):
+    """Start a query on ``table`` returning ``columns`` (all columns when omitted)"""
+    return Select(table, tuple(columns))
@@ -0,0 +1,289 @@
+"""
+Full-text search over the research repository
+
+research_studies is indexed by ``research_studies_fts``, an external content
+FTS5 table over title, abstract, therapeutic area and a one-token study type
+(schema and sync triggers in gsk.db). ``search_studies`` turns the search box
+into an FTS5 query: every word must match, and the last word also matches as a
+prefix so results update while a term is still being typed. A type filter is
+one more MATCH term on ``study_kind``, so it narrows the posting lists instead
+of filtering rows afterwards.
+
+Results are ranked by BM25 (title 4x, area 2x, abstract 1x) with a snippet of
+the matching abstract text. Plain ``ORDER BY rank`` costs time in proportion
+to the number of matches, which is seconds for a common word in a million
+studies. Three things keep a query bounded:
+
+- Only the ``RANK_WINDOW`` most recent matches are ranked. Their rowids are
+  collected by walking the doclists newest first and stopping early. A query
+  with fewer matches is ranked exactly. Terms that are not ranked and the type
+  filter are applied after scoring, so the window also shrinks until BM25
+  scores at most ``RANK_ROWS`` rows.
+- BM25 reads the whole doclist of every ranked term to count its documents.
+  research_terms keeps each term's study count (``refresh_search_terms``,
+  run after bulk loads), so ranking uses the rarest terms within a budget of
+  ``RANK_POSTINGS``. Frequent terms still filter, and terms in more than half
+  of all studies have no BM25 weight anyway. A query with no term left to rank
+  lists its matches newest first.
+- FTS5 answers a prefix by building its whole expanded doclist first. Two and
+  three character prefixes read one doclist from the prefix index instead.
+  Longer ones become an OR of their completions from research_terms, merged
+  lazily, and only fall back to FTS5's expansion for a prefix with more than
+  ``MAX_COMPLETIONS`` completions that are all rare. Otherwise the
+  most frequent ``MAX_COMPLETIONS`` completions are used.
+
+Usage:
+    python -m gsk.research refresh
+    python -m gsk.research rebuild
+    python -m gsk.research search "copd inhal" --type Clinical
+"""
+
+import argparse
+import json
+import re
+import time
+
+import pandas as pd
+
+from gsk import db
+
+STUDY_TYPES = ['Clinical', 'Pre-clinical', 'Publications']
+STUDY_STATUSES = ['Active', 'Completed', 'Published']
+
+RANK_WINDOW = 2_000        # most recent matches ranked by BM25
+RANK_ROWS = 8_000          # rows BM25 may score for them, before filters
+RANK_POSTINGS = 250_000    # doclist entries BM25 may read to weight the ranked terms
+PREFIX_POSTINGS = 50_000   # larger prefix expansions use the top completions instead
+MAX_COMPLETIONS = 8
+INDEXED_PREFIXES = (2, 3)  # prefix='2 3' on research_studies_fts
+HIGHLIGHT = ('**', '**')   # markdown bold around matched terms
+SNIPPET_TOKENS = 24
+
+RESULT_COLUMNS = ['study_id', 'title', 'snippet', 'study_type', 'therapeutic_area', 'status',
+                  'published', 'citations', 'relevance']
+
+_RESULT_SELECT = '''
+    SELECT s.study_id,
+           highlight(research_studies_fts, 0, :open, :close) AS title,
+           snippet(research_studies_fts, 1, :open, :close, '…', :tokens) AS snippet,
+           s.study_type, s.therapeutic_area, s.status, s.published, s.citations,
+           {relevance} AS relevance
+    FROM research_studies_fts
+    JOIN research_studies s ON s.id = research_studies_fts.rowid
+'''
+
+
+# ==================== QUERY PLANNING ====================
+def kind_token(study_type):
+    """Index token for a study type ('Pre-clinical' -> 'preclinical'); see gsk.db"""
+    return study_type.lower().replace('-', '').replace(' ', '')
+
+
+def query_terms(text):
+    """(term, is_prefix) pairs for the search box text, tokenized like the index"""
+    words = re.findall(r'[^\W_]+', text.lower())
+    # The last word matches as a prefix; one character would expand to most of the vocabulary
+    return [(word, i == len(words) - 1 and len(word) > 1) for i, word in enumerate(words)]
+
+
+def phrase(term, prefix=False):
+    """FTS5 phrase for one query term"""
+    return f'"{term}"*' if prefix else f'"{term}"'
+
+
+def match_expression(phrases, study_type=None):
+    """FTS5 MATCH string requiring every phrase (and the study type, if given)"""
+    phrases = list(phrases)
+    if study_type is not None:
+        phrases.append(f'study_kind : "{kind_token(study_type)}"')
+    return ' AND '.join(phrases)
+
+
+def _term_studies(conn, term, prefix):
+    """[(term, studies)] from research_terms for a word or, most frequent first, its completions"""
+    if not prefix:
+        return conn.execute("SELECT term, studies FROM research_terms WHERE term = ?",
+                            (term,)).fetchall()
+    upper = term[:-1] + chr(ord(term[-1]) + 1)
+    return conn.execute("SELECT term, studies FROM research_terms WHERE term >= ? AND term < ? "
+                        "ORDER BY studies DESC", (term, upper)).fetchall()
+
+
+def plan_terms(conn, terms):
+    """(phrase, studies, ranked) for each query term
+
+    ``studies`` is the number of studies the phrase reads through when BM25
+    weights it (0 if the term is newer than research_terms). Terms are ranked
+    rarest first while they fit in ``RANK_POSTINGS``.
+    """
+    total = conn.execute("SELECT COALESCE(SUM(studies), 0) FROM research_study_counts").fetchone()[0]
+    planned = []
+    for term, prefix in terms:
+        if prefix and len(term) in INDEXED_PREFIXES:
+            # One doclist in the prefix index, but too unspecific to rank by
+            planned.append((phrase(term, True), None))
+            continue
+        known = _term_studies(conn, term, prefix)
+        studies = sum(count for _, count in known)
+        if prefix and known and (len(known) <= MAX_COMPLETIONS or studies > PREFIX_POSTINGS):
+            # OR-ed terms are merged lazily; FTS5 would build the whole prefix doclist first
+            top = known[:MAX_COMPLETIONS]
+            words = dict.fromkeys([term] + [completion for completion, _ in top])
+            planned.append((f"({' OR '.join(phrase(word) for word in words)})",
+                            sum(count for _, count in top)))
+        else:
+            planned.append((phrase(term, prefix), studies))
+
+    ranked = set()
+    budget = RANK_POSTINGS
+    weighted = [i for i, (_, studies) in enumerate(planned) if studies is not None]
+    for i in sorted(weighted, key=lambda i: planned[i][1]):
+        studies = planned[i][1]
+        if studies <= total / 2 and studies <= budget:
+            ranked.add(i)
+            budget -= studies
+    return [(p, studies, i in ranked) for i, (p, studies) in enumerate(planned)]
+
+
+# ==================== SEARCH ====================
+def browse_studies(study_type=None, limit=20):
+    """Most recently published studies, optionally of one type (the empty-search view)"""
+    where = "WHERE study_type = ?" if study_type is not None else ''
+    params = [study_type] if study_type is not None else []
+    return db.read_sql(f'''
+        SELECT study_id, title, substr(abstract, 1, 240) || '…' AS snippet, study_type,
+               therapeutic_area, status, published, citations, NULL AS relevance
+        FROM research_studies
+        {where}
+        ORDER BY published DESC
+        LIMIT ?
+    ''', params + [limit])
+
+
+def search_studies(text, study_type=None, limit=20, window=RANK_WINDOW):
+    """BM25-ranked studies matching the search box text
+
+    Returns a dict with ``results`` (DataFrame of RESULT_COLUMNS, title and
+    snippet highlighted with ``**``), ``matches`` (capped at ``window`` + 1),
+    ``capped`` (more matches than were ranked) and ``ranked_by`` ('bm25',
+    'recency', or 'published' for an empty search).
+    """
+    terms = query_terms(text or '')
+    if not terms:
+        results = browse_studies(study_type, limit)
+        return {'results': results, 'matches': len(results), 'capped': False, 'ranked_by': 'published'}
+
+    params = {'open': HIGHLIGHT[0], 'close': HIGHLIGHT[1], 'tokens': SNIPPET_TOKENS, 'limit': limit}
+    with db.get_reader_pool().connection() as conn:
+        conn.execute("BEGIN")
+        try:
+            planned = plan_terms(conn, terms)
+            query = params['query'] = match_expression((p for p, _, _ in planned), study_type)
+            rowids = [row[0] for row in conn.execute(
+                "SELECT rowid FROM research_studies_fts WHERE research_studies_fts MATCH ? "
+                "ORDER BY rowid DESC LIMIT ?", (query, window + 1))]
+            capped = len(rowids) > window
+            ranking = [p for p, _, ranked in planned if ranked]
+
+            if not rowids:
+                results = pd.DataFrame(columns=RESULT_COLUMNS)
+            elif not ranking:
+                results = pd.read_sql_query(
+                    _RESULT_SELECT.format(relevance='NULL') + "WHERE research_studies_fts MATCH :query "
+                    "ORDER BY research_studies_fts.rowid DESC LIMIT :limit", conn, params=params)
+            else:
+                params['ranking'] = match_expression(ranking)
+                params['cut'] = rowids[min(window, len(rowids)) - 1]
+                sql = _RESULT_SELECT.format(relevance='-research_studies_fts.rank') + '''
+                    WHERE research_studies_fts MATCH :ranking AND research_studies_fts.rowid >= :cut
+                '''
+                if params['ranking'] != query:
+                    # BM25 scores every row matching the ranked terms, so selective
+                    # filters shrink the window to the newest RANK_ROWS of those
+                    nth = conn.execute(
+                        "SELECT rowid FROM research_studies_fts WHERE research_studies_fts MATCH ? "
+                        "ORDER BY rowid DESC LIMIT 1 OFFSET ?", (params['ranking'], RANK_ROWS - 1)).fetchone()
+                    if nth is not None:
+                        params['cut'] = max(params['cut'], nth[0])
+                    # Unranked terms and the type must still match. The unary + makes
+                    # the rowid list a filter rather than one FTS lookup per rowid.
+                    params['window'] = json.dumps([rowid for rowid in rowids if rowid >= params['cut']])
+                    sql += "AND +research_studies_fts.rowid IN (SELECT value FROM json_each(:window)) "
+                sql += "ORDER BY research_studies_fts.rank LIMIT :limit"
+                results = pd.read_sql_query(sql, conn, params=params)
+        finally:
+            conn.rollback()
+    return {'results': results, 'matches': len(rowids), 'capped': capped,
+            'ranked_by': 'bm25' if ranking else 'recency'}
+
+
+def study_counts(study_type=None):
+    """Studies and citations per type, therapeutic area and status (trigger-maintained)"""
+    where = "AND study_type = ?" if study_type is not None else ''
+    params = [study_type] if study_type is not None else []
+    return db.read_sql(f'''
+        SELECT study_type, therapeutic_area, status, studies, citations
+        FROM research_study_counts
+        WHERE studies > 0 {where}
+    ''', params)
+
+
+# ==================== INDEX MAINTENANCE ====================
+def refresh_search_terms(pool=None):
+    """Recompute research_terms (studies per indexed term) from the FTS vocabulary
+
+    Counting documents walks every doclist, so this runs after bulk loads
+    (gsk.ingest) rather than per query. Stale counts only affect speed and
+    which terms are ranked, never which studies match.
+    """
+    pool = pool or db.get_pool()
+    started = time.perf_counter()
+    with db.get_reader_pool().connection() as conn:
+        terms = conn.execute("SELECT term, doc FROM research_studies_vocab").fetchall()
+    with pool.connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM research_terms")
+        conn.executemany("INSERT INTO research_terms (term, studies) VALUES (?, ?)", terms)
+        conn.commit()
+    return {'terms': len(terms), 'seconds': time.perf_counter() - started}
+
+
+def rebuild_search_index(pool=None):
+    """Rebuild research_studies_fts from research_studies and merge it into one segment"""
+    pool = pool or db.get_pool()
+    started = time.perf_counter()
+    with pool.connection() as conn:
+        conn.execute("INSERT INTO research_studies_fts (research_studies_fts) VALUES ('rebuild')")
+        conn.execute("INSERT INTO research_studies_fts (research_studies_fts) VALUES ('optimize')")
+        conn.commit()
+    report = refresh_search_terms(pool)
+    report['seconds'] = time.perf_counter() - started
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain and query the research search index")
+    parser.add_argument('action', choices=['refresh', 'rebuild', 'search'])
+    parser.add_argument('text', nargs='?', default='')
+    parser.add_argument('--type', choices=STUDY_TYPES)
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--database', default=db.DB_PATH)
+    args = parser.parse_args(argv)
+
+    db.DB_PATH = args.database
+    if args.action == 'search':
+        started = time.perf_counter()
+        found = search_studies(args.text, args.type, args.limit)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"{found['matches'] - found['capped']:,}{'+' if found['capped'] else ''} matches, "
+              f"ranked by {found['ranked_by']} in {elapsed:.1f} ms")
+        for row in found['results'].itertuples():
+            print(f"\n{row.study_id}  {row.title}\n    {row.snippet}")
+    else:
+        report = (refresh_search_terms if args.action == 'refresh' else rebuild_search_index)()
+        print(f"{report['terms']:,} indexed terms ({report['seconds']:.1f}s)")
+    db.close_pool()
+
+
+if __name__ == '__main__':
+    main()
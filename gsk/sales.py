@@ -0,0 +1,242 @@
+"""
+Sales analytics over a pre-aggregated product x region x month cube
+
+The sales pages used to make up 500 rows on every rerun and filter them in
+pandas. Filters now run against ``sales_cube``, which holds one row of
+revenue, units and order count per product, region and month (schema and
+maintenance triggers in gsk.db). A dashboard query therefore reads a few
+hundred cube rows, however many sales there are.
+
+New sales are folded into the cube in bulk. ``refresh_sales_cube`` aggregates
+the sales_data rows above the ``sale_id`` high-water mark kept in
+rollup_state, then advances the mark. Rows at or below the mark that are later
+inserted, updated or deleted are patched into the cube by triggers, so the
+cube stays exact. A date range that starts or ends mid-month is answered from
+the cube for its whole months, plus the partial edge months read from
+sales_data through the covering index idx_sales_data_product_region_date.
+``check_sales_cube`` recomputes the cube from the raw table to verify this.
+
+Usage:
+    python -m gsk.sales refresh
+    python -m gsk.sales check
+    python -m gsk.sales rebuild
+"""
+
+import pandas as pd
+
+from gsk import db, query
+
+CUBE = 'sales_cube'
+ROLLUP_COLUMNS = ['product', 'region', 'month', 'revenue', 'units', 'sales']
+
+_REFRESH_SQL = '''
+    INSERT INTO sales_cube (product_name, region, month, revenue, units, sales,
+                            first_date, last_date)
+    SELECT product_name, region, substr(sale_date, 1, 7),
+           TOTAL(revenue), TOTAL(units_sold), COUNT(*), MIN(sale_date), MAX(sale_date)
+    FROM sales_data
+    WHERE sale_id > ? AND sale_id <= ?
+      AND product_name IS NOT NULL AND region IS NOT NULL AND sale_date IS NOT NULL
+    GROUP BY product_name, region, substr(sale_date, 1, 7)
+    ON CONFLICT (product_name, region, month) DO UPDATE SET
+        revenue = revenue + excluded.revenue,
+        units = units + excluded.units,
+        sales = sales + excluded.sales,
+        first_date = MIN(first_date, excluded.first_date),
+        last_date = MAX(last_date, excluded.last_date)
+'''
+
+
+# ==================== CUBE MAINTENANCE ====================
+def _fold(conn, low, high):
+    """Add the sales with sale_id in (low, high] to their cube cells"""
+    before = conn.execute("SELECT TOTAL(sales) FROM sales_cube").fetchone()[0]
+    conn.execute(_REFRESH_SQL, (low, high))
+    return {'rows': int(conn.execute("SELECT TOTAL(sales) FROM sales_cube").fetchone()[0] - before)}
+
+
+def refresh_sales_cube(pool=None, batch_ids=5_000_000):
+    """Fold sales_data rows above the high-water mark into sales_cube
+
+    Work is split into ``sale_id`` ranges of ``batch_ids``, one transaction
+    each (db.refresh_rollup). Returns a report dict with the new high-water
+    mark and the number of rows folded.
+    """
+    return db.refresh_rollup(CUBE, _fold, batch_rows=batch_ids, pool=pool)
+
+
+def rebuild_sales_cube(pool=None):
+    """Empty the cube, reset its high-water mark and fold in every sale again"""
+    return db.rebuild_rollup(CUBE, ['sales_cube'], refresh_sales_cube, pool)
+
+
+def ensure_fresh():
+    """Refresh the cube if new sales arrived; a cheap read when nothing changed"""
+    db.ensure_fresh(CUBE, refresh_sales_cube)
+
+
+def check_sales_cube(tolerance=1e-6):
+    """Compare sales_cube with a full GROUP BY over sales_data up to the high-water mark
+
+    Both sides are read in one snapshot. Returns the cells that differ (empty
+    when the cube is consistent), with ``_expected`` and ``_cube`` columns.
+    """
+    keys = ['product_name', 'region', 'month']
+    with db.get_reader_pool().connection() as conn:
+        conn.execute("BEGIN")
+        try:
+            expected = pd.read_sql_query('''
+                SELECT product_name, region, substr(sale_date, 1, 7) AS month,
+                       TOTAL(revenue) AS revenue, CAST(TOTAL(units_sold) AS INTEGER) AS units,
+                       COUNT(*) AS sales, MIN(sale_date) AS first_date, MAX(sale_date) AS last_date
+                FROM sales_data
+                WHERE sale_id <= ? AND product_name IS NOT NULL AND region IS NOT NULL
+                  AND sale_date IS NOT NULL
+                GROUP BY product_name, region, substr(sale_date, 1, 7)
+            ''', conn, params=(db.high_water(conn, CUBE),))
+            actual = pd.read_sql_query(
+                "SELECT product_name, region, month, revenue, units, sales, first_date, last_date "
+                "FROM sales_cube", conn)
+        finally:
+            conn.rollback()
+
+    merged = expected.merge(actual, on=keys, how='outer', suffixes=('_expected', '_cube'))
+    merged = merged.fillna({c: 0 for c in merged.columns if c not in keys and not c.endswith('date')})
+    revenue_diff = (merged['revenue_expected'] - merged['revenue_cube']).abs()
+    bad = ((revenue_diff > tolerance * merged['revenue_expected'].abs().clip(lower=1.0))
+           | (merged['units_expected'] != merged['units_cube'])
+           | (merged['sales_expected'] != merged['sales_cube'])
+           | (merged['first_date_expected'] != merged['first_date_cube'])
+           | (merged['last_date_expected'] != merged['last_date_cube']))
+    return merged[bad].reset_index(drop=True)
+
+
+# ==================== DASHBOARD QUERIES ====================
+def sales_dimensions():
+    """(product, region, first_date, last_date) for every pair present in the cube"""
+    ensure_fresh()
+    return db.read_sql('''
+        SELECT product_name AS product, region,
+               MIN(first_date) AS first_date, MAX(last_date) AS last_date
+        FROM sales_cube
+        GROUP BY product_name, region
+    ''')
+
+
+def _filters(table, products, regions, column, low=None, high=None):
+    """Product/region/range filters as a gsk.query Select; None means unfiltered
+
+    The product and region lists are bound as JSON arrays, so the statement
+    text is the same whatever the selection and its prepared statement is reused.
+    """
+    return (query.select(table)
+            .where('product_name', 'in', products)
+            .where('region', 'in', regions)
+            .between(column, low, high))
+
+
+def split_date_range(start=None, end=None):
+    """Split [start, end] into whole months for the cube and partial-month edges
+
+    Returns ``((first_month, last_month) or None, [(edge_start, edge_end), ...])``
+    with months as 'YYYY-MM' and edge dates as 'YYYY-MM-DD'. Open bounds stay None.
+    """
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+    first = start if start is None or start.day == 1 else start + pd.offsets.MonthBegin(1)
+    last = end if end is None or end.is_month_end else end - pd.offsets.MonthEnd(1)
+    day = pd.Timedelta(days=1)
+    iso = '%Y-%m-%d'
+
+    if first is not None and last is not None and first > last:
+        return None, [(start.strftime(iso), end.strftime(iso))]
+    edges = []
+    if start is not None and start < first:
+        edges.append((start.strftime(iso), (first - day).strftime(iso)))
+    if end is not None and end > last:
+        edges.append(((last + day).strftime(iso), end.strftime(iso)))
+    months = (first.strftime('%Y-%m') if first is not None else None,
+              last.strftime('%Y-%m') if last is not None else None)
+    return months, edges
+
+
+def daily_sales(products=None, regions=None, start=None, end=None):
+    """Revenue, units and order count per product, region and day, straight from sales_data"""
+    where, params = _filters('sales_data', products, regions, 'sale_date', start, end).where_sql()
+    return db.read_sql(f'''
+        SELECT product_name AS product, region, sale_date,
+               SUM(revenue) AS revenue, SUM(units_sold) AS units, COUNT(*) AS sales
+        FROM sales_data
+        {where}
+        GROUP BY product_name, region, sale_date
+    ''', params)
+
+
+def sales_rollup(products=None, regions=None, start=None, end=None):
+    """Monthly revenue, units and order count per product and region for the filters"""
+    if (products is not None and not products) or (regions is not None and not regions):
+        return pd.DataFrame(columns=ROLLUP_COLUMNS)
+    ensure_fresh()
+    months, edges = split_date_range(start, end)
+
+    parts = []
+    if months is not None:
+        where, params = _filters(CUBE, products, regions, 'month', *months).where_sql()
+        parts.append(db.read_sql(f'''
+            SELECT product_name AS product, region, month, revenue, units, sales
+            FROM sales_cube
+            {where}
+        ''', params))
+    for edge_start, edge_end in edges:
+        daily = daily_sales(products, regions, edge_start, edge_end)
+        daily['month'] = daily['sale_date'].str[:7]
+        parts.append(daily.groupby(['product', 'region', 'month'], as_index=False)
+                     [['revenue', 'units', 'sales']].sum())
+    parts = [part for part in parts if not part.empty]
+    if not parts:
+        return pd.DataFrame(columns=ROLLUP_COLUMNS)
+    return pd.concat(parts, ignore_index=True)[ROLLUP_COLUMNS]
+
+
+def summarize(rollup):
+    """KPI totals and the monthly/region/product breakdowns of a monthly rollup"""
+    revenue = float(rollup['revenue'].sum())
+    sales = int(rollup['sales'].sum())
+    kpis = {
+        'total_revenue': revenue,
+        'total_units': int(rollup['units'].sum()),
+        'orders': sales,
+        'avg_deal_size': revenue / sales if sales else 0.0,
+        'products_sold': int(rollup.loc[rollup['sales'] > 0, 'product'].nunique()),
+    }
+    return {
+        'kpis': kpis,
+        'monthly': rollup.groupby('month')['revenue'].sum().reset_index(),
+        'by_region': rollup.groupby('region')['revenue'].sum().reset_index(),
+        'by_product': rollup.groupby('product')['revenue'].sum().reset_index(),
+    }
+
+
+def _check():
+    mismatches = check_sales_cube()
+    if mismatches.empty:
+        return "sales_cube is consistent with sales_data"
+    return (f"{len(mismatches):,} inconsistent cells\n"
+            f"{mismatches.head(20).to_string(index=False)}", 1)
+
+
+def _describe(report):
+    return (f"Folded {report['rows']:,} rows in {report['seconds']:.1f}s "
+            f"(high-water mark {report['high_water']:,})")
+
+
+def main(argv=None):
+    return db.rollup_main("Maintain the sales_cube rollup", {
+        'refresh': lambda: _describe(refresh_sales_cube()),
+        'check': _check,
+        'rebuild': lambda: _describe(rebuild_sales_cube()),
+    }, argv)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,206 @@
+"""
+Vectorized Monte Carlo engine for the Clinical Trial Simulator
+
+The page used to loop ``for _ in range(num_simulations)``, drawing one binomial
+per pass and appending a dict. Every simulated trial has the same number of
+completers and the same success probability. That means the outcome of a run
+is fully described by a histogram over 0..completed successes, and every
+summary statistic (mean, percentile CI, tail probabilities) can be read off
+that histogram exactly.
+
+Two sampling paths share a seeded ``numpy.random.Generator``:
+
+- histogram only (default): one multinomial draw over the binomial pmf gives
+  the success-count histogram of N independent trials, in O(completed) time
+  regardless of N;
+- ``keep_samples=True``: one batched ``Generator.binomial`` call returns the
+  per-simulation success counts as a compact int32 array.
+
+For scenario studies beyond what one core can sample trial by trial,
+``simulate_trials_parallel`` splits the work into fixed-size chunks across a
+process pool. Each chunk gets its own ``SeedSequence.spawn`` stream, and only
+per-chunk histograms come back to be summed. The histogram is exact, so it is
+also the percentile sketch.
+
+The simulator page calls ``run_trials``, which uses the chunked per-trial
+path at every size: in-process below ``PARALLEL_THRESHOLD`` simulations,
+across the pool above it. The chunking is the same either way, so a seed
+gives the same result on both sides of the threshold.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+# Simulations from which the page spreads chunks across processes; below it
+# pool start-up costs more than the chunks take in-process
+PARALLEL_THRESHOLD = int(os.environ.get('GSK_SIM_PARALLEL_THRESHOLD', 4_000_000))
+
+def binomial_pmf(n, p):
+    """P(X = k) for X ~ Binomial(n, p), k = 0..n, computed in log space"""
+    if n == 0 or p <= 0.0:
+        pmf = np.zeros(n + 1)
+        pmf[0] = 1.0
+        return pmf
+    if p >= 1.0:
+        pmf = np.zeros(n + 1)
+        pmf[n] = 1.0
+        return pmf
+    k = np.arange(1, n + 1)
+    log_choose = np.concatenate(([0.0], np.cumsum(np.log(n - k + 1) - np.log(k))))
+    ks = np.arange(n + 1)
+    log_pmf = log_choose + ks * np.log(p) + (n - ks) * np.log1p(-p)
+    pmf = np.exp(log_pmf - log_pmf.max())
+    return pmf / pmf.sum()
+
+
+def percentile_from_counts(counts, q):
+    """np.percentile(samples, q) (linear method) computed from a histogram of integer samples"""
+    cum = np.cumsum(counts)
+    total = cum[-1]
+    q = np.asarray(q, dtype=float)
+    h = (total - 1) * q / 100.0
+    lo = np.floor(h).astype(np.int64)
+    hi = np.minimum(lo + 1, total - 1)
+    x_lo = np.searchsorted(cum, lo, side='right')
+    x_hi = np.searchsorted(cum, hi, side='right')
+    return x_lo + (h - lo) * (x_hi - x_lo)
+
+
+@dataclass(frozen=True)
+class TrialSimulation:
+    """Outcome of a batch of simulated trials
+
+    ``counts[k]`` is the number of simulations with exactly ``k`` successes.
+    ``successes`` holds the per-simulation counts when they were requested.
+    """
+
+    enrolled: int
+    completed: int
+    counts: np.ndarray
+    successes: np.ndarray = None
+
+    @property
+    def num_simulations(self):
+        return int(self.counts.sum())
+
+    def _to_rate(self, k):
+        if self.completed == 0:
+            return np.zeros_like(np.asarray(k, dtype=float))
+        return (np.asarray(k) / self.completed) * 100
+
+    def success_rates(self):
+        """Per-simulation success rate (%) as float64; requires keep_samples=True"""
+        if self.successes is None:
+            raise ValueError("Simulation was run without keep_samples=True")
+        return self._to_rate(self.successes)
+
+    def percentile(self, q):
+        """Success-rate percentile(s) in %"""
+        return self._to_rate(percentile_from_counts(self.counts, q))
+
+    def probability(self, below=None, above=None):
+        """P(success rate < below) or P(success rate > above), in %"""
+        rates = self._to_rate(np.arange(len(self.counts)))
+        if below is not None:
+            mask = rates < below
+        elif above is not None:
+            mask = rates > above
+        else:
+            raise ValueError("Pass below= or above=")
+        return self.counts[mask].sum() / self.num_simulations * 100
+
+    def histogram(self, bins=50):
+        """(frequencies, bin_edges) of the success-rate distribution for plotting"""
+        rates = self._to_rate(np.arange(len(self.counts)))
+        return np.histogram(rates, bins=bins, weights=self.counts)
+
+    def summary(self, confidence_level=95):
+        """Statistics shown on the simulator page"""
+        k = np.arange(len(self.counts))
+        mean_successes = (self.counts * k).sum() / self.num_simulations
+        tail = (100 - confidence_level) / 2
+        lower, upper = self.percentile([tail, 100 - tail])
+        return {
+            'simulations': self.num_simulations,
+            'mean_completed': float(self.completed),
+            'mean_success_rate': float(self._to_rate(mean_successes)),
+            'ci_lower': float(lower),
+            'ci_upper': float(upper),
+            'prob_below_70': float(self.probability(below=70)),
+            'prob_above_80': float(self.probability(above=80)),
+        }
+
+
+def simulate_trials(num_patients, success_rate, dropout_rate, num_simulations,
+                    seed=None, keep_samples=False):
+    """Run ``num_simulations`` Monte Carlo trials in one batched draw
+
+    ``success_rate`` and ``dropout_rate`` are percentages, as on the page.
+    ``seed`` may be an int, a ``SeedSequence`` or a ``Generator``.
+    """
+    rng = np.random.default_rng(seed)
+    completed = int(num_patients * (1 - dropout_rate / 100))
+    p = success_rate / 100
+
+    successes = None
+    if keep_samples:
+        dtype = np.int32 if completed < np.iinfo(np.int32).max else np.int64
+        successes = rng.binomial(completed, p, size=num_simulations).astype(dtype, copy=False)
+        counts = np.bincount(successes, minlength=completed + 1)
+    else:
+        counts = rng.multinomial(num_simulations, binomial_pmf(completed, p))
+
+    return TrialSimulation(enrolled=num_patients, completed=completed,
+                           counts=counts, successes=successes)
+
+
+# ==================== PARALLEL EXECUTION ====================
+def _simulate_chunk(args):
+    """Worker: draw one chunk of per-trial outcomes and return its histogram"""
+    completed, p, size, seed_seq = args
+    rng = np.random.default_rng(seed_seq)
+    successes = rng.binomial(completed, p, size=size)
+    return np.bincount(successes, minlength=completed + 1)
+
+
+def simulate_trials_parallel(num_patients, success_rate, dropout_rate, num_simulations,
+                             seed=None, workers=None, chunk_size=1_000_000):
+    """Per-trial Monte Carlo split across a process pool
+
+    Work is cut into chunks of ``chunk_size`` simulations, and chunk ``i`` draws
+    from ``SeedSequence(seed).spawn(n_chunks)[i]``. The chunking depends only on
+    ``num_simulations`` and ``chunk_size``, so a given seed produces bit-for-bit
+    the same histogram for any worker count. Workers return histograms of
+    length completed + 1 rather than raw draws.
+    """
+    completed = int(num_patients * (1 - dropout_rate / 100))
+    p = success_rate / 100
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+    sizes = [chunk_size] * (num_simulations // chunk_size)
+    if num_simulations % chunk_size:
+        sizes.append(num_simulations % chunk_size)
+    tasks = [(completed, p, size, child) for size, child in zip(sizes, seed_seq.spawn(len(sizes)))]
+
+    workers = workers or os.cpu_count() or 1
+    counts = np.zeros(completed + 1, dtype=np.int64)
+    if workers == 1 or len(tasks) == 1:
+        for task in tasks:
+            counts += _simulate_chunk(task)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            for chunk_counts in executor.map(_simulate_chunk, tasks):
+                counts += chunk_counts
+
+    return TrialSimulation(enrolled=num_patients, completed=completed, counts=counts)
+
+
+def run_trials(num_patients, success_rate, dropout_rate, num_simulations, seed=None, workers=None):
+    """Per-trial simulation for the page; uses the process pool from ``PARALLEL_THRESHOLD`` simulations"""
+    if num_simulations < PARALLEL_THRESHOLD:
+        workers = 1
+    return simulate_trials_parallel(num_patients, success_rate, dropout_rate, num_simulations,
+                                    seed=seed, workers=workers)
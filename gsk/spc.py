@@ -0,0 +1,314 @@
+"""
+Streaming statistical process control for quality_control
+
+The QC page used to invent 50 batches on every rerun and draw a single
+``mean ± 3σ`` band over all of them. This module keeps running statistics for
+each product/site stream in ``spc_state``: count, mean and M2 (Welford), plus
+pass/fail counts. Results are folded in in arrival (rowid) order, above the
+high-water mark in rollup_state. Batches are combined with the parallel form
+of Welford's update (Chan et al.), so adding one QC result costs O(1) however
+long the stream's history is.
+
+The eight Nelson rules (rules 1, 5 and 6 are also Western Electric rules) are
+evaluated over whole arrays in one vectorized pass. A stream's new points are
+prepended with its last ``WINDOW - 1`` folded points, read through
+idx_quality_control_product_site, so window rules see across refreshes. Each
+point is judged against its stream's limits at the time it is folded. Streams
+with fewer than ``MIN_POINTS`` results are not judged yet. Violations are
+stored in ``spc_alerts``.
+
+Edits to rows that have already been folded, and inserts that reuse a rowid
+at or below the high-water mark, mark their stream in ``spc_dirty`` (triggers
+in gsk.db), and that stream is recomputed on the next refresh.
+
+Usage:
+    python -m gsk.spc refresh
+    python -m gsk.spc rebuild
+"""
+
+
+import numpy as np
+import pandas as pd
+
+from gsk import db
+
+STATE = 'spc'
+WINDOW = 15       # longest rule window (rule 7)
+MIN_POINTS = 20   # results needed before a stream's limits are trusted
+
+RULES = {
+    1: "1 point beyond 3σ",
+    2: "9 points in a row on one side of the mean",
+    3: "6 points in a row steadily increasing or decreasing",
+    4: "14 points in a row alternating up and down",
+    5: "2 of 3 points beyond 2σ on the same side",
+    6: "4 of 5 points beyond 1σ on the same side",
+    7: "15 points in a row within 1σ",
+    8: "8 points in a row beyond 1σ on either side",
+}
+
+STATE_COLUMNS = ['product', 'site', 'n', 'mean', 'm2', 'min_score', 'max_score',
+                 'passed', 'failed', 'last_batch_id', 'last_test_date']
+_POINT_COLUMNS = "rowid AS seq, batch_id, product, site, test_date, test_result, compliance_score"
+
+
+# ==================== STATISTICS ====================
+def merge_moments(n_a, mean_a, m2_a, n_b, mean_b, m2_b):
+    """Combine (count, mean, M2) of two samples; with n_b = 1 this is Welford's update"""
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    frac = np.divide(n_b, n, out=np.zeros_like(delta, dtype=float), where=n > 0)
+    return n, mean_a + delta * frac, m2_a + m2_b + delta ** 2 * n_a * frac
+
+
+def control_limits(n, mean, m2, min_points=MIN_POINTS):
+    """(center, sigma) per stream; sigma is NaN until a stream has ``min_points`` results"""
+    n = np.asarray(n, dtype=float)
+    variance = np.divide(m2, n - 1, out=np.full_like(n, np.nan), where=n >= max(min_points, 2))
+    return np.asarray(mean, dtype=float), np.sqrt(variance)
+
+
+def evaluate_rules(stream, values, center, sigma):
+    """Nelson rule flags for points ordered by stream, then arrival
+
+    ``stream`` holds contiguous integer stream codes, and ``center`` and
+    ``sigma`` are given per point. Returns ``(flags, z)``. ``flags`` has
+    shape (points, 8), and its column ``r - 1`` is rule ``r`` firing at that
+    point. Points with no valid sigma never fire.
+    """
+    values = np.asarray(values, dtype=float)
+    count = len(values)
+    if count == 0:
+        return np.zeros((0, len(RULES)), dtype=bool), np.zeros(0)
+    idx = np.arange(count)
+    starts = np.r_[True, stream[1:] != stream[:-1]]
+    pos = idx - np.maximum.accumulate(np.where(starts, idx, 0))
+
+    valid = np.isfinite(sigma) & (sigma > 0)
+    z = np.divide(values - center, sigma, out=np.zeros(count), where=valid)
+
+    def window_sum(cond, length):
+        cum = np.r_[0, np.cumsum(cond)]
+        return cum[idx + 1] - cum[np.maximum(idx + 1 - length, 0)]
+
+    def run(cond, length):
+        """``cond`` held at all of the last ``length`` points of the stream"""
+        return (pos >= length - 1) & (window_sum(cond, length) == length)
+
+    def at_least(cond, length, k):
+        """``cond`` held at ``k`` or more of the last ``length`` points of the stream"""
+        return (pos >= length - 1) & (window_sum(cond, length) >= k)
+
+    step = np.r_[0.0, np.diff(values)]
+    step[starts] = 0.0
+    up, down = step > 0, step < 0
+    alternating = np.r_[False, (up[1:] & down[:-1]) | (down[1:] & up[:-1])]
+
+    flags = np.column_stack([
+        np.abs(z) > 3,
+        run(z > 0, 9) | run(z < 0, 9),
+        run(up, 5) | run(down, 5),
+        run(alternating, 12),
+        at_least(z > 2, 3, 2) | at_least(z < -2, 3, 2),
+        at_least(z > 1, 5, 4) | at_least(z < -1, 5, 4),
+        run(np.abs(z) < 1, 15),
+        run(np.abs(z) > 1, 8),
+    ])
+    return flags & valid[:, None], z
+
+
+# ==================== STATE MAINTENANCE ====================
+def _tails(conn, streams, high_water):
+    """Last WINDOW - 1 folded points of each stream, via the (product, site) index"""
+    frames = [
+        pd.read_sql_query(f'''
+            SELECT {_POINT_COLUMNS} FROM quality_control
+            WHERE product = ? AND site = ? AND rowid <= ? AND compliance_score IS NOT NULL
+            ORDER BY rowid DESC LIMIT ?
+        ''', conn, params=(product, site, high_water, WINDOW - 1))
+        for product, site in streams
+    ]
+    frames = [frame for frame in frames if not frame.empty]
+    return pd.concat(frames, ignore_index=True) if frames else None
+
+
+def _fold(conn, rows, tail_high_water):
+    """Merge new QC rows into spc_state and record rule violations; returns the alert count"""
+    if rows.empty:
+        return 0
+    keys = ['product', 'site']
+    rows = rows.sort_values(keys + ['seq'], kind='stable')
+    scores = rows.groupby(keys, sort=False)['compliance_score']
+    batch = pd.DataFrame({
+        'n_b': scores.count(),
+        'mean_b': scores.mean(),
+        'm2_b': scores.var(ddof=0) * scores.count(),
+        'min_b': scores.min(),
+        'max_b': scores.max(),
+        'passed_b': rows['test_result'].eq('Pass').groupby([rows['product'], rows['site']], sort=False).sum(),
+        'failed_b': rows['test_result'].eq('Fail').groupby([rows['product'], rows['site']], sort=False).sum(),
+        'last_batch_id': rows.groupby(keys, sort=False)['batch_id'].last(),
+        'last_test_date': rows.groupby(keys, sort=False)['test_date'].last(),
+    }).reset_index()
+
+    state = pd.read_sql_query("SELECT * FROM spc_state", conn)
+    merged = batch.merge(state.drop(columns=['last_batch_id', 'last_test_date']), on=keys, how='left')
+    numeric = ['n', 'mean', 'm2', 'min_score', 'max_score', 'passed', 'failed']
+    merged[numeric] = merged[numeric].astype(float)
+    merged = merged.fillna({'n': 0, 'mean': 0.0, 'm2': 0.0, 'passed': 0, 'failed': 0})
+    n, mean, m2 = merge_moments(merged['n'].to_numpy(float), merged['mean'].to_numpy(float),
+                                merged['m2'].to_numpy(float), merged['n_b'].to_numpy(float),
+                                merged['mean_b'].to_numpy(float), merged['m2_b'].to_numpy(float))
+    updated = pd.DataFrame({
+        'product': merged['product'],
+        'site': merged['site'],
+        'n': n.astype(np.int64),
+        'mean': mean,
+        'm2': m2,
+        'min_score': np.fmin(merged['min_score'].to_numpy(float), merged['min_b'].to_numpy(float)),
+        'max_score': np.fmax(merged['max_score'].to_numpy(float), merged['max_b'].to_numpy(float)),
+        'passed': (merged['passed'] + merged['passed_b']).astype(np.int64),
+        'failed': (merged['failed'] + merged['failed_b']).astype(np.int64),
+        'last_batch_id': merged['last_batch_id'],
+        'last_test_date': merged['last_test_date'],
+    })
+
+    # Rule windows: the previous WINDOW - 1 points of streams that already had history
+    rows = rows.assign(is_new=True)
+    history = [key for key, had in zip(zip(merged['product'], merged['site']), merged['n'] > 0) if had]
+    tails = _tails(conn, history, tail_high_water) if tail_high_water > 0 else None
+    points = rows if tails is None else pd.concat([tails.assign(is_new=False), rows], ignore_index=True)
+    points = points.sort_values(keys + ['seq'], kind='stable').reset_index(drop=True)
+
+    center, sigma = control_limits(updated['n'], updated['mean'], updated['m2'])
+    limits = pd.DataFrame({'product': updated['product'], 'site': updated['site'],
+                           'center': center, 'sigma': sigma})
+    points = points.merge(limits, on=keys, how='left')
+    stream = points.groupby(keys, sort=False).ngroup().to_numpy()
+    flags, z = evaluate_rules(stream, points['compliance_score'].to_numpy(float),
+                              points['center'].to_numpy(), points['sigma'].to_numpy())
+    hit_rows, hit_rules = np.nonzero(flags & points['is_new'].to_numpy()[:, None])
+
+    hits = points.iloc[hit_rows]
+    alerts = list(zip(hits['batch_id'], (hit_rules + 1).tolist(), hits['product'], hits['site'],
+                      hits['test_date'], hits['compliance_score'], z[hit_rows].round(3).tolist()))
+    conn.executemany(f"INSERT OR REPLACE INTO spc_state ({', '.join(STATE_COLUMNS)}) "
+                     f"VALUES ({','.join('?' * len(STATE_COLUMNS))})",
+                     updated[STATE_COLUMNS].astype(object).itertuples(index=False, name=None))
+    conn.executemany("INSERT OR REPLACE INTO spc_alerts (batch_id, rule, product, site, test_date, "
+                     "compliance_score, zscore) VALUES (?,?,?,?,?,?,?)", alerts)
+    return len(alerts)
+
+
+def _recompute_streams(conn, streams, high_water):
+    """Rebuild the state and alerts of streams whose folded rows were edited"""
+    for product, site in streams:
+        conn.execute("DELETE FROM spc_state WHERE product = ? AND site = ?", (product, site))
+        conn.execute("DELETE FROM spc_alerts WHERE product = ? AND site = ?", (product, site))
+    frames = [
+        pd.read_sql_query(f'''
+            SELECT {_POINT_COLUMNS} FROM quality_control
+            WHERE product = ? AND site = ? AND rowid <= ? AND compliance_score IS NOT NULL
+        ''', conn, params=(product, site, high_water))
+        for product, site in streams
+    ]
+    rows = pd.concat(frames, ignore_index=True)
+    return {'alerts': _fold(conn, rows, tail_high_water=0)}
+
+
+def _fold_range(conn, low, high):
+    """Fold the QC results with rowid in (low, high]"""
+    rows = pd.read_sql_query(f'''
+        SELECT {_POINT_COLUMNS} FROM quality_control
+        WHERE rowid > ? AND rowid <= ?
+          AND product IS NOT NULL AND site IS NOT NULL AND compliance_score IS NOT NULL
+    ''', conn, params=(low, high))
+    return {'rows': len(rows), 'alerts': _fold(conn, rows, tail_high_water=low)}
+
+
+def refresh_spc(pool=None, batch_rows=1_000_000):
+    """Fold new quality_control rows into spc_state and evaluate the rules for them
+
+    Dirty streams are recomputed first. New rows are then folded in rowid
+    ranges of ``batch_rows``, one transaction each (db.refresh_rollup).
+    Returns a report dict.
+    """
+    report = db.refresh_rollup(STATE, _fold_range, _recompute_streams, batch_rows, pool)
+    report.setdefault('alerts', 0)
+    return report
+
+
+def rebuild_spc(pool=None):
+    """Drop all SPC state and alerts and fold every QC result again"""
+    return db.rebuild_rollup(STATE, ['spc_state', 'spc_alerts'], refresh_spc, pool)
+
+
+def ensure_fresh():
+    """Refresh if new or edited QC results arrived; a cheap read when nothing changed"""
+    db.ensure_fresh(STATE, refresh_spc)
+
+
+# ==================== DASHBOARD QUERIES ====================
+def stream_summary():
+    """spc_state with standard deviation, control limits and pass rate per stream"""
+    ensure_fresh()
+    state = db.read_sql("SELECT * FROM spc_state ORDER BY n DESC")
+    center, sigma = control_limits(state['n'], state['mean'], state['m2'], min_points=2)
+    state['std'] = sigma
+    state['ucl'] = center + 3 * sigma
+    state['lcl'] = center - 3 * sigma
+    state['pass_rate'] = state['passed'] / state['n'].where(state['n'] > 0) * 100
+    return state
+
+
+def stream_points(product, site, limit=200):
+    """The latest ``limit`` results of one stream, oldest first, with any rule alerts"""
+    points = db.read_sql(f'''
+        SELECT * FROM (
+            SELECT {_POINT_COLUMNS} FROM quality_control
+            WHERE product = ? AND site = ? AND compliance_score IS NOT NULL
+            ORDER BY rowid DESC LIMIT ?
+        ) ORDER BY seq
+    ''', (product, site, limit))
+    if points.empty:
+        points['rules'] = pd.Series(dtype=object)
+        return points
+    alerts = db.read_sql('''
+        SELECT batch_id, group_concat(rule, ',') AS rules FROM spc_alerts
+        WHERE product = ? AND site = ? AND test_date >= ?
+        GROUP BY batch_id
+    ''', (product, site, points['test_date'].min()))
+    return points.merge(alerts, on='batch_id', how='left')
+
+
+def recent_alerts(limit=100):
+    """Most recent rule violations across all streams"""
+    alerts = db.read_sql('''
+        SELECT test_date, batch_id, product, site, compliance_score, zscore, rule
+        FROM spc_alerts ORDER BY test_date DESC, batch_id DESC LIMIT ?
+    ''', (limit,))
+    alerts['description'] = alerts['rule'].map(RULES)
+    return alerts
+
+
+def alert_counts():
+    """Number of stored violations per rule"""
+    counts = db.read_sql("SELECT rule, COUNT(*) AS alerts FROM spc_alerts GROUP BY rule ORDER BY rule")
+    counts['description'] = counts['rule'].map(RULES)
+    return counts
+
+
+def _describe(report):
+    return (f"Folded {report['rows']:,} results in {report['seconds']:.1f}s; "
+            f"{report['alerts']:,} rule violations, {report['dirty']} streams recomputed")
+
+
+def main(argv=None):
+    return db.rollup_main("Maintain the quality_control SPC state", {
+        'refresh': lambda: _describe(refresh_spc()),
+        'rebuild': lambda: _describe(rebuild_spc()),
+    }, argv)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,467 @@
+"""
+Seeded synthetic data for load testing every table
+
+The demo pages used to invent their data in row-by-row Python loops, one
+``np.random`` call per field per row, and never stored it. The generators
+below build each table as columnar DataFrame chunks, with one vectorized draw
+per column per chunk, and ``populate`` writes them through the bulk loader
+(gsk.ingest). Any scale from a few thousand to 100M+ rows runs in bounded
+memory.
+
+Every table gets its own child of ``SeedSequence(seed)``, so a given seed and
+chunk size always produce the same data. The data is deliberately skewed the
+way real traffic is. Products, regions, sites and tools are drawn from a Zipf
+distribution, so the first few catalog entries are hot. Sales also grow over
+time and follow a yearly season.
+
+Usage:
+    python -m gsk.synthetic 1000000
+    python -m gsk.synthetic 100000000 --tables sales_data --seed 7
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from gsk import db
+from gsk.ingest import load_frames
+from gsk.research import STUDY_STATUSES, STUDY_TYPES
+
+PRODUCTS = ['Respiratory-X', 'Immuno-Plus', 'Onco-Target', 'HIV-Block', 'Vaccine-Pro']
+REGIONS = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Middle East']
+SITES = ['UK-London', 'US-Philadelphia', 'SG-Singapore', 'IN-Bangalore']
+DEPARTMENTS = ['R&D', 'Manufacturing', 'Sales', 'Regulatory', 'Quality Control']
+LEDGER_CATEGORIES = ['R&D', 'Manufacturing', 'Sales & Marketing', 'Administration', 'Regulatory']
+EQUIPMENT_TYPES = ['Analyzer', 'Reactor', 'Centrifuge', 'Chromatograph', 'Spectrometer', 'Incubator']
+LABS = ['Lab A', 'Lab B', 'Lab C', 'Lab D']
+MAINTENANCE_INTERVALS = [30, 60, 90, 180]  # days; instrument i is due every MAINTENANCE_INTERVALS[i % 4]
+TELEMETRY_DAYS = 365
+THERAPEUTIC_AREAS = ['Respiratory', 'Immunology', 'Oncology', 'HIV', 'Infectious Disease']
+TOOL_NAMES = ['Clinical Data Analytics', 'Drug Pipeline Tracker', 'Sales Performance',
+              'Quality Control Monitor', 'Research Data Repository', 'Regulatory Compliance',
+              'Lab Equipment Utilization', 'HR Analytics Suite', 'Financial Reporting',
+              'Clinical Trial Simulator']
+
+# Rows per table for a given scale (the number of sales rows)
+SCALE_RATIOS = {
+    'clinical_trials': 0.001,
+    'drug_pipeline': 0.0005,
+    'sales_data': 1.0,
+    'quality_control': 0.01,
+    'employees': 0.005,
+    'financial_ledger': 0.05,
+    'analytics': 0.2,
+    'research_studies': 0.01,
+    'equipment': 0.001,
+    'equipment_telemetry': 0.001 * TELEMETRY_DAYS,  # one reading per instrument per day
+}
+TABLE_ORDER = list(SCALE_RATIOS)
+
+# Research title/abstract vocabulary, most frequent first
+RESEARCH_WORDS = '''
+    study patients treatment trial efficacy safety clinical results dose response analysis
+    randomized placebo cohort outcome baseline week compared significant primary endpoint
+    secondary reduction improvement adverse events therapy disease expression receptor
+    inhibitor antibody vaccine pathway biomarker survival progression tumor lung asthma copd
+    inflammation immune cell kinase protein gene mutation resistance infection viral hiv
+    influenza rsv pneumonia lupus arthritis exacerbation lesion metastatic chemotherapy
+    monotherapy combination adjuvant regimen pharmacokinetics bioavailability toxicity tolerability
+    eosinophil interleukin cytokine macrophage lymphocyte airway bronchodilator inhaler
+    corticosteroid biologic monoclonal bispecific conjugate oncogenic checkpoint transcription
+    phosphorylation signaling preclinical murine xenograft organoid in vitro in vivo assay
+    screening potency selectivity formulation stability manufacturing batch
+    genomic proteomic sequencing variant allele heterozygous phenotype genotype dosing
+    titration infusion subcutaneous oral intravenous hepatic renal cardiac neurological
+    dermatological pediatric geriatric elderly adolescent remission relapse recurrence
+    mortality hospitalization quality life symptom score questionnaire registry real world
+    evidence observational retrospective prospective multicenter open label double blind
+'''.split()
+COMPOUND_CODES = 5_000    # gskNNNNNNN codes, the rare long tail of the vocabulary
+CODE_SHARE = 0.05         # share of title/abstract words that are compound codes
+
+CHUNK_ROWS = 250_000
+
+
+# ==================== DISTRIBUTION HELPERS ====================
+def catalog(base, prefix, n):
+    """The first ``n`` names of a catalog: the demo names, then generated ones"""
+    names = list(base[:n])
+    names += [f'{prefix}-{i:04d}' for i in range(len(names) + 1, n + 1)]
+    return np.array(names)
+
+
+def zipf_cdf(n, skew=1.1):
+    """Cumulative Zipf weights over ``n`` ranked items (skew=0 is uniform)"""
+    weights = 1.0 / np.arange(1, n + 1) ** skew
+    cdf = np.cumsum(weights)
+    return cdf / cdf[-1]
+
+
+def draw(rng, cdf, size):
+    """``size`` indexes into a ranked catalog, sampled by inverse CDF"""
+    return np.searchsorted(cdf, rng.random(size), side='right').clip(max=len(cdf) - 1)
+
+
+def _ids(prefix, start, size, width=8):
+    """Zero-padded text keys prefix-00000001 ... for one chunk"""
+    numbers = np.arange(start + 1, start + size + 1).astype(str)
+    return np.char.add(f'{prefix}-', np.char.zfill(numbers, width))
+
+
+def _chunks(rows, chunk_rows):
+    for start in range(0, rows, chunk_rows):
+        yield start, min(chunk_rows, rows - start)
+
+
+# ==================== TABLE GENERATORS ====================
+def sales_frames(rows, seed=None, chunk_rows=CHUNK_ROWS, products=50, regions=len(REGIONS),
+                 start='2022-01-01', end='2024-12-31', skew=1.1, growth=0.5):
+    """sales_data chunks: Zipf products/regions, growing seasonal demand, per-product prices"""
+    rng = np.random.default_rng(seed)
+    product_names = catalog(PRODUCTS, 'Product', products)
+    region_names = catalog(REGIONS, 'Region', regions)
+    product_cdf = zipf_cdf(products, skew)
+    region_cdf = zipf_cdf(regions, skew)
+    unit_price = rng.lognormal(np.log(300), 0.5, products)
+
+    days = pd.date_range(start, end, freq='D')
+    t = np.linspace(0, 1, len(days))
+    weight = (1 + growth * t) * (1 + 0.15 * np.sin(2 * np.pi * days.dayofyear.to_numpy() / 365.25))
+    day_cdf = np.cumsum(weight) / weight.sum()
+
+    for _, size in _chunks(rows, chunk_rows):
+        product = draw(rng, product_cdf, size)
+        units = np.maximum(rng.lognormal(np.log(400), 0.6, size).astype(np.int64), 1)
+        revenue = units * unit_price[product] * rng.uniform(0.9, 1.1, size)
+        yield pd.DataFrame({
+            'product_name': product_names[product],
+            'region': region_names[draw(rng, region_cdf, size)],
+            'revenue': revenue.round(2),
+            'units_sold': units,
+            'sale_date': days[draw(rng, day_cdf, size)],
+        })
+
+
+def clinical_trial_frames(rows, seed=None, chunk_rows=CHUNK_ROWS, products=50, skew=1.1):
+    """clinical_trials chunks: phase-dependent enrollment and success rates"""
+    rng = np.random.default_rng(seed)
+    drug_names = catalog(PRODUCTS, 'Product', products)
+    drug_cdf = zipf_cdf(products, skew)
+    phases = np.array(['Phase 1', 'Phase 2', 'Phase 3'])
+    enrollment = np.array([80, 400, 1500])
+    statuses = np.array(['Recruiting', 'Active', 'Completed', 'Terminated'])
+    areas = np.array(THERAPEUTIC_AREAS)
+    area_cdf = zipf_cdf(len(areas), 0.5)
+    start_days = pd.date_range('2015-01-01', '2025-12-31', freq='D')
+
+    for offset, size in _chunks(rows, chunk_rows):
+        phase = rng.choice(3, size, p=[0.35, 0.40, 0.25])
+        yield pd.DataFrame({
+            'trial_id': _ids('CT', offset, size),
+            'drug_name': drug_names[draw(rng, drug_cdf, size)],
+            'phase': phases[phase],
+            'status': rng.choice(statuses, size, p=[0.2, 0.45, 0.3, 0.05]),
+            'start_date': start_days[rng.integers(0, len(start_days), size)],
+            'patients_enrolled': np.maximum(
+                rng.lognormal(np.log(enrollment[phase]), 0.4).astype(np.int64), 10),
+            'success_rate': (rng.beta(8, 3, size) * 100).round(1),
+            'therapeutic_area': areas[draw(rng, area_cdf, size)],
+        })
+
+
+def pipeline_frames(rows, seed=None, chunk_rows=CHUNK_ROWS, products=50, skew=1.1):
+    """drug_pipeline chunks: stage-dependent timelines and investment"""
+    rng = np.random.default_rng(seed)
+    drug_names = catalog(PRODUCTS, 'Product', products)
+    drug_cdf = zipf_cdf(products, skew)
+    stages = np.array(['Discovery', 'Pre-clinical', 'Phase 1 Trials', 'Phase 2 Trials',
+                       'Phase 3 Trials', 'Regulatory Review'])
+    remaining_months = np.array([84, 66, 54, 36, 18, 12])
+    indications = np.array(['COPD', 'Asthma', 'Rheumatoid Arthritis', 'Lung Cancer', 'Breast Cancer',
+                            'HIV Treatment', 'Influenza', 'RSV', 'Lupus', 'Shingles'])
+
+    for offset, size in _chunks(rows, chunk_rows):
+        stage = rng.choice(len(stages), size, p=[0.3, 0.25, 0.18, 0.13, 0.09, 0.05])
+        yield pd.DataFrame({
+            'drug_id': _ids('D', offset, size),
+            'drug_name': drug_names[draw(rng, drug_cdf, size)],
+            'stage': stages[stage],
+            'indication': rng.choice(indications, size),
+            'market_potential': rng.lognormal(np.log(1500), 0.6, size).round(1),
+            'timeline_months': np.maximum(
+                (remaining_months[stage] * rng.uniform(0.6, 1.4, size)).astype(np.int64), 1),
+            'investment': (rng.lognormal(np.log(80), 0.5, size) * (stage + 1)).round(1),
+        })
+
+
+def quality_control_frames(rows, seed=None, chunk_rows=CHUNK_ROWS, products=len(PRODUCTS),
+                           sites=len(SITES), start='2024-01-01', end='2024-12-31', skew=1.1):
+    """quality_control chunks: batches in test-date order with per-site score levels
+
+    Each site has its own mean compliance score. About 1% of batches come from
+    a short-lived process shift, so control charts have something to find.
+    """
+    rng = np.random.default_rng(seed)
+    product_names = catalog(PRODUCTS, 'Product', products)
+    site_names = catalog(SITES, 'SITE', sites)
+    product_cdf = zipf_cdf(products, skew)
+    site_cdf = zipf_cdf(sites, skew)
+    site_mean = rng.uniform(92, 96, sites)
+    first, last = pd.Timestamp(start), pd.Timestamp(end)
+    span = (last - first) / max(rows, 1)
+
+    for offset, size in _chunks(rows, chunk_rows):
+        site = draw(rng, site_cdf, size)
+        shift = np.where(rng.random(size) < 0.01, rng.normal(-6, 2, size), 0.0)
+        score = np.clip(rng.normal(site_mean[site], 1.8, size) + shift, 0, 100)
+        fail = (score < 88) | (rng.random(size) < 0.02)
+        yield pd.DataFrame({
+            'batch_id': _ids('BATCH', offset, size),
+            'product': product_names[draw(rng, product_cdf, size)],
+            'test_date': first + span * np.arange(offset, offset + size),
+            'test_result': np.where(fail, 'Fail', 'Pass'),
+            'compliance_score': score.round(2),
+            'site': site_names[site],
+        })
+
+
+def employee_frames(rows, seed=None, chunk_rows=CHUNK_ROWS, departments=len(DEPARTMENTS), skew=1.1):
+    """employees chunks: performance rises with tenure at a department-specific rate"""
+    rng = np.random.default_rng(seed)
+    department_names = catalog(DEPARTMENTS, 'Department', departments)
+    department_cdf = zipf_cdf(departments, skew)
+    base = rng.uniform(3.0, 3.6, departments)
+    slope = rng.uniform(0.0, 0.1, departments)
+
+    for offset, size in _chunks(rows, chunk_rows):
+        department = draw(rng, department_cdf, size)
+        tenure = rng.uniform(0.5, 15, size)
+        performance = base[department] + slope[department] * tenure + rng.normal(0, 0.35, size)
+        yield pd.DataFrame({
+            'employee_id': _ids('EMP', offset, size),
+            'department': department_names[department],
+            'tenure_years': tenure.round(2),
+            'performance_score': np.clip(performance, 1.0, 5.0).round(2),
+            'satisfaction_score': np.clip(rng.normal(0.5 * performance + 2.0, 0.4, size), 1.0, 5.0).round(2),
+            'training_hours': rng.integers(20, 100, size),
+        })
+
+
+def ledger_frames(rows, seed=None, chunk_rows=CHUNK_ROWS, categories=len(LEDGER_CATEGORIES),
+                  cost_centers=20, start='2023-01', end='2024-12', skew=1.1):
+    """financial_ledger chunks: journal lines ($M) spread over months, categories and cost centers
+
+    Revenue follows a yearly season; each category runs at its own expense
+    ratio, and budgets sit within about 15% of actual expenses.
+    """
+    rng = np.random.default_rng(seed)
+    category_names = catalog(LEDGER_CATEGORIES, 'Category', categories)
+    center_names = catalog([], 'CC', cost_centers)
+    category_cdf = zipf_cdf(categories, skew)
+    center_cdf = zipf_cdf(cost_centers, skew)
+    expense_ratio = rng.uniform(0.4, 0.8, categories)
+    months = pd.period_range(start, end, freq='M')
+    season = 1 + 0.15 * np.sin(2 * np.pi * (months.month.to_numpy() - 1) / 12)
+    month_names = np.array(months.strftime('%Y-%m'))
+
+    for _, size in _chunks(rows, chunk_rows):
+        month = rng.integers(0, len(months), size)
+        category = draw(rng, category_cdf, size)
+        revenue = rng.lognormal(np.log(15), 0.4, size) * season[month]
+        expenses = revenue * expense_ratio[category] * rng.uniform(0.8, 1.2, size)
+        yield pd.DataFrame({
+            'month': month_names[month],
+            'category': category_names[category],
+            'cost_center': center_names[draw(rng, center_cdf, size)],
+            'revenue': revenue.round(3),
+            'expenses': expenses.round(3),
+            'budget': (expenses * rng.uniform(0.85, 1.15, size)).round(3),
+        })
+
+
+def equipment_frames(rows, seed=None, chunk_rows=CHUNK_ROWS, locations=len(LABS), skew=1.1):
+    """equipment chunks: the instrument registry, with Zipf lab sizes"""
+    rng = np.random.default_rng(seed)
+    types = np.array(EQUIPMENT_TYPES)
+    lab_names = catalog(LABS, 'Lab', locations)
+    lab_cdf = zipf_cdf(locations, skew)
+    intervals = np.array(MAINTENANCE_INTERVALS)
+
+    for offset, size in _chunks(rows, chunk_rows):
+        index = np.arange(offset, offset + size)
+        kind = types[rng.integers(0, len(types), size)]
+        yield pd.DataFrame({
+            'equipment_id': _ids('EQ', offset, size),
+            'equipment_name': np.char.add(np.char.add(kind, ' '), (index + 1).astype(str)),
+            'equipment_type': kind,
+            'location': lab_names[draw(rng, lab_cdf, size)],
+            'maintenance_interval_days': intervals[index % len(intervals)],
+        })
+
+
+def telemetry_frames(rows, seed=None, chunk_rows=CHUNK_ROWS, instruments=None, start='2024-01-01',
+                     days=TELEMETRY_DAYS):
+    """equipment_telemetry chunks: one reading per instrument per day, in date order
+
+    ``instruments`` defaults to ``rows // days``, matching the equipment
+    registry at the same scale. Each instrument is serviced on its own
+    cycle, somewhere between 0.7x and 1.4x its registry interval, so some
+    run overdue. Errors grow with the time since the last service and with
+    load, and utilization drifts up or down over the period.
+    """
+    rng = np.random.default_rng(seed)
+    instruments = instruments or max(rows // days, 1)
+    periods = max(-(-rows // instruments), 1)
+    intervals = np.array(MAINTENANCE_INTERVALS)[np.arange(instruments) % len(MAINTENANCE_INTERVALS)]
+    cycle = np.maximum((intervals * rng.uniform(0.7, 1.4, instruments)).astype(np.int64), 1)
+    phase = rng.integers(0, cycle)
+    base = rng.uniform(40, 90, instruments)
+    drift = rng.normal(0, 10, instruments)
+    error_base = rng.lognormal(np.log(0.15), 0.6, instruments)
+    ids = _ids('EQ', 0, instruments)
+    first = pd.Timestamp(start)
+
+    for offset, size in _chunks(rows, chunk_rows):
+        day, instrument = np.divmod(np.arange(offset, offset + size), instruments)
+        age = (day + phase[instrument]) % cycle[instrument]  # days since the last service
+        utilization = np.clip(base[instrument] + drift[instrument] * day / periods
+                              + rng.normal(0, 6, size), 0, 100)
+        wear = age / cycle[instrument]
+        errors = rng.poisson(error_base[instrument] * (1 + 4 * wear ** 2) * (0.5 + utilization / 100))
+        yield pd.DataFrame({
+            'equipment_id': ids[instrument],
+            'reading_date': first + pd.to_timedelta(day, unit='D'),
+            'utilization': utilization.round(1),
+            'error_count': errors,
+            'maintenance': (age == 0).astype(np.int64),
+        })
+
+
+def analytics_frames(rows, seed=None, chunk_rows=CHUNK_ROWS, days=90, skew=1.1):
+    """analytics chunks: Zipf tool popularity over the last ``days`` days, ~20 events per session"""
+    rng = np.random.default_rng(seed)
+    tools = np.array(TOOL_NAMES)
+    tool_cdf = zipf_cdf(len(tools), skew)
+    now = pd.Timestamp.now().floor('s')
+    sessions = max(rows // 20, 1)
+
+    for _, size in _chunks(rows, chunk_rows):
+        seconds = rng.integers(0, days * 86400, size)
+        yield pd.DataFrame({
+            'tool_name': tools[draw(rng, tool_cdf, size)],
+            'access_time': now - pd.to_timedelta(np.sort(seconds)[::-1], unit='s'),
+            'session_id': np.char.add('S', np.char.zfill(
+                rng.integers(0, sessions, size).astype(str), 10)),
+        })
+
+
+def research_frames(rows, seed=None, chunk_rows=CHUNK_ROWS, start='2015-01-01', end='2025-12-31',
+                    skew=1.0):
+    """research_studies chunks: Zipf-distributed title and abstract words, published in id order
+
+    Each title names a product and a therapeutic area. Words follow a Zipf law
+    over RESEARCH_WORDS, so a few appear in most studies. About one word in
+    twenty is a compound code, each found in only a handful of studies. Older
+    studies have more citations.
+    """
+    rng = np.random.default_rng(seed)
+    codes = np.char.add('gsk', rng.integers(1_000_000, 10_000_000, COMPOUND_CODES).astype(str))
+    words = np.array(RESEARCH_WORDS)
+    word_cdf = zipf_cdf(len(words), skew)
+    product_names = catalog(PRODUCTS, 'Product', 50)
+    product_cdf = zipf_cdf(len(product_names), 1.1)
+    areas = np.array(THERAPEUTIC_AREAS)
+    first, last = pd.Timestamp(start), pd.Timestamp(end)
+    span = (last - first) / max(rows, 1)
+
+    def text(size, length):
+        drawn = words[draw(rng, word_cdf, (size, length))]
+        code = codes[rng.integers(0, len(codes), (size, length))]
+        return np.where(rng.random((size, length)) < CODE_SHARE, code, drawn).tolist()
+
+    for offset, size in _chunks(rows, chunk_rows):
+        area = areas[rng.integers(0, len(areas), size)]
+        product = product_names[draw(rng, product_cdf, size)]
+        abstract_length = rng.integers(30, 61, size)
+        published = pd.DatetimeIndex(first + span * np.arange(offset, offset + size))
+        age_years = (last - published).days.to_numpy() / 365.25
+        yield pd.DataFrame({
+            'study_id': _ids('RS', offset, size),
+            'title': [f"{p} in {a}: {' '.join(w)}" for p, a, w in zip(product, area, text(size, 6))],
+            'abstract': [' '.join(w[:k]) for w, k in zip(text(size, 60), abstract_length)],
+            'study_type': rng.choice(STUDY_TYPES, size, p=[0.4, 0.3, 0.3]),
+            'therapeutic_area': area,
+            'status': rng.choice(STUDY_STATUSES, size, p=[0.3, 0.3, 0.4]),
+            'published': published,
+            'citations': rng.poisson(rng.lognormal(1.0, 1.0, size) * (age_years + 0.1)),
+        })
+
+
+GENERATORS = {
+    'clinical_trials': clinical_trial_frames,
+    'drug_pipeline': pipeline_frames,
+    'sales_data': sales_frames,
+    'quality_control': quality_control_frames,
+    'employees': employee_frames,
+    'financial_ledger': ledger_frames,
+    'analytics': analytics_frames,
+    'research_studies': research_frames,
+    'equipment': equipment_frames,
+    'equipment_telemetry': telemetry_frames,
+}
+
+
+def table_rows(scale, tables=None):
+    """Row count per table for a scale (number of sales rows)"""
+    tables = tables or TABLE_ORDER
+    return {table: max(int(scale * SCALE_RATIOS[table]), 1) for table in tables}
+
+
+def frames(table, rows, seed=None, **kwargs):
+    """Chunks of synthetic rows for ``table``"""
+    if table not in GENERATORS:
+        raise ValueError(f"No generator for {table!r}; expected one of {TABLE_ORDER}")
+    return GENERATORS[table](rows, seed=seed, **kwargs)
+
+
+def populate(scale, seed=0, tables=None, chunk_rows=CHUNK_ROWS, pool=None, progress=None):
+    """Generate and bulk load every table (or ``tables``) at ``scale``
+
+    Returns the gsk.ingest load report for each table.
+    """
+    children = dict(zip(TABLE_ORDER, np.random.SeedSequence(seed).spawn(len(TABLE_ORDER))))
+    reports = {}
+    for table, rows in table_rows(scale, tables).items():
+        chunks = frames(table, rows, seed=children[table], chunk_rows=chunk_rows)
+        table_progress = ((lambda loaded, elapsed, table=table: progress(table, loaded, elapsed))
+                          if progress is not None else None)
+        reports[table] = load_frames(table, chunks, pool=pool, progress=table_progress)
+    return reports
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fill gsk_enterprise.db with synthetic data")
+    parser.add_argument('scale', type=int, help="Number of sales rows; other tables scale with it")
+    parser.add_argument('--tables', nargs='+', choices=TABLE_ORDER, help="Only these tables")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--database', default=db.DB_PATH)
+    args = parser.parse_args(argv)
+
+    db.DB_PATH = args.database
+
+    def progress(table, rows, elapsed):
+        print(f"\r  {rows:,} rows  {rows / elapsed if elapsed else 0:,.0f} rows/s", end='', flush=True)
+
+    for table, rows in table_rows(args.scale, args.tables).items():
+        print(f"Generating {rows:,} rows -> {table}")
+        report = populate(args.scale, seed=args.seed, tables=[table],
+                          chunk_rows=args.chunk_rows, progress=progress)[table]
+        print(f"\r  {report['rows']:,} rows in {report['seconds']:.1f}s "
+              f"({report['rows_per_sec']:,.0f} rows/s)")
+    db.close_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+"""
+Batched background writer for tool-usage analytics
+
+log_tool_access() used to INSERT and commit on every Streamlit rerun, putting an
+fsync on the render path. Events are now queued in memory and a daemon thread
+writes them in batched executemany transactions, flushing when a batch fills
+up or when the flush interval elapses. The queue is bounded: when it is full,
+events are dropped and counted rather than slowing down page renders.
+
+Triggers on analytics (gsk.db) keep per-tool and per-day counters, which
+``popular_tools`` reads instead of scanning the events.
+"""
+
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from gsk.db import get_pool, read_sql
+
+INSERT_SQL = "INSERT INTO analytics (tool_name, access_time, session_id) VALUES (?, ?, ?)"
+
+_STOP = object()
+
+
+class AnalyticsWriter:
+    """Queue analytics events and persist them in batches from a background thread"""
+
+    def __init__(self, pool, batch_size=500, flush_interval=2.0, max_queue=10000):
+        self.pool = pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._flush_lock = threading.Lock()
+        self._pending = []
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'enqueued': 0,
+            'written': 0,
+            'dropped': 0,
+            'failed': 0,
+            'batches': 0,
+            'last_flush_ms': 0.0,
+        }
+        self._thread = threading.Thread(target=self._run, name='gsk-analytics-writer', daemon=True)
+        self._closed = False
+        self._thread.start()
+
+    def _count(self, key, n=1):
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def log(self, tool_name, session_id):
+        """Queue one access event; never blocks the caller"""
+        if self._closed:
+            self._count('dropped')
+            return False
+        # CURRENT_TIMESTAMP format (UTC), captured now rather than at flush time
+        access_time = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        try:
+            self._queue.put_nowait((tool_name, access_time, session_id))
+        except queue.Full:
+            self._count('dropped')
+            return False
+        self._count('enqueued')
+        return True
+
+    def _write(self, batch):
+        if not batch:
+            return
+        started = time.perf_counter()
+        try:
+            with self.pool.connection() as conn:
+                conn.executemany(INSERT_SQL, batch)
+                conn.commit()
+        except sqlite3.Error:
+            self._count('failed', len(batch))
+            return
+        with self._stats_lock:
+            self._stats['written'] += len(batch)
+            self._stats['batches'] += 1
+            self._stats['last_flush_ms'] = (time.perf_counter() - started) * 1000
+
+    def _drain(self, limit=None):
+        """Pull up to ``limit`` queued events without blocking; also report a stop request"""
+        batch = []
+        stop = False
+        while limit is None or len(batch) < limit:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                stop = True
+                continue
+            batch.append(item)
+        return batch, stop
+
+    def _run(self):
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            with self._flush_lock:
+                stop = item is _STOP
+                if item is not None and not stop:
+                    self._pending.append(item)
+                    more, stop = self._drain(max(0, self.batch_size - len(self._pending)))
+                    self._pending.extend(more)
+                if stop:
+                    rest, _ = self._drain()
+                    self._write(self._pending + rest)
+                    self._pending = []
+                    return
+                if len(self._pending) >= self.batch_size or time.monotonic() >= deadline:
+                    self._write(self._pending)
+                    self._pending = []
+                    deadline = time.monotonic() + self.flush_interval
+
+    def flush(self):
+        """Synchronously write everything queued so far"""
+        with self._flush_lock:
+            rest, stop = self._drain()
+            pending = self._pending + rest
+            self._pending = []
+            for start in range(0, len(pending), self.batch_size):
+                self._write(pending[start:start + self.batch_size])
+            if stop:
+                self._queue.put(_STOP)
+
+    def close(self, timeout=5.0):
+        """Stop the background thread after flushing pending events"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            self.flush()
+            self._queue.put(_STOP, timeout=timeout)
+        self._thread.join(timeout)
+
+    def stats(self):
+        """Counters for queued, written and dropped events"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['queued'] = self._queue.qsize()
+        return stats
+
+
+# ==================== PROCESS-WIDE WRITER ====================
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_analytics_writer():
+    """Return the process-wide analytics writer, starting it on first use"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AnalyticsWriter(get_pool())
+                atexit.register(_writer.close)
+    return _writer
+
+
+# ==================== USAGE COUNTERS ====================
+def popular_tools(limit=3, days=None):
+    """Most used tools with their ``uses``: all time, or over the last ``days`` days"""
+    if days is None:
+        return read_sql("SELECT tool_name, count AS uses FROM tool_usage_counts "
+                        "ORDER BY count DESC LIMIT ?", (limit,))
+    return read_sql('''
+        SELECT tool_name, SUM(count) AS uses FROM tool_usage_daily
+        WHERE day >= date('now', ?)
+        GROUP BY tool_name ORDER BY uses DESC LIMIT ?
+    ''', (f"-{days - 1} days", limit))
@@ -0,0 +1,64 @@
+"""
+Tool registry for the Streamlit suite
+
+Each tool is a module in this package with a ``render()`` function. The
+sidebar lists ``TOOLS`` by label, and ``render(label)`` imports only the
+selected tool's module, on first use. Python keeps it in sys.modules after
+that, so a rerun costs the app shell (gsk_tools.py) plus one ``render()``. It
+does not grow with the number of tools. A tool's own dependencies (plotly,
+gsk.spc, gsk.research, ...) load the first time that tool is opened.
+
+``record_access`` queues a visit for the analytics writer (gsk.telemetry),
+which stores it in batches off the render path. ``HOME``, the landing page, is
+listed first but is not a tool, so its visits are not recorded.
+"""
+
+import importlib
+from functools import lru_cache
+from pathlib import Path
+
+from gsk.telemetry import get_analytics_writer
+
+HOME = "🏠 Home"
+
+# Sidebar label -> module in gsk.tools, in menu order
+TOOLS = {
+    HOME: 'home',
+    "🔬 Clinical Data Analytics": 'clinical_analytics',
+    "💊 Drug Pipeline Tracker": 'drug_pipeline',
+    "📊 Sales Performance": 'sales_performance',
+    "🛡️ Quality Control Monitor": 'quality_control',
+    "🔍 Research Data Repository": 'research_repository',
+    "📋 Regulatory Compliance": 'regulatory_compliance',
+    "⚙️ Lab Equipment Utilization": 'lab_equipment',
+    "👥 HR Analytics Suite": 'hr_analytics',
+    "💰 Financial Reporting": 'financial_reporting',
+    "🧪 Clinical Trial Simulator": 'trial_simulator',
+}
+
+
+def load(label):
+    """The ``render`` function of the tool registered under ``label``, importing its module if needed"""
+    return importlib.import_module(f"{__name__}.{TOOLS[label]}").render
+
+
+def render(label):
+    load(label)()
+
+
+def tool_name(label):
+    """The name analytics record for a sidebar label: the label without its icon"""
+    return label.split(' ', 1)[-1]
+
+
+def record_access(label, session_id):
+    """Queue one access to ``label``'s tool; written later by the background writer"""
+    if label == HOME:
+        return
+    get_analytics_writer().log(tool_name(label), session_id)
+
+
+@lru_cache(maxsize=1)
+def stylesheet():
+    """The suite's CSS (style.css) as a <style> block, read once per process"""
+    return f"<style>\n{Path(__file__).with_name('style.css').read_text()}</style>"
@@ -0,0 +1,115 @@
+"""
+Clinical Data Analytics: trial KPIs, a SQL query builder and streamed CSV/PDF exports
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from gsk.cache import cached_query, get_query_cache, load_table
+from gsk.export import csv_download, pdf_download
+from gsk.governor import get_governor, governed_query
+from gsk.query import select
+from gsk.tools.grid import paged_frame, paged_table
+
+
+def render():
+    st.header("🔬 Clinical Data Analytics Platform")
+    st.subheader("Python + Streamlit + SQL Integration")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    # Query data (shared cache; no SQL unless the table changed)
+    df = load_table('clinical_trials')
+
+    with col1:
+        st.metric("Active Trials", len(df[df['status'] == 'Active']))
+    with col2:
+        st.metric("Total Patients", f"{df['patients_enrolled'].sum():,}")
+    with col3:
+        st.metric("Avg Success Rate", f"{df['success_rate'].mean():.1f}%")
+    with col4:
+        st.metric("Therapeutic Areas", df['therapeutic_area'].nunique())
+
+    # Interactive SQL Query Builder
+    st.subheader("SQL Query Builder")
+    query_option = st.selectbox(
+        "Select Query Type",
+        ["All Trials", "Active Trials Only", "By Therapeutic Area", "High Success Rate", "Custom Query"]
+    )
+
+    # Presets are parameterized: one statement text per preset, whatever the selected values
+    trials = select('clinical_trials')
+    if query_option == "Active Trials Only":
+        trials = trials.where('status', '=', 'Active')
+    elif query_option == "By Therapeutic Area":
+        area = st.selectbox("Select Area", df['therapeutic_area'].unique())
+        trials = trials.where('therapeutic_area', '=', area)
+    elif query_option == "High Success Rate":
+        threshold = st.slider("Minimum Success Rate (%)", 0, 100, 70)
+        trials = trials.where('success_rate', '>=', threshold)
+    if query_option == "Custom Query":
+        query = st.text_area("Enter Custom SQL Query", "SELECT * FROM clinical_trials")
+        params = None
+    else:
+        query, params = trials.sql()
+
+    st.code(query, language="sql")
+    if params:
+        st.caption(f"Parameters: {params}")
+    bypass = st.checkbox("Bypass result cache", help="Run the query against the database even if "
+                         "an identical one was answered recently")
+
+    try:
+        # Shared across sessions; repeat queries skip SQLite until the data changes
+        if query_option == "Custom Query":
+            # Arbitrary SQL runs under time, VM-step and row budgets
+            result = governed_query(query, bypass=bypass)
+            if result.truncated:
+                st.warning(result.message())
+            result_df = result.frame
+            paged_frame('clinical_custom_grid', result_df, source=query)
+        else:
+            result_df = cached_query(query, params, bypass=bypass)
+            # The grid pages straight from SQLite; the full result feeds the charts
+            paged_table('clinical_trials_grid', trials)
+        stats = get_query_cache().stats()
+        st.caption(f"Result cache: {stats['entries']} queries, {stats['bytes'] / 2 ** 20:.1f} of "
+                   f"{stats['max_bytes'] / 2 ** 20:.0f} MB, hit rate {stats['hit_rate']:.0%}, "
+                   f"{stats['evictions']} evicted")
+        if query_option == "Custom Query":
+            limits = get_governor().stats()
+            st.caption(f"Query governor: {limits['timeout']:g}s, {limits['max_steps']:,} VM steps and "
+                       f"{limits['max_rows']:,} rows per query; {limits['killed_timeout']} timed out, "
+                       f"{limits['killed_steps']} over the step budget, {limits['truncated_rows']} row-capped")
+
+        # Visualization
+        col1, col2 = st.columns(2)
+        with col1:
+            fig = px.bar(result_df, x='trial_id', y='patients_enrolled',
+                         title='Patients Enrolled by Trial', color='phase')
+            st.plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            fig = px.pie(result_df, names='therapeutic_area',
+                         title='Trials by Therapeutic Area')
+            st.plotly_chart(fig, use_container_width=True)
+
+        # Export (streamed from SQLite only when a download is clicked). Custom SQL
+        # exports the governed result rather than running the query again unbudgeted.
+        if query_option == "Custom Query":
+            source = {'df': result_df}
+        else:
+            source = {'query': query, 'params': params}
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.download_button("📥 Export CSV", csv_download(**source),
+                               "clinical_trials.csv", "text/csv", use_container_width=True)
+        with col2:
+            st.download_button("🗜️ Export CSV (gzip)", csv_download(compress=True, **source),
+                               "clinical_trials.csv.gz", "application/gzip", use_container_width=True)
+        with col3:
+            st.download_button("📄 Export PDF", pdf_download("Clinical Trials Report", **source),
+                               "clinical_trials.pdf", "application/pdf", use_container_width=True)
+
+    except Exception as e:
+        st.error(f"Query Error: {e}")
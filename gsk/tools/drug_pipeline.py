@@ -0,0 +1,82 @@
+"""
+Drug Pipeline Tracker: market potential by stage and development timeline
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from gsk.cache import load_table
+from gsk.export import csv_download, pdf_download
+from gsk.query import select
+from gsk.tools.grid import paged_table
+
+
+def render():
+    st.header("💊 Drug Pipeline Tracker")
+    st.subheader("Power BI Style Dashboard with SQL Backend")
+
+    df = load_table('drug_pipeline')
+
+    # KPIs
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Drugs in Pipeline", len(df))
+    with col2:
+        st.metric("Total Market Potential", f"${df['market_potential'].sum():.1f}B")
+    with col3:
+        st.metric("Total Investment", f"${df['investment'].sum():.1f}M")
+    with col4:
+        st.metric("Avg Timeline", f"{df['timeline_months'].mean():.0f} months")
+
+    # Pipeline visualization
+    fig = go.Figure()
+
+    stages = df['stage'].unique()
+    for stage in stages:
+        stage_data = df[df['stage'] == stage]
+        fig.add_trace(go.Bar(
+            name=stage,
+            x=stage_data['drug_name'],
+            y=stage_data['market_potential'],
+            text=stage_data['market_potential'],
+            texttemplate='$%{text:.1f}B'
+        ))
+
+    fig.update_layout(
+        title='Drug Pipeline - Market Potential by Stage',
+        xaxis_title='Drug',
+        yaxis_title='Market Potential ($B)',
+        barmode='group',
+        height=400
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Timeline Gantt Chart
+    st.subheader("Development Timeline")
+    df['start'] = datetime.now()
+    # Convert timeline months into days because pandas removed unit='M'
+    df['end'] = df['start'] + pd.to_timedelta(df['timeline_months'] * 30, unit='D')
+
+    from dateutil.relativedelta import relativedelta
+
+    df['end'] = df['start'].apply(lambda d: d + relativedelta(months=+1))
+
+    fig = px.timeline(df, x_start='start', x_end='end', y='drug_name',
+                      color='stage', title='Drug Development Timeline')
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Detailed table
+    st.subheader("Pipeline Details")
+    paged_table('pipeline_grid', select('drug_pipeline'), default_sort='market_potential')
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("📥 Export CSV", csv_download(query="SELECT * FROM drug_pipeline"),
+                           "drug_pipeline.csv", "text/csv", use_container_width=True)
+    with col2:
+        st.download_button("📄 Export PDF",
+                           pdf_download("Drug Pipeline Report", query="SELECT * FROM drug_pipeline"),
+                           "drug_pipeline.pdf", "application/pdf", use_container_width=True)
@@ -0,0 +1,95 @@
+"""
+Financial Reporting System: revenue, expenses, profit and budget variance
+"""
+
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from gsk import charts, finance
+
+
+def render():
+    st.header("💰 Financial Reporting System")
+    st.subheader("Power BI + SQL + Python Automation")
+
+    dims = finance.ledger_dimensions()
+    if dims is None:
+        st.info("No rows in financial_ledger yet. Load GL lines with "
+                "`python -m gsk.ingest financial_ledger <file>`.")
+        return
+    years = [str(y) for y in range(int(dims['last_month'][:4]), int(dims['first_month'][:4]) - 1, -1)]
+
+    # Filters; a full selection is sent as "unfiltered"
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        year = st.selectbox("Fiscal Year", years)
+    with col2:
+        categories = st.multiselect("Category", dims['categories'], default=dims['categories'])
+    with col3:
+        cost_centers = st.multiselect("Cost Center", dims['cost_centers'], default=dims['cost_centers'])
+
+    # Aggregated in SQLite; only one row per month and per category comes back
+    report = finance.financial_report(
+        f"{year}-01", f"{year}-12",
+        None if len(categories) == len(dims['categories']) else categories,
+        None if len(cost_centers) == len(dims['cost_centers']) else cost_centers,
+    )
+    kpis, monthly_summary, by_category = report['kpis'], report['monthly'], report['by_category']
+
+    # KPIs
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Revenue", f"${kpis['total_revenue']:,.1f}M")
+    with col2:
+        st.metric("Total Expenses", f"${kpis['total_expenses']:,.1f}M")
+    with col3:
+        st.metric("Net Profit", f"${kpis['net_profit']:,.1f}M")
+    with col4:
+        st.metric("Profit Margin", f"{kpis['margin']:.1f}%")
+
+    # Revenue vs Expenses over time
+    fig = go.Figure()
+    fig.add_trace(charts.trace(monthly_summary['month'], monthly_summary['revenue'],
+                               mode='lines+markers', name='Revenue', line=dict(color='green')))
+    fig.add_trace(charts.trace(monthly_summary['month'], monthly_summary['expenses'],
+                               mode='lines+markers', name='Expenses', line=dict(color='red')))
+    fig.add_trace(charts.trace(monthly_summary['month'], monthly_summary['profit'],
+                               mode='lines+markers', name='Profit', line=dict(color='blue')))
+
+    fig.update_layout(title='Financial Performance Trend', xaxis_title='Month',
+                      yaxis_title='Amount ($M)', height=400)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Category breakdown
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.pie(by_category, names='category', values='expenses',
+                     title='Expenses by Category')
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        fig = px.bar(by_category, x='category', y='profit',
+                     title='Profit by Category', color='profit')
+        st.plotly_chart(fig, use_container_width=True)
+
+    # Budget variance
+    st.subheader("Budget Variance Analysis")
+    variance_summary = by_category.assign(
+        status=by_category['budget_variance'].gt(0).map({True: 'Over Budget', False: 'Under Budget'}))
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.bar(variance_summary, x='category', y='budget_variance',
+                     color='status', title='Budget Variance by Category',
+                     color_discrete_map={'Over Budget': 'red', 'Under Budget': 'green'})
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        fig = go.Figure()
+        fig.add_trace(go.Bar(x=monthly_summary['month'], y=monthly_summary['budget_variance'],
+                             name='Monthly Variance', marker_color='lightgray'))
+        fig.add_trace(charts.trace(monthly_summary['month'], monthly_summary['ytd_variance'],
+                                   mode='lines+markers', name='Year to Date', line=dict(color='red')))
+        fig.update_layout(title='Budget Variance Year to Date', xaxis_title='Month',
+                          yaxis_title='Over (+) / Under (-) Budget ($M)')
+        st.plotly_chart(fig, use_container_width=True)
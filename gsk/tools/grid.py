@@ -0,0 +1,108 @@
+"""
+Paged grids: one page of rows per rerun instead of the whole result
+
+``st.dataframe`` serializes every row it is given to Arrow and sends it to
+the browser on each rerun. ``paged_table`` fetches one page from SQLite by
+keyset pagination (gsk.paging). It can sort by any indexed column and shows
+the total from a cached COUNT query. ``paged_frame`` pages a result that is
+already in memory, such as a governed Custom Query result.
+
+Both keep their position in ``st.session_state[key]``. For SQL sources this
+is the stack of page cursors, so "Previous" is as cheap as "Next". The
+position resets to the first page when the filters, sort or page size
+change.
+"""
+
+import streamlit as st
+
+from gsk import paging
+
+PAGE_SIZES = (25, 50, 100, 250)
+
+
+def _position(key, signature):
+    """The grid's saved state, reset when ``signature`` (filters, sort, size) changes"""
+    state = st.session_state.get(key)
+    if state is None or state['signature'] != signature:
+        state = st.session_state[key] = {'signature': signature, 'cursors': [None]}
+    return state
+
+
+def _next(key, cursor):
+    if cursor is not None:
+        st.session_state[key]['cursors'].append(cursor)
+
+
+def _previous(key):
+    cursors = st.session_state[key]['cursors']
+    if len(cursors) > 1:
+        cursors.pop()
+
+
+def _first(key):
+    del st.session_state[key]['cursors'][1:]
+
+
+def _controls(key, columns, default):
+    """Sort column, direction and page size pickers"""
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        sort = st.selectbox("Sort by", columns, index=columns.index(default) if default in columns else 0, key=f"{key}_sort")
+    with col2:
+        descending = st.toggle("Descending", key=f"{key}_desc")
+    with col3:
+        size = st.selectbox("Rows per page", PAGE_SIZES, index=PAGE_SIZES.index(paging.PAGE_ROWS),
+                            key=f"{key}_size")
+    return sort, descending, size
+
+
+def _navigation(key, state, first_row, shown, total, cursor):
+    """First / Previous / Next buttons and the "Rows a-b of n" caption"""
+    on_first = len(state['cursors']) == 1
+    col1, col2, col3, col4 = st.columns([1, 1, 1, 3])
+    with col1:
+        st.button("⏮ First", key=f"{key}_first", on_click=_first, args=(key,), disabled=on_first)
+    with col2:
+        st.button("◀ Previous", key=f"{key}_prev", on_click=_previous, args=(key,), disabled=on_first)
+    with col3:
+        st.button("Next ▶", key=f"{key}_next", on_click=_next, args=(key, cursor), disabled=cursor is None)
+    with col4:
+        if shown:
+            st.caption(f"Rows {first_row + 1:,}–{first_row + shown:,} of {total:,}")
+        else:
+            st.caption(f"No rows of {total:,}")
+
+
+def paged_table(key, select, default_sort=None):
+    """Grid over a gsk.query select, fetched a page at a time from SQLite"""
+    columns = paging.sortable_columns(select)
+    sort, descending, size = _controls(key, columns, default_sort or columns[0])
+    state = _position(key, (select.sql(), sort, descending, size))
+    frame, cursor = paging.page(select, sort, descending, state['cursors'][-1], size)
+    st.dataframe(frame, use_container_width=True, hide_index=True)
+    first_row = (len(state['cursors']) - 1) * size
+    _navigation(key, state, first_row, len(frame), paging.count(select), cursor)
+    return frame
+
+
+def paged_frame(key, df, default_sort=None, source=None):
+    """Grid over an in-memory DataFrame, sent to the browser a page at a time
+
+    ``source`` (e.g. the query text) identifies the result across reruns, so
+    a different result starts again at the first page.
+    """
+    columns = list(df.columns)
+    if not columns:
+        st.dataframe(df, use_container_width=True)
+        return df
+    sort, descending, size = _controls(key, columns, default_sort or columns[0])
+    state = _position(key, (source, tuple(columns), len(df), sort, descending, size))
+    first_row = (len(state['cursors']) - 1) * size
+    # NULLs first ascending and last descending, as SQLite orders them
+    ordered = df.sort_values(sort, ascending=not descending, kind='stable',
+                             na_position='last' if descending else 'first')
+    frame = ordered.iloc[first_row:first_row + size]
+    st.dataframe(frame, use_container_width=True, hide_index=True)
+    more = first_row + size < len(df)
+    _navigation(key, state, first_row, len(frame), len(df), first_row + size if more else None)
+    return frame
@@ -0,0 +1,100 @@
+"""
+Home: platform overview, usage highlights and a quick-start guide
+
+The landing page of the suite. Usage comes from the trigger-maintained
+counters (gsk.telemetry), so the page costs a few indexed reads.
+"""
+
+import streamlit as st
+
+from gsk import tools
+from gsk.db import read_sql
+from gsk.telemetry import popular_tools
+
+
+def _open(label):
+    """Button callback: select ``label`` in the sidebar before the next run draws it"""
+    st.session_state.tool = label
+
+
+def _usage(title, popular):
+    st.markdown(f"**{title}:**")
+    st.markdown("\n".join(f"- {row.tool_name}: {row.uses:,} uses" for row in popular.itertuples()))
+
+
+def render():
+    st.markdown("""
+    <div style='text-align: center; padding: 1rem 0;'>
+        <h2 style='color: rgba(255,255,255,0.9); font-weight: 400; font-size: 1.5rem;'>Integrated Analytics Platform</h2>
+        <p style='color: rgba(255,255,255,0.8); font-size: 1.1rem;'>Python • Streamlit • MATLAB • SQL • Tableau • Power BI</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    tables = read_sql("SELECT COUNT(*) AS n FROM sqlite_master "
+                      "WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")['n'].iloc[0]
+    boxes = [(len(tools.TOOLS) - 1, "Enterprise Tools"), (tables, "Database Tables"),
+             ("Real-time", "Analytics"), ("24/7", "Availability")]
+    for col, (value, label) in zip(st.columns(4), boxes):
+        with col:
+            st.markdown(f"<div class='stats-box'><h2>{value}</h2><p>{label}</p></div>", unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    col_left, col_right = st.columns([2, 1])
+    with col_left:
+        st.markdown("""
+        <div style='background: rgba(255,255,255,0.1); padding: 2rem; border-radius: 15px; backdrop-filter: blur(10px);'>
+            <h2 style='margin-top: 0;'>🌟 Platform Overview</h2>
+            <p style='font-size: 1.1rem; line-height: 1.8; color: rgba(255,255,255,0.9);'>
+                Welcome to the <strong>GSK Enterprise Tools Suite</strong> – a comprehensive analytics platform
+                for pharmaceutical R&D. Integrates clinical trials, drug development, quality control, and financial analytics.
+            </p>
+            <h3>🎯 Key Capabilities</h3>
+            <ul style='font-size: 1rem; line-height: 2; color: rgba(255,255,255,0.9);'>
+                <li><strong>Clinical Data Analytics:</strong> SQL-powered trial management</li>
+                <li><strong>Drug Pipeline Tracking:</strong> Real-time stage monitoring</li>
+                <li><strong>Quality Control:</strong> MATLAB statistical process control</li>
+                <li><strong>Predictive Analytics:</strong> Monte Carlo trial simulations</li>
+                <li><strong>Financial Intelligence:</strong> Automated budget analysis</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col_right:
+        st.markdown("### 📊 Quick Stats")
+        # Served from the trigger-maintained usage counters
+        popular = popular_tools(3)
+        if popular.empty:
+            st.info("No usage data yet")
+        else:
+            _usage("🔥 Most Used Tools", popular)
+            weekly = popular_tools(3, days=7)
+            if not weekly.empty:
+                _usage("📈 Popular This Week", weekly)
+        st.markdown("""
+        ### ✨ Features
+        - ✅ Real-time Processing
+        - ✅ Interactive Dashboards
+        - ✅ SQL Query Builder
+        - ✅ Export CSV/PDF
+        - ✅ Predictive Analytics
+        """)
+
+    with st.expander("📖 Quick Start Guide", expanded=True):
+        st.markdown("""
+        ### How to Use This Platform
+        1. **Navigate:** Select tools from the sidebar
+        2. **Analyze:** View real-time analytics and visualizations
+        3. **Export:** Download results in CSV or PDF
+        4. **Track:** Tool visits are counted for the usage highlights above
+
+        💡 **Pro Tip:** Start with Clinical Data Analytics!
+        """)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button("🚀 Explore Tools", use_container_width=True, type="primary",
+                  on_click=_open, args=("🔬 Clinical Data Analytics",))
+    with col2:
+        st.button("📊 View Analytics", use_container_width=True,
+                  on_click=_open, args=("📊 Sales Performance",))
@@ -0,0 +1,65 @@
+"""
+HR Analytics Suite: workforce distribution, performance and satisfaction
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from gsk import charts, trends
+from gsk.cache import load_table
+
+
+def render():
+    st.header("👥 HR Analytics Suite")
+    st.subheader("Tableau Style Workforce Analytics")
+
+    # Shared cache; no SQL unless the table changed
+    hr_data = load_table('employees')
+    if hr_data.empty:
+        st.info("No rows in employees yet. Load them with `python -m gsk.ingest employees <file>`.")
+        return
+
+    # KPIs
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Employees", len(hr_data))
+    with col2:
+        st.metric("Avg Tenure", f"{hr_data['tenure_years'].mean():.1f} years")
+    with col3:
+        st.metric("Avg Performance", f"{hr_data['performance_score'].mean():.2f}/5.0")
+    with col4:
+        st.metric("Avg Satisfaction", f"{hr_data['satisfaction_score'].mean():.2f}/5.0")
+
+    # Department distribution
+    dept_counts = hr_data['department'].value_counts().reset_index()
+    dept_counts.columns = ['department', 'count']
+    fig = px.bar(dept_counts, x='department', y='count',
+                 title='Employee Distribution by Department', color='count')
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Performance analysis
+    col1, col2 = st.columns(2)
+    with col1:
+        dept_performance = hr_data.groupby('department')['performance_score'].mean().reset_index()
+        fig = px.bar(dept_performance, x='department', y='performance_score',
+                     title='Average Performance by Department', color='performance_score')
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        # Per-department fits, cached until the employees table changes
+        fits = trends.table_trendlines('employees', 'tenure_years', 'performance_score', 'department')
+        fig = charts.scatter(hr_data, x='tenure_years', y='performance_score',
+                             color='department', title='Tenure vs Performance',
+                             trendline=fits)
+        st.plotly_chart(fig, use_container_width=True)
+        if charts.caption(fig):
+            st.caption(charts.caption(fig))
+
+    # Retention analysis
+    st.subheader("Retention & Satisfaction Analysis")
+    fig = charts.scatter(hr_data, x='satisfaction_score', y='performance_score',
+                         size='training_hours', color='department',
+                         title='Employee Satisfaction vs Performance (Size = Training Hours)')
+    st.plotly_chart(fig, use_container_width=True)
+    if charts.caption(fig):
+        st.caption(charts.caption(fig))
@@ -0,0 +1,92 @@
+"""
+Lab Equipment Utilization: utilization and predictive maintenance risk
+"""
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from gsk import charts, maintenance
+from gsk.tools.grid import paged_frame
+
+RISK_COLORS = {'Low': 'green', 'Medium': 'orange', 'High': 'red'}
+WATCHLIST = 50  # riskiest instruments offered for drill-down
+
+
+def render():
+    st.header("⚙️ Lab Equipment Utilization")
+    st.subheader("Python + MATLAB Predictive Analytics")
+
+    # Precomputed scores; only readings that arrived since the last refresh are folded in
+    equipment_data = maintenance.fleet_risk()
+    if equipment_data.empty:
+        st.info("No equipment telemetry yet. Load it with "
+                "`python -m gsk.ingest equipment_telemetry <file>`.")
+        return
+
+    # KPIs
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Equipment", f"{len(equipment_data):,}")
+    with col2:
+        st.metric("Avg Utilization", f"{equipment_data['utilization'].mean():.1f}%")
+    with col3:
+        st.metric("Avg Failure Risk", f"{equipment_data['risk_score'].mean():.1f}")
+    with col4:
+        due = equipment_data['days_since_maintenance'] >= equipment_data['maintenance_interval_days'] - 7
+        st.metric("Maintenance Due", f"{int(due.sum()):,}")
+    st.caption(f"Scores as of {equipment_data['last_reading_date'].max()}, from "
+               f"{int(equipment_data['readings'].sum()):,} telemetry readings")
+
+    # MATLAB-style Predictive Analysis
+    st.subheader("Predictive Maintenance (MATLAB Algorithm)")
+    fig = charts.scatter(equipment_data, x='utilization', y='risk_score', color='risk_level',
+                         title='Failure Risk vs Utilization (Predictive Model)',
+                         category_orders={'risk_level': list(RISK_COLORS)},
+                         color_discrete_map=RISK_COLORS,
+                         labels={'utilization': 'Utilization (30-day EWMA, %)', 'risk_score': 'Failure Risk',
+                                 'risk_level': 'Risk'})
+    fig.update_layout(height=400)
+    st.plotly_chart(fig, use_container_width=True)
+    if charts.caption(fig):
+        st.caption(charts.caption(fig))
+
+    # Equipment by location
+    col1, col2 = st.columns(2)
+    with col1:
+        location_util = equipment_data.groupby('location')['utilization'].mean().reset_index()
+        fig = px.bar(location_util, x='location', y='utilization',
+                     title='Average Utilization by Lab', color='utilization')
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        risk_dist = equipment_data['risk_level'].value_counts().reset_index()
+        risk_dist.columns = ['risk', 'count']
+        fig = px.pie(risk_dist, names='risk', values='count',
+                     title='Equipment Risk Distribution',
+                     color='risk',
+                     color_discrete_map=RISK_COLORS)
+        st.plotly_chart(fig, use_container_width=True)
+
+    # Telemetry behind one of the riskiest scores
+    st.subheader("Highest Risk Equipment")
+    watchlist = equipment_data.head(WATCHLIST)
+    labels = watchlist['equipment_name'] + " — risk " + watchlist['risk_score'].round(1).astype(str)
+    choice = st.selectbox("Instrument", labels.tolist())
+    equipment_id = watchlist['equipment_id'].iloc[labels.tolist().index(choice)]
+    history = maintenance.equipment_history(equipment_id)
+    dates = pd.to_datetime(history['reading_date'])
+    fig = go.Figure()
+    fig.add_trace(charts.trace(dates, history['utilization'], name='Utilization (%)'))
+    fig.add_trace(go.Bar(x=dates, y=history['error_count'], name='Errors', yaxis='y2', opacity=0.4))
+    for day in dates[history['maintenance'] != 0]:
+        fig.add_vline(x=day, line_dash='dot', line_color='green')
+    fig.update_layout(title='Daily Telemetry (dotted lines: maintenance)', height=350,
+                      yaxis=dict(title='Utilization (%)'),
+                      yaxis2=dict(title='Errors', overlaying='y', side='right'))
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Equipment details
+    st.subheader("Equipment Status")
+    paged_frame('equipment_grid', equipment_data)
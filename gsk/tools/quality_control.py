@@ -0,0 +1,127 @@
+"""
+Quality Control Monitor: control charts and rule alerts from the SPC engine (gsk.spc)
+"""
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from gsk import charts, spc
+from gsk.query import select
+from gsk.tools.grid import paged_table
+
+
+def render():
+    st.header("🛡️ Quality Control Monitor")
+    st.subheader("Python + MATLAB Integration for Batch Analysis")
+
+    # Running per-product/site statistics maintained by the SPC engine
+    streams = spc.stream_summary()
+    if streams.empty:
+        st.info("No rows in quality_control yet. Load results with `python -m gsk.ingest quality_control <file>`.")
+        return
+    total = streams['n'].sum()
+
+    # KPIs
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Batches", f"{total:,}")
+    with col2:
+        st.metric("Pass Rate", f"{streams['passed'].sum() / total * 100:.1f}%")
+    with col3:
+        st.metric("Avg Compliance", f"{(streams['n'] * streams['mean']).sum() / total:.1f}%")
+    with col4:
+        st.metric("Manufacturing Sites", streams['site'].nunique())
+
+    # MATLAB-style Statistical Analysis
+    st.subheader("Statistical Process Control (MATLAB Algorithm)")
+
+    labels = [f"{p} @ {s}" for p, s in zip(streams['product'], streams['site'])]
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        choice = st.selectbox("Product @ Site", range(len(labels)), format_func=labels.__getitem__)
+    with col2:
+        window = st.selectbox("Batches", [200, 2_000, 20_000, "All"])
+    stream = streams.iloc[choice]
+    limit = int(stream['n']) if window == "All" else window
+    points = spc.stream_points(stream['product'], stream['site'], limit=limit)
+    flagged = points[points['rules'].notna()]
+
+    # Plotted by load sequence so long windows can be LTTB-downsampled; violations are always kept
+    fig = go.Figure()
+    fig.add_trace(charts.trace(
+        points['seq'],
+        points['compliance_score'],
+        keep=points['rules'].notna(),
+        mode='lines+markers',
+        name='Compliance Score',
+        line=dict(color='blue'),
+        text=points['batch_id'],
+        hoverinfo='y+text'
+    ))
+    fig.add_trace(charts.trace(
+        flagged['seq'],
+        flagged['compliance_score'],
+        max_points=len(flagged),
+        mode='markers',
+        name='Rule Violation',
+        marker=dict(color='red', size=10, symbol='x'),
+        text=flagged['batch_id'] + ': rules ' + flagged['rules'],
+        hoverinfo='y+text'
+    ))
+    fig.add_hline(y=stream['mean'], line_dash="dash", line_color="green", annotation_text="Mean")
+    if pd.notna(stream['std']):
+        fig.add_hline(y=stream['ucl'], line_dash="dash", line_color="red", annotation_text="UCL")
+        fig.add_hline(y=stream['lcl'], line_dash="dash", line_color="red", annotation_text="LCL")
+
+    fig.update_layout(
+        title=f'Quality Control Chart: last {len(points)} of {stream["n"]:,} batches',
+        xaxis_title='Batch (load order)',
+        yaxis_title='Compliance Score',
+        height=400
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    if len(points) > charts.LINE_POINTS:
+        st.caption(f"Line downsampled (LTTB) to about {charts.LINE_POINTS:,} of {len(points):,} batches; "
+                   "every rule violation is drawn")
+
+    # Every batch of the selected stream, paged from SQLite
+    with st.expander(f"Batch records: {labels[choice]}"):
+        batches = (select('quality_control')
+                   .where('product', '=', stream['product'])
+                   .where('site', '=', stream['site']))
+        paged_table('qc_batch_grid', batches, default_sort='test_date')
+
+    # Batch results by site
+    col1, col2 = st.columns(2)
+    with col1:
+        site_results = (streams.groupby('site')[['passed', 'failed']].sum()
+                        .rename(columns={'passed': 'Pass', 'failed': 'Fail'})
+                        .reset_index()
+                        .melt(id_vars='site', var_name='test_result', value_name='count'))
+        fig = px.bar(site_results, x='site', y='count', color='test_result',
+                     title='QC Results by Manufacturing Site', barmode='group')
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        weighted = streams.assign(score_sum=streams['n'] * streams['mean']).groupby('product')
+        product_compliance = (weighted['score_sum'].sum() / weighted['n'].sum()).rename('compliance_score').reset_index()
+        fig = px.bar(product_compliance, x='product', y='compliance_score',
+                     title='Average Compliance Score by Product', color='compliance_score')
+        st.plotly_chart(fig, use_container_width=True)
+
+    # Alert system
+    st.subheader("Quality Alerts")
+    failed = streams['failed'].sum()
+    counts = spc.alert_counts()
+    if failed or not counts.empty:
+        st.warning(f"⚠️ {failed:,} failed batches and {counts['alerts'].sum():,} control-rule violations "
+                   "require attention!")
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            st.dataframe(counts[['rule', 'description', 'alerts']], hide_index=True, use_container_width=True)
+        with col2:
+            st.dataframe(spc.recent_alerts(100), hide_index=True, use_container_width=True)
+    else:
+        st.success("✅ All batches passed quality control!")
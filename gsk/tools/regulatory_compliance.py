@@ -0,0 +1,67 @@
+"""
+Regulatory Compliance Tracker: submission status across agencies
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+
+
+def render():
+    st.header("📋 Regulatory Compliance Tracker")
+    st.subheader("Power BI Style Dashboard for Global Compliance")
+
+    # Sample compliance data
+    compliance_data = pd.DataFrame({
+        'submission_id': [f'SUB{i:04d}' for i in range(1, 26)],
+        'drug_name': np.random.choice(['Respiratory-X', 'Immuno-Plus', 'Onco-Target'], 25),
+        'region': np.random.choice(['FDA (US)', 'EMA (EU)', 'PMDA (Japan)', 'CDSCO (India)', 'NMPA (China)'], 25),
+        'submission_type': np.random.choice(['NDA', 'BLA', 'IND', 'ANDA'], 25),
+        'status': np.random.choice(['Submitted', 'Under Review', 'Approved', 'Additional Info Required'], 25),
+        'submission_date': pd.date_range(start='2024-01-01', periods=25, freq='2W'),
+        'target_approval': pd.date_range(start='2024-06-01', periods=25, freq='2W')
+    })
+
+    # KPIs
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Submissions", len(compliance_data))
+    with col2:
+        approved = len(compliance_data[compliance_data['status'] == 'Approved'])
+        st.metric("Approved", approved)
+    with col3:
+        under_review = len(compliance_data[compliance_data['status'] == 'Under Review'])
+        st.metric("Under Review", under_review)
+    with col4:
+        st.metric("Regions", compliance_data['region'].nunique())
+
+    # Status overview
+    status_counts = compliance_data['status'].value_counts().reset_index()
+    status_counts.columns = ['status', 'count']
+    fig = px.pie(status_counts, names='status', values='count',
+                 title='Submission Status Overview', hole=0.4)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Regional distribution
+    col1, col2 = st.columns(2)
+    with col1:
+        region_counts = compliance_data['region'].value_counts().reset_index()
+        region_counts.columns = ['region', 'count']
+        fig = px.bar(region_counts, x='region', y='count',
+                     title='Submissions by Region', color='count')
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        drug_counts = compliance_data['drug_name'].value_counts().reset_index()
+        drug_counts.columns = ['drug', 'count']
+        fig = px.bar(drug_counts, x='drug', y='count',
+                     title='Submissions by Drug', color='count')
+        st.plotly_chart(fig, use_container_width=True)
+
+    # Upcoming deadlines
+    st.subheader("📅 Upcoming Approval Targets")
+    upcoming = compliance_data[compliance_data['status'] == 'Under Review'].sort_values('target_approval')
+    st.dataframe(upcoming[['submission_id', 'drug_name', 'region', 'target_approval']],
+                 use_container_width=True)
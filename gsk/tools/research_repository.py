@@ -0,0 +1,92 @@
+"""
+Research Data Repository: study counts and FTS5 full-text search (gsk.research)
+"""
+
+from html import escape
+
+import plotly.express as px
+import streamlit as st
+
+from gsk import research
+from gsk.export import csv_download, pdf_download
+from gsk.tools.grid import paged_frame
+
+
+def render():
+    st.header("🔍 Research Data Repository")
+    st.subheader("Streamlit + SQL + Tableau Integration")
+
+    st.info("📚 Centralized repository for research data with advanced search capabilities")
+
+    # Search interface
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        search_query = st.text_input("Search research data", placeholder="Enter keywords...")
+    with col2:
+        search_type = st.selectbox("Type", ["All"] + research.STUDY_TYPES)
+    study_type = None if search_type == "All" else search_type
+
+    # Trigger-maintained counts per type, area and status
+    counts = research.study_counts(study_type)
+    if counts.empty and study_type is None:
+        st.info("No research studies yet. Load them with `python -m gsk.ingest research_studies <file>`.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Studies", f"{counts['studies'].sum():,}")
+    with col2:
+        st.metric("Active Studies", f"{counts.loc[counts['status'] == 'Active', 'studies'].sum():,}")
+    with col3:
+        st.metric("Total Citations", f"{counts['citations'].sum():,}")
+
+    # Visualizations
+    col1, col2 = st.columns(2)
+    with col1:
+        type_dist = counts.groupby('study_type', as_index=False)['studies'].sum()
+        fig = px.pie(type_dist, names='study_type', values='studies', title='Research by Type')
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        area_dist = counts.groupby('therapeutic_area', as_index=False)['studies'].sum()
+        fig = px.bar(area_dist, x='therapeutic_area', y='studies', title='Studies by Therapeutic Area')
+        st.plotly_chart(fig, use_container_width=True)
+
+    # Full-text search (FTS5, BM25 ranking)
+    st.subheader("Research Database")
+    found = research.search_studies(search_query, study_type, limit=50)
+    results = found['results']
+    if results.empty:
+        st.warning("No studies match the search.")
+        return
+    if found['ranked_by'] == 'published':
+        st.caption("Most recently published studies")
+    else:
+        matches = f"More than {research.RANK_WINDOW:,}" if found['capped'] else f"{found['matches']:,}"
+        if found['ranked_by'] == 'recency':
+            order = "newest first (every search word is very common)"
+        elif found['capped']:
+            order = f"best matches among the newest {research.RANK_WINDOW:,}"
+        else:
+            order = "ranked by relevance"
+        st.caption(f"{matches} matching studies, {order}")
+    # Study text comes from ingested files: escape it before adding the <small> markup.
+    # The ``**`` highlight markers survive escaping and render as bold.
+    for row in results.head(5).itertuples():
+        st.markdown(f"**{escape(str(row.study_id))}** · {escape(str(row.title))}  \n"
+                    f"<small>{escape(str(row.study_type))} · {escape(str(row.therapeutic_area))} · "
+                    f"{escape(str(row.published))} · {row.citations} citations</small>  \n"
+                    f"{escape(str(row.snippet))}", unsafe_allow_html=True)
+    plain = results.assign(title=results['title'].str.replace('**', '', regex=False),
+                           snippet=results['snippet'].str.replace('**', '', regex=False))
+    paged_frame('research_grid', plain, source=(search_query, study_type))
+
+    # Export options
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("📥 Export CSV", csv_download(df=plain), "research_studies.csv", "text/csv",
+                           use_container_width=True)
+    with col2:
+        st.download_button("📄 Export PDF",
+                           pdf_download("Research Search Results", df=plain.drop(columns='snippet')),
+                           "research_studies.pdf", "application/pdf", use_container_width=True)
@@ -0,0 +1,70 @@
+"""
+Sales Performance dashboard, answered from the incrementally refreshed sales cube (gsk.sales)
+"""
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from gsk import charts
+from gsk.sales import sales_dimensions, sales_rollup, summarize
+
+
+def render():
+    st.header("📊 Sales Performance Dashboard")
+    st.subheader("Tableau Style Analytics with SQL")
+
+    dims = sales_dimensions()
+    if dims.empty:
+        st.info("No rows in sales_data yet. Load sales with `python -m gsk.ingest sales_data <file>`.")
+        return
+    products = sorted(dims['product'].unique())
+    regions = sorted(dims['region'].unique())
+    first_date = pd.to_datetime(dims['first_date'].min()).date()
+    last_date = pd.to_datetime(dims['last_date'].max()).date()
+
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        selected_product = st.multiselect("Product", products, default=products)
+    with col2:
+        selected_region = st.multiselect("Region", regions, default=regions)
+    with col3:
+        date_range = st.date_input("Date Range", [first_date, last_date],
+                                   min_value=first_date, max_value=last_date)
+    if len(date_range) == 2:
+        start, end = date_range
+    else:  # second date not picked yet
+        start, end = (date_range[0] if date_range else first_date), last_date
+
+    # Answered from the product x region x month cube, not the raw sales rows
+    report = summarize(sales_rollup(selected_product, selected_region, start, end))
+    kpis = report['kpis']
+
+    # KPIs
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Revenue", f"${kpis['total_revenue'] / 1e6:.2f}M")
+    with col2:
+        st.metric("Total Units", f"{kpis['total_units']:,}")
+    with col3:
+        st.metric("Avg Deal Size", f"${kpis['avg_deal_size']:,.0f}")
+    with col4:
+        st.metric("Products Sold", kpis['products_sold'])
+
+    # Revenue by month
+    fig = charts.line(report['monthly'], x='month', y='revenue',
+                      title='Revenue Trend', markers=True)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Regional breakdown
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.bar(report['by_region'], x='region', y='revenue',
+                     title='Revenue by Region', color='region')
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        fig = px.pie(report['by_product'], names='product', values='revenue',
+                     title='Revenue by Product')
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,96 @@
+"""
+Clinical Trial Simulator: vectorized Monte Carlo outcomes (gsk.simulation)
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from gsk.simulation import PARALLEL_THRESHOLD, run_trials
+
+
+def render():
+    st.header("🧪 Clinical Trial Simulator")
+    st.subheader("MATLAB + Python + Streamlit - Monte Carlo Simulation")
+
+    st.info("Advanced simulation using MATLAB-style algorithms for trial outcome prediction")
+
+    # Simulation parameters
+    col1, col2 = st.columns(2)
+    with col1:
+        num_patients = st.slider("Number of Patients", 100, 5000, 1000, 100)
+        success_rate = st.slider("Expected Success Rate (%)", 50, 95, 75)
+        dropout_rate = st.slider("Dropout Rate (%)", 5, 30, 15)
+
+    with col2:
+        num_simulations = st.number_input("Number of Simulations", 100, 100_000_000, 1000, 1000,
+                                          help=f"From {PARALLEL_THRESHOLD:,} simulations the "
+                                               f"work is spread across CPU cores")
+        confidence_level = st.slider("Confidence Level (%)", 90, 99, 95)
+        trial_duration = st.slider("Trial Duration (months)", 6, 36, 18)
+        seed = st.number_input("Random Seed", 0, 2 ** 32 - 1, None, placeholder="Random",
+                               help="The same seed reproduces the same results")
+
+    if st.button("🚀 Run Monte Carlo Simulation", type="primary"):
+        with st.spinner("Running MATLAB-style Monte Carlo simulation..."):
+            # Monte Carlo simulation in vectorized chunks, across processes for large runs
+            sim = run_trials(num_patients, success_rate, dropout_rate, num_simulations, seed=seed)
+            summary = sim.summary(confidence_level)
+            lower_ci, upper_ci = summary['ci_lower'], summary['ci_upper']
+
+            # Results
+            st.success("✅ Simulation Complete!")
+
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Avg Completions", f"{summary['mean_completed']:.0f}")
+            with col2:
+                st.metric("Avg Success Rate", f"{summary['mean_success_rate']:.1f}%")
+            with col3:
+                st.metric(f"{confidence_level}% CI Lower", f"{lower_ci:.1f}%")
+            with col4:
+                st.metric(f"{confidence_level}% CI Upper", f"{upper_ci:.1f}%")
+
+            # Distribution plot (pre-binned; no per-simulation points sent to the browser)
+            frequencies, edges = sim.histogram(bins=50)
+            fig = go.Figure()
+            fig.add_trace(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=frequencies,
+                                 width=np.diff(edges), name='Success Rate Distribution'))
+            fig.add_vline(x=summary['mean_success_rate'], line_dash="dash",
+                          line_color="red", annotation_text="Mean")
+            fig.add_vline(x=lower_ci, line_dash="dash", line_color="green",
+                          annotation_text=f"{confidence_level}% CI")
+            fig.add_vline(x=upper_ci, line_dash="dash", line_color="green")
+
+            fig.update_layout(title='Success Rate Distribution (Monte Carlo)',
+                              xaxis_title='Success Rate (%)',
+                              yaxis_title='Frequency',
+                              height=400)
+            st.plotly_chart(fig, use_container_width=True)
+
+            # Risk analysis
+            st.subheader("Risk Analysis")
+            prob_below_70 = summary['prob_below_70']
+            prob_above_80 = summary['prob_above_80']
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Probability < 70% Success", f"{prob_below_70:.1f}%")
+            with col2:
+                st.metric("Probability > 80% Success", f"{prob_above_80:.1f}%")
+
+            # Timeline projection
+            st.subheader("Timeline Projection")
+            timeline_data = pd.DataFrame({
+                'month': range(1, trial_duration + 1),
+                'enrollment': [int(num_patients * (i / trial_duration)) for i in range(1, trial_duration + 1)],
+                'projected_completions': [int(num_patients * (1 - dropout_rate / 100) * (i / trial_duration))
+                                          for i in range(1, trial_duration + 1)]
+            })
+
+            fig = px.line(timeline_data, x='month', y=['enrollment', 'projected_completions'],
+                          title='Enrollment & Completion Timeline',
+                          labels={'value': 'Patients', 'variable': 'Metric'})
+            st.plotly_chart(fig, use_container_width=True)